@@ -107,6 +107,19 @@ def test_autobatch():
     check_train_batch_size(YOLO(MODEL).model.cuda(), imgsz=128, amp=True)
 
 
+@pytest.mark.skipif(not CUDA_IS_AVAILABLE, reason="CUDA is not available")
+def test_predict_prefetch_results():
+    """Test that prefetched results stay on the GPU and match the blocking device to host copies."""
+    model = YOLO(MODEL)
+    results = model.predict([SOURCE, SOURCE], imgsz=160, device=0)
+    prefetched = model.predict([SOURCE, SOURCE], imgsz=160, device=0, prefetch_results=True)
+    for a, b in zip(results, prefetched):
+        assert b.boxes.data.is_cuda
+        assert b.boxes.cpu().data.is_pinned()
+        assert torch.equal(a.boxes.cpu().data, b.boxes.cpu().data)
+        assert a.summary() == b.summary()
+
+
 @pytest.mark.slow
 @pytest.mark.skipif(not CUDA_IS_AVAILABLE, reason="CUDA is not available")
 def test_utils_benchmarks():
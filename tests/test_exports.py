@@ -6,6 +6,7 @@ from itertools import product
 from pathlib import Path
 
 import pytest
+import torch
 
 from tests import MODEL, SOURCE
 from ultralytics import YOLO
@@ -33,6 +34,21 @@ def test_export_onnx():
     YOLO(file)(SOURCE, imgsz=32)  # exported model inference
 
 
+def test_export_onnx_io_binding():
+    """Test that ONNX Runtime IO binding matches session.run for several dynamic input shapes."""
+    from ultralytics.nn.autobackend import AutoBackend
+
+    file = YOLO(MODEL).export(format="onnx", dynamic=True, imgsz=32)
+    model = AutoBackend(file, session_options={"intra_op_num_threads": 2, "graph_optimization_level": "basic"})
+    for shape in [(1, 3, 32, 32), (2, 3, 64, 32), (1, 3, 32, 32)]:
+        im = torch.rand(shape)
+        y = model(im)
+        y = y[0] if isinstance(y, list) else y
+        ref = model.session.run(None, {model.session.get_inputs()[0].name: im.numpy()})[0]
+        assert torch.allclose(y, torch.from_numpy(ref), atol=1e-4)
+    assert len(model.io_binding.cache) == 2
+
+
 @pytest.mark.skipif(not TORCH_1_13, reason="OpenVINO requires torch>=1.13")
 def test_export_openvino():
     """Test YOLO exports to OpenVINO format for model inference compatibility."""
@@ -40,6 +56,16 @@ def test_export_openvino():
     YOLO(file)(SOURCE, imgsz=32)  # exported model inference
 
 
+@pytest.mark.skipif(not TORCH_1_13, reason="OpenVINO requires torch>=1.13")
+def test_export_openvino_throughput():
+    """Test that OpenVINO throughput inference on a pool of infer requests matches latency inference."""
+    file = YOLO(MODEL).export(format="openvino", imgsz=32)
+    latency = YOLO(file)([SOURCE] * 4, imgsz=32, batch=2)
+    throughput = YOLO(file)([SOURCE] * 4, imgsz=32, batch=2, ov_hint="THROUGHPUT", pipeline=True)
+    for a, b in zip(latency, throughput):
+        assert torch.allclose(a.boxes.data, b.boxes.data, atol=1e-3)
+
+
 @pytest.mark.slow
 @pytest.mark.skipif(not TORCH_1_13, reason="OpenVINO requires torch>=1.13")
 @pytest.mark.parametrize(
@@ -197,6 +197,252 @@ def test_track_stream():
         model.track(video_url, imgsz=160, tracker=tracker)
 
 
+def _crowd_boxes(n, frames, seed=0):
+    """Return per-frame Boxes of n objects moving at constant velocity with jitter, dropouts and random scores."""
+    from ultralytics.engine.results import Boxes
+
+    rng = np.random.default_rng(seed)
+    xy, v, wh = rng.uniform(0, 1280, (n, 2)), rng.normal(0, 3, (n, 2)), rng.uniform(15, 60, (n, 2))
+    for _ in range(frames):
+        xy += v
+        keep = rng.random(n) > 0.1  # missed detections
+        c, m = xy[keep] + rng.normal(0, 1, (keep.sum(), 2)), keep.sum()
+        data = np.c_[c - wh[keep] / 2, c + wh[keep] / 2, rng.uniform(0.05, 1, m), rng.integers(0, 3, m)]
+        yield Boxes(data.astype(np.float32), (1280, 1280))
+
+
+def test_track_batched():
+    """Test the batched ByteTrack tracker returns the same tracks as BYTETracker in a crowded scene."""
+    from ultralytics.trackers import BatchedBYTETracker, BYTETracker
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+
+    cfg = IterableSimpleNamespace(**yaml_load(ROOT / "cfg/trackers/bytetrack.yaml"))
+    tracks = []
+    for tracker_class in BYTETracker, BatchedBYTETracker:
+        tracker = tracker_class(cfg)  # resets the shared track ID counter
+        tracks.append([tracker.update(boxes) for boxes in _crowd_boxes(150, 60)])
+    for a, b in zip(*tracks):
+        assert np.allclose(a.reshape(b.shape), b, atol=1e-3)
+    assert [t.track_id for t in tracker.lost_stracks]  # STrack views of lost tracks
+
+
+def _kalman_states(kf, n, seed=0):
+    """Return predicted Kalman states of n random boxes and a noisy measurement of each box."""
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYWH
+
+    rng = np.random.default_rng(seed)
+    z = np.c_[rng.uniform(0, 1000, (n, 2)), rng.uniform(20, 100, (n, 2))]  # xywh
+    if not isinstance(kf, KalmanFilterXYWH):
+        z[:, 2] /= z[:, 3]  # xyah
+    mean, covariance = kf.multi_predict(*kf.multi_initiate(z))
+    return mean, covariance, z + rng.normal(0, 1, z.shape)
+
+
+@pytest.mark.parametrize("filter_type", ["XYAH", "XYWH"])
+def test_kalman_multi_update(filter_type):
+    """Test batched Kalman initiation and correction match the per-track initiate() and update()."""
+    from ultralytics.trackers.utils import kalman_filter
+
+    kf = getattr(kalman_filter, f"KalmanFilter{filter_type}")()
+    mean, covariance, z = _kalman_states(kf, 20)
+    init_mean, init_covariance = kf.multi_initiate(z)
+    new_mean, new_covariance = kf.multi_update(mean, covariance, z)
+    for i in range(20):
+        m, c = kf.initiate(z[i])
+        assert np.allclose(m, init_mean[i]) and np.allclose(c, init_covariance[i])
+        m, c = kf.update(mean[i], covariance[i], z[i])
+        assert np.allclose(m, new_mean[i]) and np.allclose(c, new_covariance[i])
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("n", [10, 100, 1000])
+def test_kalman_multi_update_many(n):
+    """Test the batched Kalman correction matches per-track updates for 10 to 1000 tracks."""
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYAH
+
+    kf = KalmanFilterXYAH()
+    mean, covariance, z = _kalman_states(kf, n)
+    ref = [kf.update(m, c, x) for m, c, x in zip(mean, covariance, z)]
+    new_mean, new_covariance = kf.multi_update(mean, covariance, z)
+    assert np.allclose(np.stack([m for m, _ in ref]), new_mean)
+    assert np.allclose(np.stack([c for _, c in ref]), new_covariance)
+
+
+def test_track_reid():
+    """Test BoT-SORT ReID with neck features pooled per box, matmul cosine costs and batched feature smoothing."""
+    from copy import deepcopy
+
+    from scipy.spatial.distance import cdist
+
+    from ultralytics.trackers import BOTSORT
+    from ultralytics.trackers.bot_sort import BOTrack, roi_features
+    from ultralytics.trackers.utils.matching import embedding_distance
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+
+    # Feature maps holding the input y coordinate next to ones, a 320x640 image is letterboxed with 160 px of padding
+    y = torch.arange(640.0)[:, None].expand(640, 640)
+    feats = [torch.stack([y[s // 2 :: s, s // 2 :: s], torch.ones(640 // s, 640 // s)])[None] for s in (8, 16, 32)]
+    emb = roi_features(feats, torch.tensor([8, 16, 32]), np.array([[100, 0, 300, 100]]), (320, 640))
+    assert emb.shape == (1, 6) and np.allclose(emb[0, ::2] / emb[0, 1::2], 210, atol=0.5)
+
+    rng = np.random.default_rng(0)
+    tracks = [BOTrack(np.array([i, i, 10, 10, i]), 0.9, 0, rng.normal(size=64)) for i in range(8)]
+    dets = [BOTrack(np.array([i, i, 10, 10, i]), 0.9, 0, rng.normal(size=64)) for i in range(5)]
+    track_feats, det_feats = np.asarray([t.smooth_feat for t in tracks]), np.asarray([d.curr_feat for d in dets])
+    assert np.allclose(embedding_distance(tracks, dets), cdist(track_feats, det_feats, "cosine"), atol=1e-5)
+    ref = deepcopy(tracks[:5])
+    for track, det in zip(ref, dets):
+        track.update_features(det.curr_feat.copy())
+    BOTrack.multi_update_features(tracks[:5], det_feats)
+    assert all(np.allclose(a.smooth_feat, b.smooth_feat) for a, b in zip(ref, tracks))
+
+    cfg = IterableSimpleNamespace(**yaml_load(ROOT / "cfg/trackers/botsort.yaml"))
+    cfg.with_reid = True
+    tracker = BOTSORT(cfg)  # features are passed in, so no encoder model is loaded
+    for boxes in _crowd_boxes(50, 10):
+        tracker.update(boxes, None, rng.normal(size=(len(boxes), 64)).astype(np.float32))
+    assert tracker.tracked_stracks and all(t.smooth_feat is not None for t in tracker.tracked_stracks)
+
+
+@pytest.mark.skipif(not IS_TMP_WRITEABLE, reason="directory is not writeable")
+def test_track_pipeline():
+    """Test BoT-SORT ReID pools the neck features of its own frame when inference runs ahead of post-processing."""
+    import time
+
+    im = cv2.resize(cv2.imread(str(SOURCE)), (320, 416))
+    video, tracker = TMP / "track_pipeline.mp4", TMP / "botsort_reid.yaml"
+    writer = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"mp4v"), 30, (320, 416))
+    for i in range(8):
+        writer.write(np.roll(im, 8 * i, 1))  # panning camera
+    writer.release()
+    with open(ROOT / "cfg/trackers/botsort.yaml", encoding="utf-8") as f:
+        cfg = {**yaml.safe_load(f), "with_reid": True}  # 'model: auto' hooks the detector's neck features
+    with open(tracker, "w", encoding="utf-8") as f:
+        yaml.safe_dump(cfg, f)
+
+    feats = {False: [], True: []}
+    for pipeline in feats:
+
+        def on_postprocess_end(predictor, pipeline=pipeline):
+            """Record the features of the batch after a slow post-process, letting inference run ahead."""
+            time.sleep(0.05)
+            feats[pipeline].append(predictor.forward_state.feats[0].clone())
+
+        model = YOLO(MODEL)
+        model.add_callback("on_predict_postprocess_end", on_postprocess_end)
+        model.track(video, imgsz=160, tracker=tracker, pipeline=pipeline)
+    assert len(feats[True]) == 8 and all(torch.equal(a, b) for a, b in zip(feats[False], feats[True]))
+
+
+def test_track_stream_routing():
+    """Test tracking routes each result of a partial stream batch to the tracker of its source, not its position."""
+    from types import SimpleNamespace
+
+    from ultralytics.engine.results import Results
+    from ultralytics.trackers.track import on_predict_postprocess_end
+
+    class Tracker:
+        """Tracker stand-in recording the frames it receives."""
+
+        def __init__(self):
+            self.frames = []
+
+        def update(self, det, img, feats=None):
+            self.frames.append(int(img[0, 0, 0]))
+            return np.empty((0, 8))
+
+        def reset(self):
+            pass
+
+    predictor = SimpleNamespace(
+        args=SimpleNamespace(task="detect"),
+        dataset=SimpleNamespace(mode="stream", sources=["cam0", "cam1", "cam2"]),
+        trackers=[Tracker() for _ in range(3)],
+        vid_path=[None] * 3,
+        save_dir=TMP,
+        native_feats=False,
+    )
+    boxes = torch.tensor([[10.0, 10.0, 20.0, 20.0, 0.9, 0.0]])
+    for batch in (["cam2"], ["cam1", "cam0"], ["cam2", "cam0"]):  # deadline batches hold any subset of streams
+        predictor.results = [
+            Results(np.full((32, 32, 3), int(p[-1]), dtype=np.uint8), path=p, names={0: "a"}, boxes=boxes)
+            for p in batch
+        ]
+        on_predict_postprocess_end(predictor, persist=True)
+    assert [t.frames for t in predictor.trackers] == [[0, 0], [1], [2, 2]]
+
+
+def test_track_gated():
+    """Test spatially gated sparse association returns the same pairs, matches and tracks as the dense one."""
+    from ultralytics.trackers import BOTSORT, BatchedBYTETracker, BYTETracker
+    from ultralytics.trackers.utils import matching
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.metrics import bbox_ioa
+
+    rng = np.random.default_rng(0)
+    xy, wh = rng.uniform(0, 1000, (2, 300, 2)), rng.uniform(10, 80, (2, 300, 2))
+    a, b = np.c_[xy[0], xy[0] + wh[0]], np.c_[xy[1], xy[1] + wh[1]]
+    a[:3, 2:] += 900  # large boxes are compared with all others
+    ia, ib = matching.candidate_pairs(a, b)
+    assert sorted(zip(ia, ib)) == sorted(zip(*np.nonzero(bbox_ioa(a, b) > 0)))
+    dense, sparse = matching.iou_distance(a, b), matching.iou_distance(a, b, sparse=True)
+    full = np.ones(dense.shape)  # pairs without overlap have a cost of 1
+    full[sparse.row, sparse.col] = sparse.data
+    assert np.allclose(full, dense, atol=1e-6)
+    for thresh in 0.8, 0.3:
+        (m1, u1a, u1b), (m2, u2a, u2b) = (matching.linear_assignment(d, thresh) for d in (dense, sparse))
+        assert np.array_equal(np.asarray(m1).reshape(-1, 2), m2)
+        assert np.array_equal(u1a, u2a) and np.array_equal(u1b, u2b)
+
+    for tracker_class, yml in (BYTETracker, "bytetrack"), (BatchedBYTETracker, "bytetrack"), (BOTSORT, "botsort"):
+        tracks = []
+        for gated in False, True:
+            cfg = IterableSimpleNamespace(**yaml_load(ROOT / f"cfg/trackers/{yml}.yaml"))
+            cfg.gated = gated
+            tracker = tracker_class(cfg)  # resets the shared track ID counter
+            tracks.append([tracker.update(boxes) for boxes in _crowd_boxes(300, 30)])
+        for dense, sparse in zip(*tracks):
+            assert np.allclose(dense, sparse, atol=1e-3)
+
+
+@pytest.mark.slow
+def test_track_gated_crowd():
+    """Test spatially gated association of BYTETracker returns the same tracks as the dense one with 2000 objects."""
+    from ultralytics.trackers import BYTETracker
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+
+    tracks = []
+    for gated in False, True:
+        cfg = IterableSimpleNamespace(**yaml_load(ROOT / "cfg/trackers/bytetrack.yaml"))
+        cfg.gated = gated
+        tracker = BYTETracker(cfg)  # resets the shared track ID counter
+        tracks.append([tracker.update(boxes) for boxes in _crowd_boxes(2000, 10)])
+    for dense, sparse in zip(*tracks):
+        assert len(dense) and np.allclose(dense, sparse, atol=1e-3)
+
+
+def test_gmc():
+    """Test GMC recovers camera motion with reused corners and masked detections, and skips a static camera."""
+    from ultralytics.trackers.utils.gmc import GMC
+
+    base = cv2.resize(cv2.imread(str(SOURCE)), (1200, 900))
+    shifts = np.cumsum(np.tile([[2.0, 1.0]], (10, 1)), 0)
+    frames = [cv2.warpAffine(base, np.float32([[1, 0, -x], [0, 1, -y]]), (960, 540)) for x, y in shifts]
+    dets = np.array([[480.0, 270.0, 100.0, 200.0, 0]])  # xywh and index, as passed by the trackers
+    for f in frames:
+        cv2.rectangle(f, (430, 170), (530, 370), (255, 255, 255), -1)  # an object that does not move with the camera
+
+    gmc = GMC("sparseOptFlow", redetect_ratio=0.5)
+    warps = [gmc.apply(f, dets) for f in frames]
+    assert np.allclose([w[:, 2] for w in warps[1:]], [-2.0, -1.0], atol=0.3)
+    assert gmc.numDetected and len(gmc.prevKeyPoints) >= 0.5 * gmc.numDetected  # corners are tracked, not re-detected
+    mask = gmc.get_mask(gmc.prevFrame, dets)
+    assert not mask[85:185, 215:265].any() and not mask[:5].any() and mask[20:50, 20:50].all()  # detection and border
+
+    gmc = GMC("sparseOptFlow", static_thresh=0.25)
+    assert [gmc.is_static(gmc.preprocess(f)) for f in (frames[0], frames[0], frames[1])] == [False, True, False]
+
+
 def test_val():
     """Test the validation mode of the YOLO model."""
     YOLO(MODEL).val(data="coco8.yaml", imgsz=32, save_hybrid=True)
@@ -262,6 +508,233 @@ def test_predict_callback_and_setup():
         print(boxes)
 
 
+def test_predict_session():
+    """Test persistent predict sessions return the same detections as predict() for Results and raw outputs."""
+    model = YOLO(MODEL)
+    im = cv2.imread(str(SOURCE))
+    expected = model.predict(im, imgsz=160)[0].boxes.data.cpu().numpy()
+    raw = model.predict_session(imgsz=160, raw=True)
+    assert np.allclose(raw(im)[0], expected)
+    assert len(raw([im, im])) == 2  # batch of frames
+    results = model.predict_session(imgsz=160)(im)
+    assert np.allclose(results[0].boxes.data.cpu().numpy(), expected)
+
+
+def test_predict_session_raw_tasks():
+    """Test raw predict sessions return pose keypoints and reject tasks without raw outputs."""
+    im = cv2.imread(str(SOURCE))
+    model = YOLO("yolo11n-pose.yaml")
+    model.model.kpt_shape = [17, 3]  # set from the dataset when training
+    result = model.predict(im, imgsz=160, conf=0, max_det=20)[0]
+    raw = model.predict_session(imgsz=160, conf=0, max_det=20, raw=True)(im)[0]
+    assert len(result) and raw.shape == (len(result), 6 + 17 * 3)
+    assert np.allclose(raw[:, :6], result.boxes.data.cpu().numpy(), atol=1e-4)
+    kpts = raw[:, 6:].reshape(len(result), 17, 3)
+    kpts[..., :2][kpts[..., 2] < 0.5] = 0  # Keypoints zero the coordinates of invisible points
+    assert np.allclose(kpts, result.keypoints.data.cpu().numpy(), atol=1e-4)
+    for cfg in "yolo11n-cls.yaml", "yolo11n-seg.yaml":
+        with pytest.raises(ValueError, match="raw=True"):
+            YOLO(cfg).predict_session(raw=True)
+
+
+def test_predict_pipeline():
+    """Test overlapped preprocess/inference/postprocess returns the same ordered results as serial prediction."""
+    model = YOLO(MODEL)
+    serial = model.predict(SOURCES_LIST[1], imgsz=160)
+    pipelined = model.predict(SOURCES_LIST[1], imgsz=160, pipeline=True)
+    assert [r.path for r in serial] == [r.path for r in pipelined]
+    for a, b in zip(serial, pipelined):
+        assert torch.allclose(a.boxes.data, b.boxes.data)
+
+
+def test_predict_pipeline_close():
+    """Test closing a pipelined stream early does not hang on a preprocess worker blocked in a stalled source read."""
+    import threading
+    import time
+    from types import SimpleNamespace
+
+    from ultralytics.engine.predictor import BasePredictor
+    from ultralytics.utils.ops import Profile
+
+    stalled = threading.Event()
+
+    def source():
+        """Yield one batch, then block like a stream that stopped delivering frames."""
+        yield ["frame.jpg"], [np.zeros((8, 8, 3), dtype=np.uint8)], [""]
+        stalled.wait()
+
+    predictor = BasePredictor()
+    predictor.dataset, predictor.model = source(), SimpleNamespace()
+    predictor.preprocess = predictor.inference = lambda x, *args, **kwargs: x
+    batches = predictor.pipelined_batches([Profile() for _ in range(3)])
+    assert next(batches)[0][0] == ["frame.jpg"]
+    t = time.perf_counter()
+    batches.close()
+    assert time.perf_counter() - t < 5
+    stalled.set()  # release the daemon worker
+
+
+@pytest.mark.skipif(not IS_TMP_WRITEABLE, reason="directory is not writeable")
+def test_predict_pipeline_stream_frames(tmp_path):
+    """Test pipelined stream results are saved under the frame number of their own batch, not the dataset's."""
+    video, streams = TMP / "pipeline.mp4", TMP / "pipeline.streams"
+    writer = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"mp4v"), 30, (64, 48))
+    for i in range(8):
+        writer.write(np.full((48, 64, 3), 30 * i, dtype=np.uint8))
+    writer.release()
+    streams.write_text(f"{video}\n")
+
+    results = YOLO(MODEL).predict(
+        str(streams), imgsz=32, conf=0, save_txt=True, pipeline=True, stream_buffer=True, project=tmp_path
+    )
+    stem = Path(results[0].path).stem
+    labels = sorted(f.stem for f in (tmp_path / "predict" / "labels").glob("*.txt"))
+    assert len(results) == 8 and labels == sorted(f"{stem}_{i}" for i in range(8))  # frames of every batch
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_frame_ring(shared):
+    """Test (shared) frame rings overwrite or block the writer when full and count written and dropped frames."""
+    import threading
+
+    from ultralytics.data.loaders import FrameRing, SharedFrameRing
+
+    ring_class = SharedFrameRing if shared else FrameRing
+
+    def write(ring, value):
+        """Decode a frame filled with value into the ring."""
+        ring.reserve()[:] = value
+        ring.commit()
+
+    ring = ring_class((2, 2, 3), capacity=2)  # live streams overwrite the oldest frame
+    for i in range(5):
+        assert ring.wait_for_space(timeout=0)
+        write(ring, i)
+    assert (ring.written, ring.dropped, len(ring)) == (5, 3, 2)
+    assert ring.read()[0, 0, 0] == 3  # oldest frame left
+    write(ring, 5)
+    assert ring.read(latest=True)[0, 0, 0] == 5 and (ring.dropped, len(ring)) == (4, 0)  # latest skips frame 4
+    if shared:
+        ring.release()
+
+    ring = ring_class((2, 2, 3), capacity=2, overwrite=False)  # buffered streams block the writer instead
+    for i in range(2):
+        write(ring, i)
+    assert not ring.wait_for_space(timeout=0.01)
+    assert ring.read()[0, 0, 0] == 0 and ring.wait_for_space(timeout=0)  # reading frees a slot
+    assert ring.read(timeout=0)[0, 0, 0] == 1 and ring.read(timeout=0.01) is None and ring.dropped == 0
+    threading.Timer(0.05, ring.close).start()
+    assert ring.read(timeout=5) is None and ring.closed and not ring.wait_for_space(timeout=0)  # close wakes readers
+    if shared:
+        ring.release()
+        assert ring.written == 2  # counters stay readable for stats
+
+
+@pytest.mark.skipif(not IS_TMP_WRITEABLE, reason="directory is not writeable")
+def test_shared_frame_ring_decoder():
+    """Test a decoder process fills a buffered SharedFrameRing with every frame of a video, without pickling frames."""
+    import multiprocessing
+
+    from ultralytics.data.loaders import SharedFrameRing, _decode_streams
+
+    video = TMP / "shared_frame_ring.mp4"
+    writer = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"mp4v"), 30, (64, 64))
+    for i in range(10):
+        writer.write(np.full((64, 64, 3), 20 * i, dtype=np.uint8))
+    writer.release()
+
+    ctx = multiprocessing.get_context("spawn")
+    ring = SharedFrameRing((64, 64, 3), capacity=4, overwrite=False, ctx=ctx)  # blocks the decoder when full
+    stop, ready = ctx.Event(), ctx.Event()
+    args = ([ring], [str(video)], [10], 1, stop, ready)
+    decoder = ctx.Process(target=_decode_streams, args=args, daemon=True)
+    decoder.start()
+    frames = []
+    while (im := ring.read(timeout=30)) is not None:
+        frames.append(float(im.mean()))
+    decoder.join(timeout=10)
+    assert ring.closed and (ring.written, ring.dropped) == (9, 0)  # the first frame is read by LoadStreams itself
+    assert frames == sorted(frames) and frames[0] > 10  # in order, starting with the second frame
+    ring.release()
+
+
+@pytest.mark.skipif(not IS_TMP_WRITEABLE, reason="directory is not writeable")
+def test_load_streams_deadline():
+    """Test deadline batches hold the streams with a ready frame, so a stalled stream does not hold back the others."""
+    import time
+
+    from ultralytics.data.loaders import LoadStreams
+
+    video, streams = TMP / "deadline.mp4", TMP / "deadline.streams"
+    writer = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"mp4v"), 30, (64, 48))
+    for i in range(3):
+        writer.write(np.full((48, 64, 3), 50 * i, dtype=np.uint8))
+    writer.release()
+    streams.write_text(f"{video}\n{video}\n")
+
+    loader = LoadStreams(str(streams), deadline=0.05)
+    assert loader.sources[1] == f"{loader.sources[0]}_1"  # duplicate sources get unique names for routing
+    for thread, ring in zip(loader.threads, loader.imgs):
+        thread.join(timeout=5)  # decoders finish the short video, leaving streams that deliver no new frames
+        ring.read(latest=True, timeout=0)
+
+    def write(ring):
+        """Commit a new frame to a stream's ring."""
+        ring.reserve()[:] = 255
+        ring.commit()
+
+    iter(loader)
+    write(loader.imgs[1])
+    t = time.perf_counter()
+    paths, ims, _ = next(loader)
+    assert paths == [loader.sources[1]] and len(ims) == 1 and 0.04 < time.perf_counter() - t < 1  # deadline only
+    for ring in loader.imgs:
+        write(ring)
+    paths, ims, _ = next(loader)
+    assert sorted(paths) == sorted(loader.sources) and len(ims) == 2  # full batch returns without waiting
+    loader.close()
+
+
+def test_predict_compile_cache():
+    """Test that models loaded from the compile cache predict like freshly fused ones and that pruning evicts them."""
+    from ultralytics.utils.compile_cache import CompileCache
+
+    cache = CompileCache(TMP / "compile_cache")
+    cache.clear()
+    expected = YOLO(MODEL).predict(SOURCE, imgsz=160)[0].boxes.data
+    for _ in range(2):  # populate, then load from the cache
+        results = YOLO(MODEL).predict(SOURCE, imgsz=160, compile_cache=cache.root)
+        assert torch.allclose(results[0].boxes.data, expected)
+    assert [e["meta"]["backend"] for e in cache.entries()] == ["pt"]
+    assert cache.prune(max_size=0) > 0 and not cache.entries()
+
+
+def test_openvino_future():
+    """Test OpenVINO pool futures re-raise errors of failed requests and time out instead of blocking forever."""
+    from types import SimpleNamespace
+
+    from ultralytics.nn.autobackend import OVFuture, OVInferPool
+
+    class FailedRequest:
+        """Infer request whose outputs cannot be read."""
+
+        @property
+        def output_tensors(self):
+            raise RuntimeError("infer request failed")
+
+    future = OVFuture(2)
+    OVInferPool._done(SimpleNamespace(output_tensors=[SimpleNamespace(data=np.ones((1, 3)))]), (future, 0))
+    OVInferPool._done(FailedRequest(), (future, 1))
+    with pytest.raises(RuntimeError, match="infer request failed"):
+        future.result()
+    with pytest.raises(TimeoutError):
+        OVFuture(1).result(timeout=0.01)  # a request that never calls back
+    future = OVFuture(2)
+    for i in range(2):
+        OVInferPool._done(SimpleNamespace(output_tensors=[SimpleNamespace(data=np.full((1, 3), i))]), (future, i))
+    assert np.array_equal(future.result()[0], [[0, 0, 0], [1, 1, 1]])
+
+
 @pytest.mark.parametrize("model", MODELS)
 def test_results(model):
     """Test YOLO model results processing and output in various formats."""
@@ -281,6 +754,38 @@ def test_results(model):
         print(r, len(r), r.path)  # print after methods
 
 
+@pytest.mark.skipif(not IS_TMP_WRITEABLE, reason="directory is not writeable")
+@pytest.mark.parametrize("suffix", [".db", ".parquet"])
+def test_results_sink(suffix):
+    """Test that ResultsSink writes one row per detection matching Results.to_records()."""
+    from ultralytics.engine.results import Results, ResultsSink
+
+    if suffix == ".parquet" and not checks.check_requirements("pyarrow", install=False):
+        pytest.skip("pyarrow not installed")
+    img, names = np.zeros((64, 64, 3), dtype=np.uint8), {0: "person", 1: "car"}
+    results = [
+        Results(img, "a.jpg", names, boxes=torch.tensor([[1.0, 2.0, 30.0, 40.0, 0.9, 1.0], [5, 5, 9, 9, 0.5, 0]])),
+        Results(img, "b.jpg", names, boxes=torch.zeros(0, 6)),
+        Results(img, "c.jpg", names, boxes=torch.tensor([[4.0, 4.0, 8.0, 8.0, 7, 0.7, 1.0]])),  # tracked
+    ]
+    file = TMP / f"results_sink{suffix}"
+    file.unlink(missing_ok=True)
+    with ResultsSink(file, flush_rows=2) as sink:
+        sink.append(results[:2])
+        sink.append(results[2])
+    if suffix == ".db":
+        import sqlite3
+
+        with sqlite3.connect(file) as conn:
+            rows = conn.execute("SELECT frame, name, track_id FROM results").fetchall()
+    else:
+        import pyarrow.parquet as pq
+
+        rows = list(zip(*pq.read_table(file, columns=["frame", "name", "track_id"]).to_pydict().values()))
+    assert rows == [(0, "car", -1), (0, "person", -1), (2, "car", 7)]
+    assert results[0].to_records()["confidence"].tolist() == pytest.approx([0.9, 0.5])
+
+
 def test_labels_and_crops():
     """Test output from prediction args for saving YOLO detection labels and crops."""
     imgs = [SOURCE, ASSETS / "zidane.jpg"]
@@ -391,6 +896,18 @@ def test_utils_checks():
     checks.print_args()
 
 
+def test_utils_checks_import_time():
+    """Test that 'import ultralytics' defers torch, matplotlib and the model classes until first use."""
+    import subprocess
+    import sys
+
+    modules = "{'torch', 'matplotlib.pyplot', 'ultralytics.models'}"
+    code = f"import sys, ultralytics; print(sorted({modules} & set(sys.modules)))"
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "[]"
+    profile = checks.check_import_time("import ultralytics", verbose=False)
+    assert profile["total"] < 5.0 and all(v >= 0 for v in profile["packages"].values())
+
+
 @pytest.mark.skipif(WINDOWS, reason="Windows profiling is extremely slow (cause unknown)")
 def test_utils_benchmarks():
     """Benchmark model performance using 'ProfileModels' from 'ultralytics.utils.benchmarks'."""
@@ -441,6 +958,98 @@ def test_utils_ops():
     torch.allclose(boxes, xyxyxyxy2xywhr(xywhr2xyxyxyxy(boxes)), rtol=1e-3)
 
 
+def test_utils_ops_nms():
+    """Test that batched non_max_suppression() returns the same detections as running it image by image."""
+    from ultralytics.utils.ops import non_max_suppression
+
+    pred = torch.rand(4, 4 + 3 + 32, 2000)  # 3 classes, 32 mask coefficients
+    pred[:, :2] *= 640
+    pred[:, 2:4] *= 64
+    pred[:, 4:7] = torch.randperm(4 * 3 * 2000).view(4, 2000, 3).transpose(1, 2) / (4 * 3 * 2000)  # unique scores
+    tied = pred.clone()
+    tied[:, 4:7] = (tied[:, 4:7] * 8).round() / 8  # quantized scores, ties are resolved by anchor order
+    tied[2:] = tied[:2]  # identical images
+    for p in pred, tied:
+        for kwargs in {}, {"multi_label": True, "max_nms": 500}, {"agnostic": True, "classes": [1, 2], "max_det": 20}:
+            batched = non_max_suppression(p.clone(), 0.5, nc=3, **kwargs)
+            for x, y in zip(batched, p):
+                assert torch.equal(x, non_max_suppression(y[None].clone(), 0.5, nc=3, **kwargs)[0])
+
+    p = pred.clone()  # in_place converts the boxes of the input to xyxy, without it the input is unchanged
+    non_max_suppression(p, 0.5, nc=3, in_place=False)
+    assert torch.equal(p, pred)
+    non_max_suppression(p, 0.5, nc=3)
+    assert torch.allclose(p[:, :2], pred[:, :2] - pred[:, 2:4] / 2)
+
+
+def test_utils_ops_nms_numpy():
+    """Test that NumPy non_max_suppression_numpy() matches the torch non_max_suppression()."""
+    from ultralytics.utils.ops import non_max_suppression, non_max_suppression_numpy
+
+    pred = torch.rand(2, 4 + 3 + 32, 2000)  # 3 classes, 32 mask coefficients
+    pred[:, :2] *= 640
+    pred[:, 2:4] *= 64
+    pred[:, 4:7] = torch.randperm(2 * 3 * 2000).view(2, 3, 2000) / (2 * 3 * 2000)  # unique scores
+    for kwargs in {}, {"agnostic": True, "max_nms": 500}, {"classes": [1, 2], "max_det": 20}:
+        expected = non_max_suppression(pred.clone(), 0.5, nc=3, **kwargs)
+        for x, y in zip(expected, non_max_suppression_numpy(pred.numpy(), 0.5, nc=3, **kwargs)):
+            assert np.allclose(x.numpy(), y)
+
+
+def test_sam_rle():
+    """Test SAM run-length encoding round trips and matches the COCO compressed string format."""
+    from ultralytics.models.sam.amg import mask_to_rle, rle_area, rle_to_mask, rle_to_string
+
+    masks = torch.zeros(3, 8, 10, dtype=torch.bool)
+    masks[0, 2:6, 3:9] = masks[0, 0, 0] = masks[0, 7, 9] = True
+    masks[1] = torch.rand(8, 10) > 0.5
+    rles = mask_to_rle(masks)
+    assert rle_to_string(rles[0])["counts"] == "01i03[O0000000005M"  # pycocotools.mask.encode() output
+    assert rles[2]["counts"] == [80]
+    for rle, mask in zip(rles, masks):
+        assert np.array_equal(rle_to_mask(rle), mask.numpy()) and rle_area(rle) == mask.sum()
+    assert mask_to_rle(masks[:0]) == []
+
+
+def _sam_object_masks(n, h, w, seed=0):
+    """Return n boolean masks with one ellipse each plus scattered specks and pinholes, like SAM mask proposals."""
+    rng = np.random.default_rng(seed)
+    masks = np.zeros((n, h, w), dtype=np.uint8)
+    for m in masks:
+        r, cx, cy = int(rng.uniform(2, h / 5)), int(rng.integers(0, w)), int(rng.integers(0, h))
+        cv2.ellipse(m, (cx, cy), (r, int(r * rng.uniform(0.5, 1.5))), 0, 0, 360, 1, -1)
+        near = m[max(cy - 2 * r, 0) : cy + 2 * r, max(cx - 2 * r, 0) : cx + 2 * r]
+        near ^= rng.random(near.shape) > 0.998
+    masks[0] = 1  # full mask with a pinhole in each corner
+    masks[0, [0, 0, -1, -1], [0, -1, 0, -1]] = 0
+    masks[1] = 0  # empty mask
+    return masks.astype(bool)
+
+
+def test_sam_remove_small_regions():
+    """Test batched SAM mask cleanup matches per-mask remove_small_regions() in both modes."""
+    from ultralytics.models.sam.amg import batched_remove_small_regions, remove_small_regions
+
+    masks = _sam_object_masks(16, 97, 130)
+    for mode in ("holes", "islands"):
+        for area in (1, 20, 1e9):
+            out, changed = batched_remove_small_regions(masks, area, mode)
+            for mask, o, c in zip(masks, out, changed):
+                ref, ref_changed = remove_small_regions(mask, area, mode)
+                assert np.array_equal(ref.astype(bool), o) and ref_changed == c
+
+
+@pytest.mark.slow
+def test_sam_remove_small_regions_many():
+    """Test batched SAM mask cleanup matches the per-mask loop for 100 masks of 1024x1024."""
+    from ultralytics.models.sam.amg import batched_remove_small_regions, remove_small_regions
+
+    masks = _sam_object_masks(100, 1024, 1024)
+    ref = [remove_small_regions(remove_small_regions(m, 100, "holes")[0], 100, "islands")[0] for m in masks]
+    out = batched_remove_small_regions(batched_remove_small_regions(masks, 100, "holes")[0], 100, "islands")[0]
+    assert np.array_equal(np.stack(ref).astype(bool), out)
+
+
 def test_utils_files():
     """Test file handling utilities including file age, date, and paths with spaces."""
     from ultralytics.utils.files import file_age, file_date, get_latest_run, spaces_in_path
@@ -558,6 +1167,34 @@ def test_classify_transforms_train(image, auto_augment, erasing, force_color_jit
     assert transformed_image.dtype == torch.float32
 
 
+@pytest.mark.parametrize("shapes,auto", [([(1080, 1920, 3)] * 2, True), ([(480, 640, 3), (640, 480, 3)], False)])
+def test_fused_letterbox(shapes, auto):
+    """Test that FusedLetterBox reproduces LetterBox preprocessing exactly while reusing its buffers."""
+    from ultralytics.data.augment import FusedLetterBox, LetterBox
+
+    fused = FusedLetterBox((320, 320), stride=32)
+    letterbox = LetterBox((320, 320), auto=auto, stride=32)
+    for _ in range(2):  # second call reuses the canvas
+        ims = [np.random.randint(0, 255, shape, dtype=np.uint8) for shape in shapes]
+        expected = np.stack([letterbox(image=x) for x in ims])[..., ::-1].transpose(0, 3, 1, 2)
+        expected = torch.from_numpy(np.ascontiguousarray(expected)).float() / 255
+        assert torch.equal(fused(ims, auto=auto), expected)
+
+
+def test_fused_letterbox_params():
+    """Test FusedLetterBox caches the letterbox geometry by shape and auto flag, evicting the least recent shapes."""
+    from ultralytics.data.augment import FusedLetterBox, LetterBox
+
+    fused = FusedLetterBox((320, 320), stride=32)
+    for auto in False, True:
+        expected = LetterBox((320, 320), auto=auto, stride=32).get_params((480, 640))
+        assert fused.get_params((480, 640), auto) == expected
+    assert fused.get_params((480, 640)) is fused.get_params((480, 640))  # cached
+    for h in range(100, 116):
+        fused.get_params((h, 640))
+    assert len(fused._params) == 16 and ((480, 640), True) not in fused._params
+
+
 @pytest.mark.slow
 @pytest.mark.skipif(not ONLINE, reason="environment is offline")
 def test_model_tune():
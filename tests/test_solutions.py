@@ -100,3 +100,87 @@ def test_major_solutions():
 def test_streamlit_predict():
     """Test streamlit predict live inference solution."""
     solutions.Inference().inference()
+
+
+def test_vsg_staged_pipeline():
+    """Test the VSG staged pipeline keeps item order serially and in threads and its queues drop the oldest items."""
+    import itertools
+
+    from ultralytics.solutions.vsg_pipeline import DropOldestQueue, StagedPipeline
+
+    q = DropOldestQueue(2)
+    assert [q.put(i) for i in range(4)] == [0, 0, 1, 1]  # evicted items per put
+    assert [q.get(timeout=0) for _ in range(2)] == [2, 3]
+
+    for mode in "serial", "threads":
+        received = []
+
+        def source():
+            """Return a camera stand-in producing increasing frame numbers."""
+            frames = itertools.count()
+            return lambda _: next(frames)
+
+        def sink():
+            """Return a stream stage that stops the pipeline after 20 items."""
+
+            def stream(item):
+                received.append(item)
+                if len(received) == 20:
+                    raise KeyboardInterrupt
+
+            return stream
+
+        stages = [("capture", source), ("inference", lambda: lambda x: 2 * x), ("stream", sink)]
+        pipeline = StagedPipeline(stages, mode=mode, queue_size=2, stats_interval=0)
+        pipeline.run()
+        assert received == sorted(set(received)) and all(x % 2 == 0 for x in received)  # ordered, gaps from drops
+        assert pipeline.stats["stream"]["count"] == 19  # the interrupted item is not recorded
+        if mode == "serial":
+            assert received == list(range(0, 40, 2)) and pipeline.stats["capture"]["dropped"] == 0
+
+
+def test_vsg_pack_metadata():
+    """Test vectorized VSG metadata packing matches the per-detection struct layout for both wire versions."""
+    import struct
+
+    import numpy as np
+
+    from ultralytics.engine.vsg_capture_yolo_inference import META_HEADER, YoloInference
+
+    boxes = np.array([[0.5, 3.9, 120.2, 80.7], [1000, 4, 1919.9, 1079]], dtype=np.float32)
+    scores = np.array([0.2509804, 1.0])
+    expected = b"".join(struct.pack("B4H", min(int(s * 255), 255), *map(int, b)) for s, b in zip(scores, boxes))
+    records = YoloInference._to_records(scores, boxes)
+    assert YoloInference.pack_metadata(records) == struct.pack("H", 2) + expected
+    detections = [(float(s), tuple(int(x) for x in b)) for s, b in zip(scores, boxes)]
+    assert YoloInference.pack_metadata(detections) == YoloInference.pack_metadata(records)
+    packed = YoloInference.pack_metadata(records, version=1)
+    assert META_HEADER.unpack_from(packed) == (b"VM", 1, 10, 2) and packed[META_HEADER.size :] == expected
+    assert YoloInference.pack_metadata(records[:0]) == struct.pack("H", 0)
+    with pytest.raises(ValueError):
+        YoloInference.pack_metadata(records, version=2)
+
+
+def test_vsg_gstreamer_push():
+    """Test pooled GstStreamer pushes write the frame into the buffer and report whether they avoid a tobytes() copy."""
+    import tracemalloc
+
+    import numpy as np
+
+    try:
+        from ultralytics.solutions.vsg_gstreamer import GstStreamer
+    except (ImportError, ValueError):  # PyGObject or the GStreamer 1.0 typelib is missing
+        pytest.skip("GStreamer Python bindings are not installed")
+
+    frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+    streamer = GstStreamer("test_src", "video/x-raw,format=BGR,width=640,height=480", "! fakesink sync=false", 30)
+    try:
+        buf = streamer._frame_buffer(frame)  # the first frame decides between the zero-copy and tobytes() paths
+        assert buf.extract_dup(0, buf.get_size()) == frame.tobytes()
+        tracemalloc.start()
+        streamer.push(frame)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert streamer.zero_copy == (peak < frame.nbytes / 2)  # only the fallback allocates a frame copy
+    finally:
+        streamer.stop()
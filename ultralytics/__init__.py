@@ -2,18 +2,35 @@
 
 __version__ = "8.3.93"
 
+import importlib
 import os
+from typing import TYPE_CHECKING
 
 # Set ENV variables (place before imports)
 if not os.environ.get("OMP_NUM_THREADS"):
     os.environ["OMP_NUM_THREADS"] = "1"  # default for reduced CPU utilization during training
 
-from ultralytics.models import NAS, RTDETR, SAM, YOLO, FastSAM, YOLOWorld
-from ultralytics.utils import ASSETS, SETTINGS
-from ultralytics.utils.checks import check_yolo as checks
-from ultralytics.utils.downloads import download
+# Attributes imported on first access (PEP 562), so 'import ultralytics' does not load torch, cv2 or every model
+_LAZY_ATTRS = {
+    "YOLO": ("ultralytics.models", "YOLO"),
+    "YOLOWorld": ("ultralytics.models", "YOLOWorld"),
+    "NAS": ("ultralytics.models", "NAS"),
+    "SAM": ("ultralytics.models", "SAM"),
+    "FastSAM": ("ultralytics.models", "FastSAM"),
+    "RTDETR": ("ultralytics.models", "RTDETR"),
+    "ASSETS": ("ultralytics.utils", "ASSETS"),
+    "settings": ("ultralytics.utils", "SETTINGS"),
+    "checks": ("ultralytics.utils.checks", "check_yolo"),
+    "download": ("ultralytics.utils.downloads", "download"),
+}
+
+if TYPE_CHECKING:
+    from ultralytics.models import NAS, RTDETR, SAM, YOLO, FastSAM, YOLOWorld
+    from ultralytics.utils import ASSETS
+    from ultralytics.utils import SETTINGS as settings
+    from ultralytics.utils.checks import check_yolo as checks
+    from ultralytics.utils.downloads import download
 
-settings = SETTINGS
 __all__ = (
     "__version__",
     "ASSETS",
@@ -27,3 +44,18 @@ __all__ = (
     "download",
     "settings",
 )
+
+
+def __getattr__(name):
+    """Import model classes and utilities on first access and cache them as module attributes."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY_ATTRS[name]
+    value = getattr(importlib.import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazily imported attributes in dir(ultralytics) and tab completion."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -137,6 +137,7 @@ CLI_HELP_MSG = f"""
         yolo checks
         yolo version
         yolo settings
+        yolo compile-cache
         yolo copy-cfg
         yolo cfg
         yolo solutions help
@@ -159,6 +160,7 @@ CFG_FLOAT_KEYS = frozenset(
         "time",
         "workspace",
         "batch",
+        "stream_deadline",
     }
 )
 CFG_FRACTION_KEYS = frozenset(
@@ -197,6 +199,10 @@ CFG_INT_KEYS = frozenset(
         "mask_ratio",
         "max_det",
         "vid_stride",
+        "stream_workers",
+        "stream_max_batch",
+        "ort_intra_threads",
+        "ort_inter_threads",
         "line_width",
         "nbs",
         "save_period",
@@ -238,6 +244,10 @@ CFG_BOOL_KEYS = frozenset(
         "nms",
         "profile",
         "multi_scale",
+        "pipeline",
+        "numpy_postprocess",
+        "prefetch_results",
+        "device_preprocess",
     }
 )
 
@@ -629,6 +639,32 @@ def handle_yolo_settings(args: List[str]) -> None:
         LOGGER.warning(f"WARNING ⚠️ settings error: '{e}'. Please see {url} for help.")
 
 
+def handle_yolo_compile_cache(args: List[str]) -> None:
+    """
+    Handles YOLO compile-cache command-line interface (CLI) commands to inspect, prune or clear the compiled models.
+
+    Args:
+        args (List[str]): 'clear', or 'prune' with optional 'size=GB' and 'dir=path' arguments. The cache is listed
+            after every command.
+
+    Examples:
+        >>> handle_yolo_compile_cache([])  # list cache entries
+        >>> handle_yolo_compile_cache(["prune", "size=0.5"])  # remove least recently used entries above 0.5 GB
+        >>> handle_yolo_compile_cache(["clear"])  # remove all entries
+    """
+    from ultralytics.utils.compile_cache import CompileCache
+
+    new = dict(parse_key_value_pair(a) for a in args if "=" in a)
+    check_dict_alignment({"size": 2.0, "dir": None}, new)
+    cache = CompileCache(new.get("dir"), max_size=new.get("size", 2.0))
+    if "clear" in args:
+        cache.clear()
+        LOGGER.info(f"Cleared compile cache {cache.root}")
+    elif "prune" in args:
+        LOGGER.info(f"Pruned {cache.prune() / 1e6:.1f} MB from compile cache {cache.root}")
+    cache.info()
+
+
 def handle_yolo_solutions(args: List[str]) -> None:
     """
     Processes YOLO solutions arguments and runs the specified computer vision solutions pipeline.
@@ -855,9 +891,14 @@ def entrypoint(debug: str = "") -> None:
 
     special = {
         "help": lambda: LOGGER.info(CLI_HELP_MSG),
-        "checks": checks.collect_system_info,
+        "checks": lambda: (
+            checks.check_import_time("from ultralytics import YOLO")
+            if "import-profile" in {a.lstrip("-") for a in args[1:]}
+            else checks.collect_system_info()
+        ),
         "version": lambda: LOGGER.info(__version__),
         "settings": lambda: handle_yolo_settings(args[1:]),
+        "compile-cache": lambda: handle_yolo_compile_cache(args[1:]),
         "cfg": lambda: yaml_print(DEFAULT_CFG_PATH),
         "hub": lambda: handle_yolo_hub(args[1:]),
         "login": lambda: handle_yolo_hub(args),
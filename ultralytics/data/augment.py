@@ -2,6 +2,7 @@
 
 import math
 import random
+from collections import OrderedDict
 from copy import deepcopy
 from typing import Tuple, Union
 
@@ -1493,6 +1494,7 @@ class LetterBox:
 
     Methods:
         __call__: Resize and pad image, update labels and bounding boxes.
+        get_params: Compute the resize target and padding for an image shape.
 
     Examples:
         >>> transform = LetterBox(new_shape=(640, 640))
@@ -1561,9 +1563,44 @@ class LetterBox:
         img = labels.get("img") if image is None else image
         shape = img.shape[:2]  # current shape [height, width]
         new_shape = labels.pop("rect_shape", self.new_shape)
+        new_unpad, ratio, (top, bottom, left, right) = self.get_params(shape, new_shape)
+
+        if shape[::-1] != new_unpad:  # resize
+            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
+        img = cv2.copyMakeBorder(
+            img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114)
+        )  # add border
+        if labels.get("ratio_pad"):
+            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
+
+        if len(labels):
+            labels = self._update_labels(labels, ratio, left, top)
+            labels["img"] = img
+            labels["resized_shape"] = new_shape
+            return labels
+        else:
+            return img
+
+    def get_params(self, shape, new_shape=None):
+        """
+        Compute the resize target and padding that letterbox an image of a given shape.
+
+        Args:
+            shape (Tuple[int, int]): Input image shape (height, width).
+            new_shape (int | Tuple[int, int] | None): Target shape, defaults to self.new_shape.
+
+        Returns:
+            new_unpad (Tuple[int, int]): Size (width, height) of the resized image before padding.
+            ratio (Tuple[float, float]): Scaling ratios (width, height).
+            pad (Tuple[int, int, int, int]): Top, bottom, left and right padding in pixels.
+
+        Examples:
+            >>> letterbox = LetterBox(new_shape=(640, 640))
+            >>> new_unpad, ratio, (top, bottom, left, right) = letterbox.get_params((720, 1280))
+        """
+        new_shape = self.new_shape if new_shape is None else new_shape
         if isinstance(new_shape, int):
             new_shape = (new_shape, new_shape)
-
         # Scale ratio (new / old)
         r = min(new_shape[0] / shape[0], new_shape[1] / shape[1])
         if not self.scaleup:  # only scale down, do not scale up (for better val mAP)
@@ -1584,23 +1621,9 @@ class LetterBox:
             dw /= 2  # divide padding into 2 sides
             dh /= 2
 
-        if shape[::-1] != new_unpad:  # resize
-            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
         top, bottom = int(round(dh - 0.1)) if self.center else 0, int(round(dh + 0.1))
         left, right = int(round(dw - 0.1)) if self.center else 0, int(round(dw + 0.1))
-        img = cv2.copyMakeBorder(
-            img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114)
-        )  # add border
-        if labels.get("ratio_pad"):
-            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
-
-        if len(labels):
-            labels = self._update_labels(labels, ratio, left, top)
-            labels["img"] = img
-            labels["resized_shape"] = new_shape
-            return labels
-        else:
-            return img
+        return new_unpad, ratio, (top, bottom, left, right)
 
     @staticmethod
     def _update_labels(labels, ratio, padw, padh):
@@ -1633,6 +1656,150 @@ class LetterBox:
         return labels
 
 
+class FusedLetterBox:
+    """
+    Letterbox a batch of images straight into a reused buffer and return it as a normalized BCHW tensor.
+
+    The default path resizes each image directly into its region of a persistent uint8 canvas whose borders already
+    hold the padding color, then performs the BGR to RGB swap, HWC to CHW transpose and division by 255 in a single
+    pass into the output tensor. For CUDA devices the canvas is pinned and uploaded as uint8, and the conversion runs on
+    the device. This replaces the resize, copyMakeBorder, np.stack, ascontiguousarray and float copies of
+    LetterBox-based preprocessing with one resize and one conversion, producing identical tensors.
+
+    With on_device=True the uint8 images are uploaded as they are and resized, padded and normalized on the device with
+    bilinear interpolation instead, which offloads the CPU for high resolution inputs but does not exactly reproduce
+    OpenCV's resize.
+
+    Attributes:
+        letterbox (LetterBox): Geometry of the resize and padding, updated with the auto flag of every call.
+        device (torch.device): Device of the output tensor.
+        half (bool): Whether to return an FP16 tensor.
+        on_device (bool): Whether to resize and pad on the device.
+
+    Methods:
+        __call__: Letterbox a list of images into a BCHW tensor.
+        get_params: Return the cached letterbox geometry of an image shape.
+
+    Examples:
+        >>> fused = FusedLetterBox(new_shape=(640, 640), stride=32, device=torch.device("cuda"), half=True)
+        >>> im = fused([cv2.imread("bus.jpg")], auto=True)  # (1, 3, 640, 480) FP16 CUDA tensor
+    """
+
+    def __init__(self, new_shape=(640, 640), stride=32, device=torch.device("cpu"), half=False, on_device=False):
+        """
+        Initialize the fused letterbox.
+
+        Args:
+            new_shape (int | Tuple[int, int]): Target size (height, width).
+            stride (int): Model stride used for minimum rectangle padding.
+            device (torch.device): Device of the output tensor.
+            half (bool): Return an FP16 tensor instead of FP32.
+            on_device (bool): Resize and pad on the device instead of with OpenCV.
+        """
+        self.letterbox = LetterBox(new_shape, stride=stride)
+        self.device = torch.device(device)
+        self.half = half
+        self.on_device = on_device
+        self._canvas = None  # uint8 (N, H, W, 3) canvas reused while the batch size and shape do not change
+        self._regions = []  # (top, left, h, w) of the image placed in each canvas slot, borders are padding
+        self._uploaded = None  # CUDA event marking the end of the last canvas upload
+        self._params = OrderedDict()  # LRU cache of letterbox geometry by input shape and auto flag
+
+    def __call__(self, ims, auto=False):
+        """
+        Letterbox a list of BGR images into a single normalized RGB tensor.
+
+        Args:
+            ims (List[np.ndarray]): Images of shape (h, w, 3), all producing the same letterboxed shape.
+            auto (bool): Pad to the minimum rectangle that is a multiple of the stride.
+
+        Returns:
+            (torch.Tensor): Tensor of shape (N, 3, H, W) with values in [0, 1] on self.device.
+        """
+        params = [self.get_params(im.shape[:2], auto) for im in ims]
+        (w, h), _, (top, bottom, left, right) = params[0]
+        shape = (len(ims), top + h + bottom, left + w + right, 3)
+        if self.on_device:
+            return self._on_device(ims, params, shape)
+
+        cuda = self.device.type == "cuda"
+        if self._canvas is None or self._canvas.shape != shape:
+            canvas = torch.empty(shape, dtype=torch.uint8)
+            self._canvas = (canvas.pin_memory() if cuda else canvas).numpy()
+            self._regions = [None] * len(ims)
+        elif self._uploaded is not None:
+            self._uploaded.synchronize()  # the previous upload may still read the canvas
+        for i, (im, ((w, h), _, (top, _, left, _))) in enumerate(zip(ims, params)):
+            region = self._canvas[i, top : top + h, left : left + w]
+            if self._regions[i] != (top, left, h, w):
+                self._canvas[i] = 114  # padding color, only rewritten when the image placement changes
+                self._regions[i] = (top, left, h, w)
+            if im.shape[:2] == (h, w):
+                region[:] = im
+            else:
+                cv2.resize(im, (w, h), dst=region, interpolation=cv2.INTER_LINEAR)
+
+        if cuda:  # upload uint8 and convert on the device
+            im = torch.from_numpy(self._canvas).to(self.device, non_blocking=True)
+            self._uploaded = torch.cuda.Event()
+            self._uploaded.record()
+            im = im.permute(0, 3, 1, 2).flip(1)  # BHWC to BCHW, BGR to RGB
+            im = im.half() if self.half else im.float()
+            return im / 255
+
+        # BGR to RGB, BHWC to BCHW and uint8 to float in a single pass
+        im = torch.empty((shape[0], 3, *shape[1:3]), dtype=torch.float16 if self.half else torch.float32)
+        out = im.numpy()
+        np.divide(self._canvas[..., ::-1].transpose(0, 3, 1, 2), 255, out=out, dtype=out.dtype)
+        return im.to(self.device)
+
+    def get_params(self, shape, auto=False):
+        """
+        Return LetterBox.get_params() for an image shape, computed once per resolution.
+
+        Fixed cameras produce the same shape on every frame, so the geometry is kept in a small LRU cache keyed by shape
+        and auto flag, which also covers mixed-resolution batches.
+
+        Args:
+            shape (Tuple[int, int]): Input image shape (height, width).
+            auto (bool): Pad to the minimum rectangle that is a multiple of the stride.
+
+        Returns:
+            (tuple): Resize target, scaling ratios and top, bottom, left and right padding, see LetterBox.get_params().
+        """
+        key = (shape, auto)
+        if key in self._params:
+            self._params.move_to_end(key)
+            return self._params[key]
+        self.letterbox.auto = auto
+        params = self._params[key] = self.letterbox.get_params(shape)
+        if len(self._params) > 16:
+            self._params.popitem(last=False)  # evict least recently used shape
+        return params
+
+    def _on_device(self, ims, params, shape):
+        """
+        Upload the uint8 images and letterbox them on the device.
+
+        Args:
+            ims (List[np.ndarray]): Input images of shape (h, w, 3).
+            params (List[tuple]): LetterBox.get_params() output for each image.
+            shape (Tuple[int, int, int, int]): Letterboxed batch shape (N, H, W, 3).
+
+        Returns:
+            (torch.Tensor): Tensor of shape (N, 3, H, W) with values in [0, 1] on self.device.
+        """
+        import torch.nn.functional as F
+
+        out = torch.full((shape[0], 3, *shape[1:3]), 114 / 255, device=self.device)
+        for i, (im, ((w, h), _, (top, _, left, _))) in enumerate(zip(ims, params)):
+            x = torch.from_numpy(im).to(self.device).permute(2, 0, 1).flip(0)[None].float()  # BGR HWC to RGB CHW
+            if im.shape[:2] != (h, w):
+                x = F.interpolate(x, size=(h, w), mode="bilinear", align_corners=False)
+            out[i, :, top : top + h, left : left + w] = x[0].clamp_(0, 255) / 255
+        return out.half() if self.half else out
+
+
 class CopyPaste(BaseMixTransform):
     """
     CopyPaste class for applying Copy-Paste augmentation to image datasets.
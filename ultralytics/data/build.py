@@ -222,7 +222,9 @@ def check_source(source):
     return source, webcam, screenshot, from_img, in_memory, tensor
 
 
-def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
+def load_inference_source(
+    source=None, batch=1, vid_stride=1, buffer=False, stream_workers=0, stream_deadline=0.0, stream_max_batch=0
+):
     """
     Load an inference source for object detection and apply necessary transformations.
 
@@ -231,6 +233,10 @@ def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
         batch (int, optional): Batch size for dataloaders.
         vid_stride (int, optional): The frame interval for video sources.
         buffer (bool, optional): Whether stream frames will be buffered.
+        stream_workers (int, optional): Number of decoder processes for stream sources, 0 to decode in threads.
+        stream_deadline (float, optional): Milliseconds to wait for more streams once one has a frame ready, 0 to
+            wait for every stream.
+        stream_max_batch (int, optional): Maximum number of stream frames per batch when stream_deadline > 0.
 
     Returns:
         (Dataset): A dataset object for the specified input source with attached source_type attribute.
@@ -244,7 +250,14 @@ def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
     elif in_memory:
         dataset = source
     elif stream:
-        dataset = LoadStreams(source, vid_stride=vid_stride, buffer=buffer)
+        dataset = LoadStreams(
+            source,
+            vid_stride=vid_stride,
+            buffer=buffer,
+            workers=stream_workers,
+            deadline=stream_deadline / 1000,
+            max_batch=stream_max_batch,
+        )
     elif screenshot:
         dataset = LoadScreenshots(source)
     elif from_img:
@@ -2,11 +2,12 @@
 
 import glob
 import math
+import multiprocessing
 import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from threading import Thread
+from threading import Condition, Thread
 from urllib.parse import urlparse
 
 import cv2
@@ -49,6 +50,327 @@ class SourceTypes:
     tensor: bool = False
 
 
+class FrameRing:
+    """
+    Fixed-capacity ring buffer of preallocated frames for a single video stream.
+
+    Frames are decoded directly into preallocated slots of a (capacity, H, W, 3) array. A condition variable wakes
+    readers when a frame is committed and writers when space frees up, replacing sleep-based polling. Head and tail
+    are monotonically increasing counters guarded by the condition's lock.
+
+    Attributes:
+        frames (np.ndarray): Preallocated frame storage of shape (capacity, H, W, C).
+        capacity (int): Number of frame slots.
+        overwrite (bool): Whether a full ring overwrites its oldest frame (True) or blocks the writer (False).
+        head (int): Number of frames committed so far.
+        tail (int): Number of frames consumed or dropped so far.
+        written (int): Number of frames committed so far.
+        dropped (int): Number of frames overwritten or skipped without being read.
+        reconnects (int): Number of times the writer re-opened a lost stream.
+        latency (float): Time in seconds the most recently read frame spent in the buffer.
+        closed (bool): Whether the ring has been closed.
+        ready (Condition | None): Optional condition shared by several rings, notified on every commit and close.
+
+    Methods:
+        wait_for_space: Block a buffering writer until a slot is free.
+        reserve: Return the slot the next frame should be decoded into.
+        commit: Publish the reserved slot to readers.
+        read: Return a copy of the oldest or newest frame.
+        close: Wake up and release all waiting readers and writers.
+
+    Examples:
+        >>> ring = FrameRing((480, 640, 3), capacity=2)
+        >>> slot = ring.reserve()
+        >>> success, _ = cap.retrieve(slot)
+        >>> ring.commit()
+        >>> im = ring.read(latest=True, timeout=1.0)
+    """
+
+    def __init__(self, shape, capacity=30, overwrite=True, ready=None):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            shape (Tuple[int, int, int]): Frame shape (H, W, C).
+            capacity (int): Number of frame slots, at least 2 so a frame can be read while the next one is decoded.
+            overwrite (bool): Overwrite the oldest frame when full instead of blocking the writer.
+            ready (Condition | None): Condition shared across rings to wait for a frame in any of them.
+        """
+        self.capacity = max(int(capacity), 2)
+        self.frames = np.zeros((self.capacity, *shape), dtype=np.uint8)
+        self.timestamps = np.zeros(self.capacity)
+        self.overwrite = overwrite
+        self.head = self.tail = 0
+        self.written = self.dropped = self.reconnects = 0
+        self.latency = 0.0
+        self.closed = False
+        self.cond = Condition()
+        self.ready = ready
+
+    def __len__(self):
+        """Return the number of frames available to readers."""
+        return self.head - self.tail
+
+    def wait_for_space(self, timeout=None):
+        """
+        Block until a slot is free when the ring does not overwrite frames.
+
+        Args:
+            timeout (float | None): Maximum time to wait in seconds.
+
+        Returns:
+            (bool): True if the writer may proceed.
+        """
+        if self.overwrite:
+            return True
+        with self.cond:
+            return self.cond.wait_for(lambda: len(self) < self.capacity or self.closed, timeout) and not self.closed
+
+    def reserve(self):
+        """
+        Return the slot for the next frame, dropping the oldest unread frame if the ring is full.
+
+        Returns:
+            (np.ndarray): Writable view of shape (H, W, C). Readers never access it until commit() is called.
+        """
+        with self.cond:
+            if len(self) == self.capacity:
+                self.tail += 1
+                self.dropped += 1
+            return self.frames[self.head % self.capacity]
+
+    def commit(self):
+        """Publish the reserved slot as the newest frame and wake up readers."""
+        with self.cond:
+            self.timestamps[self.head % self.capacity] = time.perf_counter()
+            self.head += 1
+            self.written += 1
+            self.cond.notify_all()
+        self._notify_ready()
+
+    def _notify_ready(self):
+        """Wake up readers waiting for a frame in any ring sharing the ready condition."""
+        if self.ready is not None:
+            with self.ready:
+                self.ready.notify_all()
+
+    def read(self, latest=False, timeout=None):
+        """
+        Wait for a frame and return a copy of it.
+
+        Args:
+            latest (bool): Return the newest frame and drop older unread ones, otherwise return the oldest frame.
+            timeout (float | None): Maximum time to wait in seconds.
+
+        Returns:
+            (np.ndarray | None): Frame copy, or None if no frame arrived in time or the ring is closed.
+        """
+        with self.cond:
+            if not self.cond.wait_for(lambda: len(self) or self.closed, timeout) or not len(self):
+                return None
+            if latest:
+                self.dropped += len(self) - 1
+                self.tail = self.head - 1
+            idx = self.tail % self.capacity
+            im = self.frames[idx].copy()  # the slot is reused by the writer once released
+            self.latency = time.perf_counter() - float(self.timestamps[idx])
+            self.tail += 1
+            self.cond.notify_all()
+            return im
+
+    def close(self):
+        """Mark the ring closed and wake up all waiting readers and writers."""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self._notify_ready()
+
+
+def _shared_counter(index):
+    """Return a property exposing one int64 slot of a SharedFrameRing state array."""
+    return property(
+        lambda self: int(self._state[index]),
+        lambda self, value: self._state.__setitem__(index, value),
+    )
+
+
+class SharedFrameRing(FrameRing):
+    """
+    FrameRing whose frames, timestamps and counters live in a `multiprocessing.shared_memory` block.
+
+    A decoder process fills the ring while the predictor process reads it, so frames cross the process boundary
+    without pickling. Synchronization uses a multiprocessing Condition. The ring is created by the reading process
+    and attached by name when pickled into a decoder process.
+
+    Attributes:
+        shm (multiprocessing.shared_memory.SharedMemory): Shared block holding state, timestamps and frames.
+        shape (Tuple[int, int, int]): Frame shape (H, W, C).
+
+    Examples:
+        >>> ring = SharedFrameRing((480, 640, 3), capacity=2, ctx=multiprocessing.get_context("spawn"))
+        >>> im = ring.read(latest=True, timeout=1.0)  # frames are written by a decoder process
+        >>> ring.release()
+    """
+
+    head = _shared_counter(0)
+    tail = _shared_counter(1)
+    written = _shared_counter(2)
+    dropped = _shared_counter(3)
+    reconnects = _shared_counter(4)
+    _closed = _shared_counter(5)
+    _NUM_COUNTERS = 6
+
+    def __init__(self, shape, capacity=30, overwrite=True, ready=None, ctx=None):
+        """
+        Allocate the shared block and the condition variable.
+
+        Args:
+            shape (Tuple[int, int, int]): Frame shape (H, W, C).
+            capacity (int): Number of frame slots, at least 2.
+            overwrite (bool): Overwrite the oldest frame when full instead of blocking the writer.
+            ready (multiprocessing.Condition | None): Condition shared across rings, created from the same ctx.
+            ctx (multiprocessing.context.BaseContext | None): Multiprocessing context for the Condition.
+        """
+        from multiprocessing import shared_memory
+
+        self.shape = tuple(shape)
+        self.capacity = max(int(capacity), 2)
+        self.overwrite = overwrite
+        self.latency = 0.0
+        self.cond = (ctx or multiprocessing).Condition()
+        self.ready = ready
+        size = 8 * (self._NUM_COUNTERS + self.capacity) + self.capacity * int(np.prod(self.shape))
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self._attach()
+        self._state[:] = 0
+
+    def _attach(self):
+        """Create NumPy views of the state counters, timestamps and frames on the shared block."""
+        k, buf = self._NUM_COUNTERS, self.shm.buf
+        self._state = np.ndarray((k,), dtype=np.int64, buffer=buf)
+        self.timestamps = np.ndarray((self.capacity,), dtype=np.float64, buffer=buf, offset=8 * k)
+        self.frames = np.ndarray(
+            (self.capacity, *self.shape), dtype=np.uint8, buffer=buf, offset=8 * (k + self.capacity)
+        )
+
+    @property
+    def closed(self):
+        """Whether the ring has been closed by either process."""
+        return bool(self._closed)
+
+    @closed.setter
+    def closed(self, value):
+        """Set the shared closed flag."""
+        self._closed = int(value)
+
+    def __getstate__(self):
+        """Pickle by shared memory name so the decoder process attaches to the same block."""
+        state = {k: self.__dict__[k] for k in ("shape", "capacity", "overwrite", "cond", "ready")}
+        return {**state, "name": self.shm.name}
+
+    def __setstate__(self, state):
+        """Attach to the shared block created by the reading process."""
+        from multiprocessing import shared_memory
+
+        name = state.pop("name")
+        self.__dict__.update(state, latency=0.0)
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)  # Python>=3.13, owner unlinks
+        except TypeError:
+            self.shm = shared_memory.SharedMemory(name=name)  # registered with the owner's resource tracker
+        self._attach()
+
+    def release(self, unlink=True):
+        """
+        Drop the NumPy views and close the shared block, keeping a private copy of the counters for stats.
+
+        Args:
+            unlink (bool): Also free the block, only done by the creating process.
+        """
+        self._state = self._state.copy()
+        self.timestamps = self.frames = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def decode_stream(ring, cap, stream, frames, vid_stride=1, running=lambda: True, reconnect=False):
+    """
+    Grab frames from a video capture and decode them directly into a ring buffer until the stream ends.
+
+    Args:
+        ring (FrameRing): Ring buffer receiving the frames.
+        cap (cv2.VideoCapture): Opened video capture whose first frame has already been consumed.
+        stream (str | int): Source used to re-open the capture when the signal is lost.
+        frames (int | float): Total number of frames in the stream, `inf` for live streams.
+        vid_stride (int): Decode every vid_stride-th frame.
+        running (Callable[[], bool]): Returns False once decoding should stop.
+        reconnect (bool): Re-open closed live streams with exponential backoff instead of ending them.
+    """
+    n, delay = 0, 0.5  # frame number, reconnect delay
+    while running() and n < (frames - 1):
+        if not cap.isOpened():
+            if not reconnect:
+                break
+            LOGGER.warning(f"WARNING ⚠️ Stream {stream} closed, reconnecting in {delay:.1f}s...")
+            time.sleep(delay)
+            delay = min(delay * 2, 10.0)
+            ring.reconnects += 1
+            cap.open(stream)
+            continue
+        if not ring.wait_for_space(timeout=0.1):  # blocks only when buffering and the ring is full
+            continue
+        n += 1
+        cap.grab()  # .read() = .grab() followed by .retrieve()
+        if n % vid_stride == 0:
+            slot = ring.reserve()
+            success, im = cap.retrieve(slot)
+            if not success:
+                slot[:] = 0
+                LOGGER.warning("WARNING ⚠️ Video stream unresponsive, please check your IP camera connection.")
+                cap.open(stream)  # re-open stream if signal was lost
+            else:
+                delay = 0.5
+                if not np.may_share_memory(im, slot):  # decoder reallocated, i.e. stream resolution changed
+                    slot[:] = im if im.shape == slot.shape else cv2.resize(im, slot.shape[1::-1])
+            ring.commit()
+    ring.close()
+
+
+def _decode_streams(rings, streams, frames, vid_stride, stop, ready):
+    """
+    Decoder process entry point, decoding a group of streams into shared rings with one thread per stream.
+
+    Args:
+        rings (List[SharedFrameRing]): Shared rings, one per stream.
+        streams (List[str | int]): Stream sources.
+        frames (List[int | float]): Total frame count per stream, `inf` for live streams.
+        vid_stride (int): Decode every vid_stride-th frame.
+        stop (multiprocessing.Event): Set by the reading process to stop decoding.
+        ready (multiprocessing.Event): Set once all captures of this process are open.
+    """
+    caps = [cv2.VideoCapture(s) for s in streams]
+    for cap, f in zip(caps, frames):
+        if math.isfinite(f):
+            cap.grab()  # skip the first frame, already delivered by the reading process
+    ready.set()
+    threads = [
+        Thread(
+            target=decode_stream,
+            args=(ring, cap, s, f, vid_stride, lambda: not stop.is_set(), not math.isfinite(f)),
+            daemon=True,
+        )
+        for ring, cap, s, f in zip(rings, caps, streams, frames)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for ring, cap in zip(rings, caps):
+        cap.release()
+        ring.release(unlink=False)
+
+
 class LoadStreams:
     """
     Stream Loader for various types of video streams.
@@ -60,18 +382,22 @@ class LoadStreams:
         sources (List[str]): The source input paths or URLs for the video streams.
         vid_stride (int): Video frame-rate stride.
         buffer (bool): Whether to buffer input streams.
+        workers (int): Number of decoder processes, 0 to decode in threads of the current process.
+        deadline (float): Seconds to wait for more streams once a frame is ready, 0 to wait for every stream.
+        max_batch (int): Maximum number of frames per batch in deadline mode.
         running (bool): Flag to indicate if the streaming thread is running.
         mode (str): Set to 'stream' indicating real-time capture.
-        imgs (List[List[np.ndarray]]): List of image frames for each stream.
+        imgs (List[FrameRing]): Preallocated ring buffer of frames for each stream.
         fps (List[float]): List of FPS for each stream.
         frames (List[int]): List of total frames for each stream.
-        threads (List[Thread]): List of threads for each stream.
+        threads (List[Thread | multiprocessing.Process]): Thread or decoder process serving each stream.
         shape (List[Tuple[int, int, int]]): List of shapes for each stream.
         caps (List[cv2.VideoCapture]): List of cv2.VideoCapture objects for each stream.
-        bs (int): Batch size for processing.
+        bs (int): Batch size for processing, the maximum batch size when deadline > 0.
 
     Methods:
         update: Read stream frames in daemon thread.
+        stats: Return per-stream frame, drop and latency counters.
         close: Close stream loader and release resources.
         __iter__: Returns an iterator object for the class.
         __next__: Returns source paths, transformed, and original images for processing.
@@ -85,15 +411,22 @@ class LoadStreams:
         >>> stream_loader.close()
 
     Notes:
-        - The class uses threading to efficiently load frames from multiple streams simultaneously.
+        - The class uses threading to efficiently load frames from multiple streams simultaneously. With workers > 0,
+          streams are decoded by a pool of processes into shared memory rings instead, so decoding many streams does
+          not compete with inference for the GIL. Lost live streams are then re-opened automatically.
         - It automatically handles YouTube links, converting them to the best available stream URL.
-        - The class implements a buffer system to manage frame storage and retrieval.
+        - Frames are decoded straight into a preallocated FrameRing per stream, holding up to 30 frames when
+          buffering and 2 otherwise.
+        - With deadline > 0, batches contain only the streams that delivered a frame within the deadline, so a slow
+          or stalled camera does not hold back the others. The returned paths identify the stream of each frame.
     """
 
-    def __init__(self, sources="file.streams", vid_stride=1, buffer=False):
+    def __init__(self, sources="file.streams", vid_stride=1, buffer=False, workers=0, deadline=0.0, max_batch=0):
         """Initialize stream loader for multiple video sources, supporting various stream types."""
         torch.backends.cudnn.benchmark = True  # faster for fixed-size inference
         self.buffer = buffer  # buffer input streams
+        self.workers = workers  # decoder processes, 0 for threads
+        self.deadline = deadline  # batch assembly deadline in seconds, 0 to wait for every stream
         self.running = True  # running flag for Thread
         self.mode = "stream"
         self.vid_stride = vid_stride  # video frame-rate stride
@@ -105,9 +438,16 @@ class LoadStreams:
         self.frames = [0] * n
         self.threads = [None] * n
         self.caps = [None] * n  # video capture objects
-        self.imgs = [[] for _ in range(n)]  # images
+        self.imgs = [None] * n  # frame ring buffers
         self.shape = [[] for _ in range(n)]  # image shapes
         self.sources = [ops.clean_str(x).replace(os.sep, "_") for x in sources]  # clean source names for later
+        self.sources = [x if x not in self.sources[:i] else f"{x}_{i}" for i, x in enumerate(self.sources)]  # unique
+        self.max_batch = min(max_batch or n, n)
+        self._next_stream = 0  # round-robin start of deadline batches
+        streams = [None] * n  # resolved stream sources
+        ctx = multiprocessing.get_context("spawn") if workers else None  # fresh decoders without forked CUDA state
+        # Notified on a frame from any stream
+        self.ready = (ctx.Condition() if workers else Condition()) if deadline else None
         for i, s in enumerate(sources):  # index, source
             # Start thread to read frames from video stream
             st = f"{i + 1}/{n}: {s}... "
@@ -134,44 +474,106 @@ class LoadStreams:
             success, im = self.caps[i].read()  # guarantee first frame
             if not success or im is None:
                 raise ConnectionError(f"{st}Failed to read images from {s}")
-            self.imgs[i].append(im)
             self.shape[i] = im.shape
-            self.threads[i] = Thread(target=self.update, args=([i, self.caps[i], s]), daemon=True)
+            capacity = 30 if buffer else 2
+            if workers:
+                self.imgs[i] = SharedFrameRing(
+                    im.shape, capacity=capacity, overwrite=not buffer, ready=self.ready, ctx=ctx
+                )
+                self.caps[i].release()  # re-opened by the decoder process
+                self.caps[i] = None
+            else:
+                self.imgs[i] = FrameRing(im.shape, capacity=capacity, overwrite=not buffer, ready=self.ready)
+            self.imgs[i].reserve()[:] = im
+            self.imgs[i].commit()
+            streams[i] = s
             LOGGER.info(f"{st}Success ✅ ({self.frames[i]} frames of shape {w}x{h} at {self.fps[i]:.2f} FPS)")
-            self.threads[i].start()
+            if not workers:
+                self.threads[i] = Thread(target=self.update, args=([i, self.caps[i], s]), daemon=True)
+                self.threads[i].start()
+        if workers:
+            self._start_decoders(ctx, streams)
         LOGGER.info("")  # newline
 
+    def _start_decoders(self, ctx, streams):
+        """
+        Start the decoder process pool, assigning streams round-robin, and wait until all captures are open.
+
+        Args:
+            ctx (multiprocessing.context.BaseContext): Multiprocessing context used to create the processes.
+            streams (List[str | int]): Resolved stream sources.
+        """
+        self._stop = ctx.Event()
+        n = len(streams)
+        for w in range(min(self.workers, n)):
+            idx = list(range(w, n, self.workers))
+            ready = ctx.Event()
+            p = ctx.Process(
+                target=_decode_streams,
+                args=(
+                    [self.imgs[i] for i in idx],
+                    [streams[i] for i in idx],
+                    [self.frames[i] for i in idx],
+                    self.vid_stride,
+                    self._stop,
+                    ready,
+                ),
+                daemon=True,
+            )
+            p.start()
+            if not ready.wait(timeout=60):
+                LOGGER.warning(f"WARNING ⚠️ Stream decoder process {w} is slow to start")
+            for i in idx:
+                self.threads[i] = p
+        LOGGER.info(f"Decoding {n} stream{'s' * (n > 1)} in {min(self.workers, n)} processes")
+
     def update(self, i, cap, stream):
-        """Read stream frames in daemon thread and update image buffer."""
-        n, f = 0, self.frames[i]  # frame number, frame array
-        while self.running and cap.isOpened() and n < (f - 1):
-            if len(self.imgs[i]) < 30:  # keep a <=30-image buffer
-                n += 1
-                cap.grab()  # .read() = .grab() followed by .retrieve()
-                if n % self.vid_stride == 0:
-                    success, im = cap.retrieve()
-                    if not success:
-                        im = np.zeros(self.shape[i], dtype=np.uint8)
-                        LOGGER.warning("WARNING ⚠️ Video stream unresponsive, please check your IP camera connection.")
-                        cap.open(stream)  # re-open stream if signal was lost
-                    if self.buffer:
-                        self.imgs[i].append(im)
-                    else:
-                        self.imgs[i] = [im]
-            else:
-                time.sleep(0.01)  # wait until the buffer is empty
+        """Read stream frames in daemon thread, decoding them directly into the stream's ring buffer."""
+        decode_stream(self.imgs[i], cap, stream, self.frames[i], self.vid_stride, lambda: self.running)
+
+    def stats(self):
+        """
+        Return per-stream counters.
+
+        Returns:
+            (List[dict]): For each stream, the number of decoded, dropped and currently buffered frames, the number of
+                reconnects, whether its decoder is alive and the buffer latency of the last returned frame in ms.
+        """
+        return [
+            {
+                "frames": r.written,
+                "dropped": r.dropped,
+                "buffered": len(r),
+                "reconnects": r.reconnects,
+                "alive": t.is_alive(),
+                "latency": r.latency * 1e3,
+            }
+            for r, t in zip(self.imgs, self.threads)
+        ]
 
     def close(self):
         """Terminates stream loader, stops threads, and releases video capture resources."""
         self.running = False  # stop flag for Thread
-        for thread in self.threads:
-            if thread.is_alive():
+        if self.workers:
+            self._stop.set()  # stop flag for decoder processes
+        for ring in self.imgs:
+            if ring is not None and ring.frames is not None:
+                ring.close()  # wake up threads waiting for buffer space
+        for thread in set(self.threads):
+            if thread is not None and thread.is_alive():
                 thread.join(timeout=5)  # Add timeout
+                if self.workers and thread.is_alive():
+                    thread.terminate()  # decoder process did not stop in time
         for cap in self.caps:  # Iterate through the stored VideoCapture objects
             try:
-                cap.release()  # release video capture
+                if cap is not None:
+                    cap.release()  # release video capture
             except Exception as e:
                 LOGGER.warning(f"WARNING ⚠️ Could not release VideoCapture object: {e}")
+        if self.workers:
+            for ring in self.imgs:
+                if isinstance(ring, SharedFrameRing) and ring.frames is not None:
+                    ring.release()  # free shared memory
         cv2.destroyAllWindows()
 
     def __iter__(self):
@@ -182,30 +584,57 @@ class LoadStreams:
     def __next__(self):
         """Returns the next batch of frames from multiple video streams for processing."""
         self.count += 1
+        if self.deadline:
+            return self._next_ready()
 
         images = []
-        for i, x in enumerate(self.imgs):
-            # Wait until a frame is available in each buffer
-            while not x:
-                if not self.threads[i].is_alive() or cv2.waitKey(1) == ord("q"):  # q to quit
+        for i, ring in enumerate(self.imgs):
+            # Wait until a frame is available in each buffer, oldest frame if buffering, else the newest one
+            while (im := ring.read(latest=not self.buffer, timeout=1 / min(self.fps))) is None:
+                if ring.closed or not self.threads[i].is_alive() or cv2.waitKey(1) == ord("q"):  # q to quit
                     self.close()
                     raise StopIteration
-                time.sleep(1 / min(self.fps))
-                x = self.imgs[i]
-                if not x:
-                    LOGGER.warning(f"WARNING ⚠️ Waiting for stream {i}")
-
-            # Get and remove the first frame from imgs buffer
-            if self.buffer:
-                images.append(x.pop(0))
-
-            # Get the last frame, and clear the rest from the imgs buffer
-            else:
-                images.append(x.pop(-1) if x else np.zeros(self.shape[i], dtype=np.uint8))
-                x.clear()
+                LOGGER.warning(f"WARNING ⚠️ Waiting for stream {i}")
+            images.append(im)
 
         return self.sources, images, [""] * self.bs
 
+    def _next_ready(self):
+        """
+        Assemble a batch from the streams that deliver a frame before the deadline.
+
+        Waits for the first frame from any stream, then collects frames from the other streams until the deadline
+        expires or max_batch frames are collected. Streams are polled round-robin starting one stream later on every
+        call, so no stream is starved when max_batch is smaller than the number of streams.
+
+        Returns:
+            (Tuple[List[str], List[np.ndarray], List[str]]): Source name of each frame, frames and info strings.
+        """
+        n = len(self.imgs)
+        order = [(self._next_stream + k) % n for k in range(n)]
+        self._next_stream = (self._next_stream + 1) % n
+        idx, images, t_end = [], [], None
+        with self.ready:
+            while True:
+                for i in order:
+                    if i not in idx and len(images) < self.max_batch:
+                        im = self.imgs[i].read(latest=not self.buffer, timeout=0)
+                        if im is not None:
+                            idx.append(i)
+                            images.append(im)
+                if images and t_end is None:
+                    t_end = time.perf_counter() + self.deadline  # the deadline starts with the first ready frame
+                if len(images) == self.max_batch or (t_end is not None and time.perf_counter() >= t_end):
+                    break
+                if not images and (
+                    all((ring.closed and not len(ring)) or not t.is_alive() for ring, t in zip(self.imgs, self.threads))
+                    or cv2.waitKey(1) == ord("q")  # q to quit
+                ):
+                    self.close()
+                    raise StopIteration
+                self.ready.wait(timeout=t_end - time.perf_counter() if t_end else 1 / min(self.fps))
+        return [self.sources[i] for i in idx], images, [""] * len(images)
+
     def __len__(self):
         """Return the number of video streams in the LoadStreams object."""
         return self.bs  # 1E12 frames = 32 streams at 30 FPS for 30 years
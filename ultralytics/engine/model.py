@@ -9,6 +9,7 @@ import torch
 from PIL import Image
 
 from ultralytics.cfg import TASK2DATA, get_cfg, get_save_dir
+from ultralytics.engine.predictor import PredictorSession
 from ultralytics.engine.results import Results
 from ultralytics.hub import HUB_WEB_ROOT, HUBTrainingSession
 from ultralytics.nn.tasks import attempt_load_one_weight, guess_model_task, yaml_model_load
@@ -549,6 +550,46 @@ class Model(torch.nn.Module):
             self.predictor.set_prompts(prompts)
         return self.predictor.predict_cli(source=source) if is_cli else self.predictor(source=source, stream=stream)
 
+    def predict_session(self, raw: bool = False, predictor=None, **kwargs: Any):
+        """
+        Create a persistent inference session for repeated single-frame predictions.
+
+        The session owns its own predictor, so its arguments are not affected by later predict() calls. It binds the
+        arguments, the model and its warmup once, then runs preprocess, inference and postprocess directly on
+        in-memory frames. This skips the per-call argument merging, source and dataset
+        construction of predict(), which dominates latency for small models and image sizes.
+
+        Args:
+            raw (bool): If True, calls return per-image NumPy arrays instead of Results objects. For detection models
+                each array has shape (N, 6) with [x1, y1, x2, y2, conf, cls] in original image pixels, OBB and pose
+                models return their rotated boxes and keypoints. Not supported for classify and segment models.
+            predictor (BasePredictor | None): An instance of a custom predictor class. If None, the default
+                predictor for the task is used.
+            **kwargs (Any): Prediction arguments such as imgsz, conf, iou or classes.
+
+        Returns:
+            (ultralytics.engine.predictor.PredictorSession): A callable accepting one frame or a list of frames.
+
+        Raises:
+            ValueError: If raw is True and the predictor of the task has no raw outputs.
+
+        Examples:
+            >>> model = YOLO("yolo11n.pt")
+            >>> session = model.predict_session(imgsz=128, conf=0.5, classes=[0], raw=True)
+            >>> for frame in frames:
+            ...     boxes = session(frame)[0]
+        """
+        custom = {"conf": 0.25, "batch": 1, "save": False, "mode": "predict"}  # method defaults
+        args = {**self.overrides, **custom, **kwargs}  # highest priority args on the right
+        predictor = (predictor or self._smart_load("predictor"))(overrides=args, _callbacks=self.callbacks)
+        if raw and getattr(predictor, "postprocess_raw", None) is None:
+            raise ValueError(
+                f"'raw=True' is not supported for {predictor.__class__.__name__} ('{self.task}' task), "
+                "use raw=False to get Results objects."
+            )
+        predictor.setup_model(model=self.model, verbose=False)
+        return PredictorSession(predictor, raw=raw)
+
     def track(
         self,
         source: Union[str, Path, int, list, tuple, np.ndarray, torch.Tensor] = None,
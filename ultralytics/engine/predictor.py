@@ -33,8 +33,10 @@ Usage - formats:
 """
 
 import platform
+import queue
 import re
 import threading
+import time
 from pathlib import Path
 
 import cv2
@@ -43,7 +45,8 @@ import torch
 
 from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
-from ultralytics.data.augment import LetterBox, classify_transforms
+from ultralytics.data.augment import FusedLetterBox, LetterBox, classify_transforms
+from ultralytics.data.loaders import SourceTypes
 from ultralytics.nn.autobackend import AutoBackend
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
@@ -88,6 +91,9 @@ class BasePredictor:
         transforms (callable): Image transforms for classification.
         callbacks (dict): Callback functions for different events.
         txt_path (Path): Path to save text results.
+        fused_letterbox (FusedLetterBox): Letterbox reusing its buffers across preprocessed batches.
+        forward_state (threading.local): State of the current batch, set by forward hooks in the thread running
+            inference and the dataset frame count read with the batch.
         _lock (threading.Lock): Lock for thread-safe inference.
 
     Methods:
@@ -96,6 +102,8 @@ class BasePredictor:
         postprocess: Process raw predictions into structured results.
         predict_cli: Run prediction for command line interface.
         setup_source: Set up input source and inference mode.
+        setup_session: Bind model, image size and warmup once for source-free inference.
+        predict_frames: Run inference directly on in-memory frames after setup_session.
         stream_inference: Stream inference on input source.
         setup_model: Initialize and configure the model.
         write_results: Write inference results to files.
@@ -138,6 +146,8 @@ class BasePredictor:
         self.transforms = None
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
         self.txt_path = None
+        self.fused_letterbox = None  # reused letterbox buffers, created on the first preprocessed batch
+        self.forward_state = threading.local()  # e.g. feature maps kept by forward hooks, carried when pipelined
         self._lock = threading.Lock()  # for automatic thread-safe inference
         callbacks.add_integration_callbacks(self)
 
@@ -145,10 +155,23 @@ class BasePredictor:
         """
         Prepares input image before inference.
 
+        Lists of images are letterboxed by a FusedLetterBox in a single pass unless pre_transform() is overridden.
+
         Args:
             im (torch.Tensor | List(np.ndarray)): Images of shape (N, 3, h, w) for tensor, [(h, w, 3) x N] for list.
         """
         not_tensor = not isinstance(im, torch.Tensor)
+        if not_tensor and type(self).pre_transform is BasePredictor.pre_transform:
+            fused = self.fused_letterbox
+            if fused is None or fused.letterbox.new_shape != self.imgsz:
+                fused = self.fused_letterbox = FusedLetterBox(
+                    self.imgsz,
+                    stride=self.model.stride,
+                    device=self.device,
+                    half=self.model.fp16,
+                    on_device=self.args.device_preprocess,
+                )
+            return fused(im, auto=self.letterbox_auto(im))
         if not_tensor:
             im = np.stack(self.pre_transform(im))
             im = im[..., ::-1].transpose((0, 3, 1, 2))  # BGR to RGB, BHWC to BCHW, (n, 3, h, w)
@@ -180,14 +203,22 @@ class BasePredictor:
         Returns:
             (List[np.ndarray]): A list of transformed images.
         """
-        same_shapes = len({x.shape for x in im}) == 1
-        letterbox = LetterBox(
-            self.imgsz,
-            auto=same_shapes and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx)),
-            stride=self.model.stride,
-        )
+        letterbox = LetterBox(self.imgsz, auto=self.letterbox_auto(im), stride=self.model.stride)
         return [letterbox(image=x) for x in im]
 
+    def letterbox_auto(self, im):
+        """
+        Return whether images can be letterboxed to the minimum stride-multiple rectangle instead of imgsz.
+
+        Args:
+            im (List[np.ndarray]): Images of shape (h, w, 3).
+
+        Returns:
+            (bool): True if all images share a shape and the model accepts dynamic input shapes.
+        """
+        same_shapes = len({x.shape for x in im}) == 1
+        return same_shapes and (self.model.pt or (getattr(self.model, "dynamic", False) and not self.model.imx))
+
     def postprocess(self, preds, img, orig_imgs):
         """Post-process predictions for an image and return them."""
         return preds
@@ -257,6 +288,9 @@ class BasePredictor:
             batch=self.args.batch,
             vid_stride=self.args.vid_stride,
             buffer=self.args.stream_buffer,
+            stream_workers=self.args.stream_workers,
+            stream_deadline=self.args.stream_deadline,
+            stream_max_batch=self.args.stream_max_batch,
         )
         self.source_type = self.dataset.source_type
         if not getattr(self, "stream", True) and (
@@ -268,6 +302,56 @@ class BasePredictor:
             LOGGER.warning(STREAM_WARNING)
         self.vid_writer = {}
 
+    def setup_session(self, model=None):
+        """
+        Prepare the predictor for repeated predict_frames() calls.
+
+        Binds the model, image size and transforms and warms the model up once, so that subsequent calls skip the
+        source and dataset construction performed by setup_source() on every stream_inference() call.
+
+        Args:
+            model (str | Path | torch.nn.Module | None): Model for inference, used if no model is set up yet.
+        """
+        if not self.model:
+            self.setup_model(model)
+        self.imgsz = check_imgsz(self.args.imgsz, stride=self.model.stride, min_dim=2)  # check image size
+        self.transforms = (
+            getattr(
+                self.model.model,
+                "transforms",
+                classify_transforms(self.imgsz[0], crop_fraction=self.args.crop_fraction),
+            )
+            if self.args.task == "classify"
+            else None
+        )
+        self.dataset = None
+        self.source_type = SourceTypes(from_img=True)
+        if not self.done_warmup:
+            self.model.warmup(imgsz=(1 if self.model.pt or self.model.triton else self.args.batch, 3, *self.imgsz))
+            self.done_warmup = True
+
+    @smart_inference_mode()
+    def predict_frames(self, frames, raw=False):
+        """
+        Run preprocess, inference and postprocess directly on in-memory frames.
+
+        Requires setup_session() to have been called. No callbacks are run and no results are saved or shown.
+
+        Args:
+            frames (np.ndarray | List[np.ndarray]): A single HWC BGR image or a list of them.
+            raw (bool): Return per-image NumPy arrays from postprocess_raw() instead of Results objects.
+
+        Returns:
+            (List[ultralytics.engine.results.Results] | List[np.ndarray]): One output per frame.
+        """
+        if isinstance(frames, np.ndarray) and frames.ndim == 3:
+            frames = [frames]
+        with self._lock:  # for thread-safe inference
+            self.batch = ([f"image{i}.jpg" for i in range(len(frames))], frames, [""] * len(frames))
+            im = self.preprocess(frames)
+            preds = self.inference(im)
+            return self.postprocess_raw(preds, im, frames) if raw else self.postprocess(preds, im, frames)
+
     @smart_inference_mode()
     def stream_inference(self, source=None, model=None, *args, **kwargs):
         """
@@ -310,34 +394,49 @@ class BasePredictor:
                 ops.Profile(device=self.device),
             )
             self.run_callbacks("on_predict_start")
-            for self.batch in self.dataset:
-                self.run_callbacks("on_predict_batch_start")
+            pipelined = self.args.pipeline and not (self.args.embed or self.args.visualize)
+            batches = self.pipelined_batches(profilers, *args, **kwargs) if pipelined else self.dataset
+            t_start = time.perf_counter()
+            for item in batches:
+                if pipelined:
+                    self.batch, im, preds, dt, state = item
+                    vars(self.forward_state).update(state)  # state hooked from this batch's forward pass
+                    self.run_callbacks("on_predict_batch_start")
+                else:
+                    self.batch = item
+                    self.forward_state.count = getattr(self.dataset, "count", None)
+                    self.run_callbacks("on_predict_batch_start")
+
+                    # Preprocess
+                    with profilers[0]:
+                        im = self.preprocess(self.batch[1])
+
+                    # Inference
+                    with profilers[1]:
+                        preds = self.inference(im, *args, **kwargs)
+                        if self.args.embed:
+                            yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
+                            continue
+                    dt = [profilers[0].dt, profilers[1].dt]
                 paths, im0s, s = self.batch
 
-                # Preprocess
-                with profilers[0]:
-                    im = self.preprocess(im0s)
-
-                # Inference
-                with profilers[1]:
-                    preds = self.inference(im, *args, **kwargs)
-                    if self.args.embed:
-                        yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
-                        continue
-
                 # Postprocess
                 with profilers[2]:
                     self.results = self.postprocess(preds, im, im0s)
+                dt.append(profilers[2].dt)
                 self.run_callbacks("on_predict_postprocess_end")
+                if self.args.prefetch_results:
+                    for r in self.results:
+                        r.prefetch()  # queue all device to host copies of the batch before the first sync
 
                 # Visualize, save, write results
                 n = len(im0s)
                 for i in range(n):
                     self.seen += 1
                     self.results[i].speed = {
-                        "preprocess": profilers[0].dt * 1e3 / n,
-                        "inference": profilers[1].dt * 1e3 / n,
-                        "postprocess": profilers[2].dt * 1e3 / n,
+                        "preprocess": dt[0] * 1e3 / n,
+                        "inference": dt[1] * 1e3 / n,
+                        "postprocess": dt[2] * 1e3 / n,
                     }
                     if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
                         s[i] += self.write_results(i, Path(paths[i]), im, s)
@@ -348,6 +447,7 @@ class BasePredictor:
 
                 self.run_callbacks("on_predict_batch_end")
                 yield from self.results
+            t_total = time.perf_counter() - t_start
 
         # Release assets
         for v in self.vid_writer.values():
@@ -361,12 +461,109 @@ class BasePredictor:
                 f"Speed: %.1fms preprocess, %.1fms inference, %.1fms postprocess per image at shape "
                 f"{(min(self.args.batch, self.seen), 3, *im.shape[2:])}" % t
             )
+            if pipelined:
+                LOGGER.info(
+                    f"Pipeline: {self.seen / t_total:.1f} images/s end-to-end, "
+                    f"{t_total / self.seen * 1e3:.1f}ms per image with overlapped stages"
+                )
         if self.args.save or self.args.save_txt or self.args.save_crop:
             nl = len(list(self.save_dir.glob("labels/*.txt")))  # number of labels
             s = f"\n{nl} label{'s' * (nl > 1)} saved to {self.save_dir / 'labels'}" if self.args.save_txt else ""
             LOGGER.info(f"Results saved to {colorstr('bold', self.save_dir)}{s}")
         self.run_callbacks("on_predict_end")
 
+    def pipelined_batches(self, profilers, *args, **kwargs):
+        """
+        Yield inferred batches while preprocessing and inference run in background threads.
+
+        Batch N+1 is preprocessed while batch N is inferred and batch N-1 is post-processed by the caller. Bounded
+        FIFO queues between the stages keep the original batch order. Backends with a pool of infer requests (OpenVINO
+        with a THROUGHPUT hint) only submit batches in the inference thread, the caller waits for their outputs, so
+        several batches are inferred at once. Since inference runs ahead of post-processing, the `forward_state` set by
+        forward hooks in the inference thread, such as the neck features used by BoT-SORT ReID, is carried with its
+        batch and restored in the caller's thread. So is the dataset frame count read with the batch, which the dataset
+        itself is already ahead of.
+
+        Args:
+            profilers (tuple): Preprocess, inference and postprocess Profile objects.
+            *args (Any): Additional arguments for the inference method.
+            **kwargs (Any): Additional keyword arguments for the inference method.
+
+        Yields:
+            (tuple): Batch, preprocessed images, raw predictions, a list with preprocess and inference times and the
+                forward state of the batch.
+        """
+        stop = threading.Event()
+        pre_q, inf_q = queue.Queue(maxsize=2), queue.Queue(maxsize=2)
+        if getattr(self.model, "io_binding", None) is not None:
+            # Outputs written into reused buffers must outlive the queued, post-processed and running batches
+            self.model.io_binding.buffers = inf_q.maxsize + 2
+        submit = getattr(self.model, "ov_pool", None) is not None and type(self).inference is BasePredictor.inference
+
+        def put(q, item):
+            """Put an item unless the pipeline is stopped, returning False if it was."""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(q):
+            """Get the next item, returning None once the pipeline is stopped."""
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            return None
+
+        @smart_inference_mode()  # inference mode is thread-local
+        def preprocess_worker():
+            """Preprocess every dataset batch and hand it to the inference worker."""
+            try:
+                for batch in self.dataset:
+                    with profilers[0]:
+                        im = self.preprocess(batch[1])
+                    if not put(pre_q, (batch, im, profilers[0].dt, getattr(self.dataset, "count", None))):
+                        return
+                put(pre_q, None)
+            except Exception as e:
+                put(pre_q, e)
+
+        @smart_inference_mode()
+        def inference_worker():
+            """Run inference on preprocessed batches and hand them to the caller."""
+            try:
+                while (item := get(pre_q)) is not None and not isinstance(item, Exception):
+                    batch, im, dt, count = item
+                    with profilers[1]:
+                        preds = self.model.forward_async(im) if submit else self.inference(im, *args, **kwargs)
+                    state = dict(vars(self.forward_state), count=count)  # set by forward hooks of this batch, if any
+                    if not put(inf_q, (batch, im, preds, [dt, profilers[1].dt], state)):
+                        return
+                put(inf_q, item)  # forward end-of-stream or preprocess error
+            except Exception as e:
+                put(inf_q, e)
+
+        workers = [threading.Thread(target=f, daemon=True) for f in (preprocess_worker, inference_worker)]
+        for w in workers:
+            w.start()
+        try:
+            while (item := get(inf_q)) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                if submit:
+                    batch, im, wait, dt, state = item
+                    t0 = time.perf_counter()
+                    item = batch, im, wait(), [dt[0], dt[1] + time.perf_counter() - t0], state
+                yield item
+        finally:
+            stop.set()
+            for w in workers:  # daemon workers blocked in a stalled source read exit with the source or the process
+                w.join(timeout=1.0)
+
     def setup_model(self, model, verbose=True):
         """
         Initialize YOLO model with given parameters and set it to evaluation mode.
@@ -384,10 +581,19 @@ class BasePredictor:
             batch=self.args.batch,
             fuse=True,
             verbose=verbose,
+            session_options={
+                "intra_op_num_threads": self.args.ort_intra_threads,
+                "inter_op_num_threads": self.args.ort_inter_threads,
+                "execution_mode": self.args.ort_execution_mode,
+                "graph_optimization_level": self.args.ort_optimization,
+            },
+            performance_hint=self.args.ov_hint,
+            compile_cache=self.args.compile_cache,
         )
 
         self.device = self.model.device  # update device
         self.args.half = self.model.fp16  # update half
+        self.fused_letterbox = None  # rebuilt for the new device and precision
         self.model.eval()
 
     def write_results(self, i, p, im, s):
@@ -408,7 +614,7 @@ class BasePredictor:
             im = im[None]  # expand for batch dim
         if self.source_type.stream or self.source_type.from_img or self.source_type.tensor:  # batch_size >= 1
             string += f"{i}: "
-            frame = self.dataset.count
+            frame = getattr(self.forward_state, "count", self.dataset.count)  # dataset count when the batch was read
         else:
             match = re.search(r"frame (\d+)/", s[i])
             frame = int(match[1]) if match else None  # 0 if frame undetermined
@@ -493,3 +699,46 @@ class BasePredictor:
     def add_callback(self, event: str, func):
         """Add a callback function for a specific event."""
         self.callbacks[event].append(func)
+
+
+class PredictorSession:
+    """
+    Persistent single-frame inference session bound to a predictor.
+
+    The session sets up the predictor and warms the model up once, then runs preprocess, inference and postprocess
+    directly on each frame without building a data source, which removes most of the per-call Python overhead of
+    Model.predict() in tight loops with small models.
+
+    Attributes:
+        predictor (BasePredictor): The predictor running the inference.
+        raw (bool): Whether calls return NumPy arrays instead of Results objects.
+
+    Examples:
+        >>> from ultralytics import YOLO
+        >>> session = YOLO("yolo11n.pt").predict_session(imgsz=128, raw=True)
+        >>> boxes = session(frame)[0]  # (N, 6) array of [x1, y1, x2, y2, conf, cls]
+    """
+
+    def __init__(self, predictor, raw=False):
+        """
+        Initialize the session and set up the predictor.
+
+        Args:
+            predictor (BasePredictor): Predictor with its arguments already configured.
+            raw (bool): Return per-image NumPy arrays instead of Results objects.
+        """
+        self.predictor = predictor
+        self.raw = raw
+        predictor.setup_session()
+
+    def __call__(self, frames):
+        """
+        Run inference on one frame or a list of frames.
+
+        Args:
+            frames (np.ndarray | List[np.ndarray]): HWC BGR image(s).
+
+        Returns:
+            (List[ultralytics.engine.results.Results] | List[np.ndarray]): One output per frame.
+        """
+        return self.predictor.predict_frames(frames, raw=self.raw)
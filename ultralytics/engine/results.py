@@ -5,6 +5,8 @@ Ultralytics Results, Boxes and Masks classes for handling inference results.
 Usage: See https://docs.ultralytics.com/modes/predict/
 """
 
+import queue
+import threading
 from copy import deepcopy
 from functools import lru_cache
 from pathlib import Path
@@ -18,6 +20,22 @@ from ultralytics.utils.checks import check_requirements
 from ultralytics.utils.plotting import Annotator, colors, save_one_box
 from ultralytics.utils.torch_utils import smart_inference_mode
 
+# Columnar layout of Results.to_records() and ResultsSink, one row per detection (track_id is -1 when not tracking)
+RECORD_DTYPE = np.dtype(
+    [
+        ("frame", "i8"),
+        ("path", "O"),
+        ("class", "i4"),
+        ("name", "O"),
+        ("confidence", "f4"),
+        ("x1", "f4"),
+        ("y1", "f4"),
+        ("x2", "f4"),
+        ("y2", "f4"),
+        ("track_id", "i8"),
+    ]
+)
+
 
 class BaseTensor(SimpleClass):
     """
@@ -28,6 +46,7 @@ class BaseTensor(SimpleClass):
         orig_shape (Tuple[int, int]): Original shape of the image, typically in the format (height, width).
 
     Methods:
+        prefetch: Start a non-blocking copy of CUDA data into pinned host memory for later cpu() calls.
         cpu: Return a copy of the tensor stored in CPU memory.
         numpy: Returns a copy of the tensor as a numpy array.
         cuda: Moves the tensor to GPU memory, returning a new instance if necessary.
@@ -60,6 +79,29 @@ class BaseTensor(SimpleClass):
         assert isinstance(data, (torch.Tensor, np.ndarray)), "data must be torch.Tensor or np.ndarray"
         self.data = data
         self.orig_shape = orig_shape
+        self._host = None  # pinned host copy started by prefetch()
+        self._host_ready = None  # CUDA event recorded after the host copy
+
+    def prefetch(self):
+        """
+        Starts a non-blocking copy of CUDA data into pinned host memory.
+
+        The copy is queued on the current CUDA stream without synchronizing it. A later cpu() call waits for this
+        copy only and reuses it instead of issuing its own blocking transfer. No-op for CPU tensors and numpy arrays.
+
+        Returns:
+            (BaseTensor): The same instance, to allow chaining.
+
+        Examples:
+            >>> base_tensor = BaseTensor(torch.rand(10, 6).cuda(), orig_shape=(720, 1280))
+            >>> cpu_tensor = base_tensor.prefetch().cpu()  # waits for the copy started by prefetch()
+        """
+        if self._host is None and isinstance(self.data, torch.Tensor) and self.data.is_cuda:
+            self._host = torch.empty(self.data.shape, dtype=self.data.dtype, pin_memory=True)
+            self._host.copy_(self.data, non_blocking=True)
+            self._host_ready = torch.cuda.Event()
+            self._host_ready.record()
+        return self
 
     @property
     def shape(self):
@@ -93,7 +135,12 @@ class BaseTensor(SimpleClass):
             >>> cpu_tensor.data.device
             device(type='cpu')
         """
-        return self if isinstance(self.data, np.ndarray) else self.__class__(self.data.cpu(), self.orig_shape)
+        if isinstance(self.data, np.ndarray):
+            return self
+        if self._host is not None:
+            self._host_ready.synchronize()  # waits for the prefetched copy only, not for later queued work
+            return self.__class__(self._host, self.orig_shape)
+        return self.__class__(self.data.cpu(), self.orig_shape)
 
     def numpy(self):
         """
@@ -224,6 +271,7 @@ class Results(SimpleClass):
         to_xml: Converts detection results to XML format.
         to_html: Converts detection results to HTML format.
         to_sql: Converts detection results to an SQL-compatible format.
+        to_records: Converts detection results to a NumPy structured array with one row per detection.
 
     Examples:
         >>> results = model("path/to/image.jpg")
@@ -370,6 +418,27 @@ class Results(SimpleClass):
                 setattr(r, k, getattr(v, fn)(*args, **kwargs))
         return r
 
+    def prefetch(self):
+        """
+        Starts non-blocking copies of all CUDA tensors of the Results object into pinned host memory.
+
+        The results stay on the device; later calls to cpu(), summary(), to_json() or save_txt() reuse the host
+        copies instead of synchronizing the CUDA stream once per transfer. Called by predictors after postprocessing
+        when `prefetch_results=True`.
+
+        Returns:
+            (Results): The same Results object, to allow chaining.
+
+        Examples:
+            >>> results = model("path/to/image.jpg", device=0)
+            >>> cpu_result = results[0].prefetch().cpu()
+        """
+        for k in self._keys:
+            v = getattr(self, k)
+            if v is not None:
+                v.prefetch()
+        return self
+
     def cpu(self):
         """
         Returns a copy of the Results object with all its tensors moved to CPU memory.
@@ -703,9 +772,10 @@ class Results(SimpleClass):
         """
         is_obb = self.obb is not None
         boxes = self.obb if is_obb else self.boxes
+        boxes = boxes and boxes.cpu()  # one device to host copy instead of one per row
         masks = self.masks
         probs = self.probs
-        kpts = self.keypoints
+        kpts = self.keypoints and self.keypoints.cpu()
         texts = []
         if probs is not None:
             # Classify
@@ -803,25 +873,28 @@ class Results(SimpleClass):
             return results
 
         is_obb = self.obb is not None
-        data = self.obb if is_obb else self.boxes
+        data = (self.obb if is_obb else self.boxes).cpu()  # one device to host copy instead of one per row
+        kpts = None if self.keypoints is None else self.keypoints.cpu().data
         h, w = self.orig_shape if normalize else (1, 1)
-        for i, row in enumerate(data):  # xyxy, track_id if tracking, conf, class_id
-            class_id, conf = int(row.cls), round(row.conf.item(), decimals)
-            box = (row.xyxyxyxy if is_obb else row.xyxy).squeeze().reshape(-1, 2).tolist()
+        boxes = (data.xyxyxyxy if is_obb else data.xyxy).reshape(-1, 4 if is_obb else 2, 2).tolist()
+        classes, confs = data.cls.tolist(), data.conf.tolist()
+        ids = data.id.tolist() if data.is_track else None
+        for i, box in enumerate(boxes):  # xyxy, track_id if tracking, conf, class_id
+            class_id, conf = int(classes[i]), round(confs[i], decimals)
             xy = {}
             for j, b in enumerate(box):
                 xy[f"x{j + 1}"] = round(b[0] / w, decimals)
                 xy[f"y{j + 1}"] = round(b[1] / h, decimals)
             result = {"name": self.names[class_id], "class": class_id, "confidence": conf, "box": xy}
             if data.is_track:
-                result["track_id"] = int(row.id.item())  # track ID
+                result["track_id"] = int(ids[i])  # track ID
             if self.masks:
                 result["segments"] = {
                     "x": (self.masks.xy[i][:, 0] / w).round(decimals).tolist(),
                     "y": (self.masks.xy[i][:, 1] / h).round(decimals).tolist(),
                 }
-            if self.keypoints is not None:
-                x, y, visible = self.keypoints[i].data[0].cpu().unbind(dim=1)  # torch Tensor
+            if kpts is not None:
+                x, y, visible = kpts[i].unbind(dim=1)  # torch Tensor
                 result["keypoints"] = {
                     "x": (x / w).numpy().round(decimals).tolist(),  # decimals named argument required
                     "y": (y / h).numpy().round(decimals).tolist(),
@@ -1019,17 +1092,19 @@ class Results(SimpleClass):
         cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({columns})")
 
         # Insert data into the table
-        for item in data:
-            cursor.execute(
-                f"INSERT INTO {table_name} (class_name, confidence, box, masks, kpts) VALUES (?, ?, ?, ?, ?)",
+        cursor.executemany(
+            f"INSERT INTO {table_name} (class_name, confidence, box, masks, kpts) VALUES (?, ?, ?, ?, ?)",
+            [
                 (
                     item.get("name"),
                     item.get("confidence"),
                     json.dumps(item.get("box", {})),
                     json.dumps(item.get("segments", {})),
                     json.dumps(item.get("keypoints", {})),
-                ),
-            )
+                )
+                for item in data
+            ],
+        )
 
         # Commit and close the connection
         conn.commit()
@@ -1037,6 +1112,54 @@ class Results(SimpleClass):
 
         LOGGER.info(f"✅ Detection results successfully written to SQL table '{table_name}' in database '{db_path}'.")
 
+    def to_records(self, normalize=False, frame=0):
+        """
+        Converts detection results to a NumPy structured array with one row per detection.
+
+        Unlike summary(), no per-detection dictionaries are built: the boxes are copied to the host once and every
+        column is filled with a single vectorized assignment. Oriented boxes are stored as their axis-aligned xyxy
+        bounds, classification results as one row with the top-1 class and NaN box coordinates. Masks and keypoints
+        are not included.
+
+        Args:
+            normalize (bool): Whether to normalize the box coordinates by the image dimensions.
+            frame (int): Value of the `frame` column, e.g. the index of the image in a dataset.
+
+        Returns:
+            (np.ndarray): Structured array with dtype RECORD_DTYPE.
+
+        Examples:
+            >>> results = model("path/to/image.jpg")
+            >>> records = results[0].to_records()
+            >>> print(records["confidence"], records["name"])
+        """
+        if self.probs is not None:
+            records = np.zeros(1, dtype=RECORD_DTYPE)
+            records["class"] = self.probs.top1
+            records["confidence"] = self.probs.top1conf.item()
+            records["x1"] = records["y1"] = records["x2"] = records["y2"] = np.nan
+            records["track_id"] = -1
+        else:
+            data = self.obb if self.obb is not None else self.boxes
+            if data is None:
+                return np.zeros(0, dtype=RECORD_DTYPE)
+            data = data.cpu().numpy()  # one device to host copy for all columns
+            boxes = data.xyxy
+            if normalize:
+                h, w = self.orig_shape
+                boxes = boxes / np.array([w, h, w, h], dtype=np.float32)
+            records = np.zeros(len(data), dtype=RECORD_DTYPE)
+            records["class"] = data.cls
+            records["confidence"] = data.conf
+            records["x1"], records["y1"], records["x2"], records["y2"] = boxes.T
+            records["track_id"] = data.id if data.is_track else -1
+        names = np.empty(max(self.names, default=-1) + 1, dtype=object)
+        names[list(self.names)] = list(self.names.values())
+        records["name"] = names[records["class"]]
+        records["frame"] = frame
+        records["path"] = self.path
+        return records
+
 
 class Boxes(BaseTensor):
     """
@@ -1841,3 +1964,206 @@ class OBB(BaseTensor):
             if isinstance(x, torch.Tensor)
             else np.stack([x.min(1), y.min(1), x.max(1), y.max(1)], -1)
         )
+
+
+class ResultsSink:
+    """
+    Columnar writer that appends batches of Results to a Parquet, Feather or SQLite file.
+
+    Each appended batch is converted with Results.to_records() instead of per-detection dictionaries. Rows are
+    buffered and handed to a background thread every `flush_rows` rows, so inference continues while earlier rows
+    are written. Arrow formats keep one file writer open for the whole run, SQLite keeps one connection open and
+    inserts each flush with a single executemany() transaction. Parquet and Feather files are overwritten, SQLite rows
+    are appended to the table.
+
+    Attributes:
+        file (Path): Output file.
+        format (str): One of 'parquet', 'feather' or 'sqlite'.
+        table_name (str): SQLite table name.
+        normalize (bool): Whether box coordinates are normalized by the image dimensions.
+        flush_rows (int): Number of buffered rows that triggers a write.
+        frames (int): Number of images appended so far, stored in the `frame` column.
+
+    Methods:
+        append: Appends a Results object or a batch of Results.
+        flush: Writes all buffered rows and waits until they are on disk.
+        close: Flushes and closes the output file.
+
+    Examples:
+        >>> with ResultsSink("detections.parquet") as sink:
+        ...     for result in model.predict("path/to/images", stream=True):
+        ...         sink.append(result)
+    """
+
+    FORMATS = {
+        ".parquet": "parquet",
+        ".feather": "feather",
+        ".arrow": "feather",
+        ".db": "sqlite",
+        ".sqlite": "sqlite",
+        ".sqlite3": "sqlite",
+    }
+
+    def __init__(self, file, format=None, table_name="results", normalize=False, flush_rows=65536, background=True):
+        """
+        Initialize the sink, the output file is created by the first write.
+
+        Args:
+            file (str | Path): Output file.
+            format (str | None): One of 'parquet', 'feather' or 'sqlite', inferred from the file suffix if None.
+            table_name (str): SQLite table name, created if it does not exist.
+            normalize (bool): Whether to normalize box coordinates by the image dimensions.
+            flush_rows (int): Number of buffered rows that triggers a write.
+            background (bool): Whether to write in a background thread instead of in the calling thread.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        self.file = Path(file)
+        self.format = format or self.FORMATS.get(self.file.suffix.lower())
+        if self.format not in set(self.FORMATS.values()):
+            raise ValueError(
+                f"Unsupported format '{self.format}' for '{file}', valid formats are parquet, feather or sqlite"
+            )
+        if self.format != "sqlite":
+            check_requirements("pyarrow")
+        self.table_name = table_name
+        self.normalize = normalize
+        self.flush_rows = flush_rows
+        self.frames = 0
+        self._pending, self._pending_rows = [], 0
+        self._writer = None  # Arrow writer or SQLite connection, owned by the writing thread
+        self._error = None
+        self._queue = queue.Queue(maxsize=2) if background else None  # bounds the rows held in memory
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._run, name="ResultsSink", daemon=True)
+            self._thread.start()
+
+    def append(self, results):
+        """
+        Appends a Results object or a batch of Results, one `frame` index per image.
+
+        Args:
+            results (Results | List[Results]): Results to append.
+        """
+        if isinstance(results, Results):
+            results = [results]
+        for r in results:
+            records = r.to_records(normalize=self.normalize, frame=self.frames)
+            self.frames += 1
+            self._pending.append(records)
+            self._pending_rows += len(records)
+        if self._pending_rows >= self.flush_rows:
+            self._submit()
+
+    def flush(self):
+        """Writes all buffered rows and waits until they are on disk."""
+        self._submit()
+        if self._queue is not None:
+            self._queue.join()
+        self._raise()
+
+    def close(self):
+        """Flushes the buffered rows and closes the output file, the sink cannot be used afterwards."""
+        try:
+            self._submit()
+        finally:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+            else:
+                self._close_writer()
+        self._raise()
+
+    def __enter__(self):
+        """Return the sink for use in a with statement."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the sink when leaving a with statement."""
+        self.close()
+
+    def _raise(self):
+        """Re-raise the first error of the writing thread in the calling thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _submit(self):
+        """Concatenate the buffered rows and write them, or queue them for the background thread."""
+        if not self._pending:
+            return
+        records = np.concatenate(self._pending)
+        self._pending, self._pending_rows = [], 0
+        if self._queue is None:
+            self._write(records)
+        else:
+            self._raise()
+            self._queue.put(records)  # blocks while two flushes are already waiting
+
+    def _run(self):
+        """Write queued record arrays until the None sentinel arrives, then close the output file."""
+        while True:
+            records = self._queue.get()
+            try:
+                if records is None:
+                    self._close_writer()
+                    return
+                if self._error is None:
+                    self._write(records)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _write(self, records):
+        """Write one structured array with RECORD_DTYPE, opening the output file on first use."""
+        if self.format == "sqlite":
+            import sqlite3
+
+            if self._writer is None:
+                self._writer = sqlite3.connect(self.file)
+                columns = "frame INTEGER, path TEXT, class INTEGER, name TEXT, confidence REAL, "
+                columns += "x1 REAL, y1 REAL, x2 REAL, y2 REAL, track_id INTEGER"
+                self._writer.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} ({columns})")
+            with self._writer:  # one transaction per flush
+                placeholders = ", ".join("?" * len(RECORD_DTYPE.names))
+                self._writer.executemany(f"INSERT INTO {self.table_name} VALUES ({placeholders})", records.tolist())
+            return
+
+        import pyarrow as pa  # scope for faster 'import ultralytics'
+
+        schema = pa.schema(
+            [
+                ("frame", pa.int64()),
+                ("path", pa.string()),
+                ("class", pa.int32()),
+                ("name", pa.string()),
+                ("confidence", pa.float32()),
+                ("x1", pa.float32()),
+                ("y1", pa.float32()),
+                ("x2", pa.float32()),
+                ("y2", pa.float32()),
+                ("track_id", pa.int64()),
+            ]
+        )
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(np.ascontiguousarray(records[k]), type=schema.field(k).type) for k in RECORD_DTYPE.names],
+            schema=schema,
+        )
+        if self._writer is None:
+            if self.format == "parquet":
+                import pyarrow.parquet as pq
+
+                self._writer = pq.ParquetWriter(self.file, schema)
+            else:
+                self._writer = pa.ipc.new_file(self.file, schema)  # Feather V2 is the Arrow IPC file format
+        self._writer.write_batch(batch)
+
+    def _close_writer(self):
+        """Close the Arrow writer or SQLite connection opened by _write()."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
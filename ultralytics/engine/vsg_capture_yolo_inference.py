@@ -5,11 +5,25 @@ for GStreamer streaming.
 """
 
 import struct
+import time
+from typing import List, Tuple, Union
+
+import numpy as np
+
 from ultralytics import YOLO
-from typing import List, Tuple
 
 DetectType = Tuple[float, Tuple[int, int, int, int]]
 
+# One wire record per detection, laid out exactly like struct.pack('B4H', ...) in native mode:
+# uint8 confidence, one alignment pad byte, uint16 x1, y1, x2, y2
+META_DTYPE = np.dtype([('conf', 'u1'), ('box', 'u2', (4,))], align=True)
+
+# Versioned header: 2-byte magic, uint8 version, uint8 record size, uint16 number of detections
+META_MAGIC = b'VM'
+META_VERSION = 1
+META_HEADER = struct.Struct('2sBBH')
+
+
 class YoloInference:
     """
     Encapsulates YOLO model loading and inference logic.
@@ -25,6 +39,17 @@ class YoloInference:
         self.model = YOLO(model_path)
         self.img_size = img_size
         self.conf_threshold = conf_threshold
+        # Persistent session: args, model setup and warmup are bound once instead of on every predict() call
+        self.session = self.model.predict_session(
+            imgsz=img_size, conf=conf_threshold, classes=[0], raw=True
+        )
+
+    def _predict(self, frame) -> np.ndarray:
+        """
+        Run the model and return the detections as one (N, 6) float array
+        of [x1, y1, x2, y2, conf, cls], transferred from the device in a single copy.
+        """
+        return self.session(frame)[0]
 
     def run(self, frame) -> List[DetectType]:
         """
@@ -32,33 +57,98 @@ class YoloInference:
         :param frame: Input frame in BGR format.
         :return: List of tuples (confidence, (x1, y1, x2, y2)).
         """
-        results = self.model.predict(
-            frame, imgsz=self.img_size,
-            conf=self.conf_threshold, classes=[0]
-        )
-        detections: List[DetectType] = []
-        for r in results:
-            for det in r.boxes:
-                x1, y1, x2, y2 = det.xyxy[0].int().tolist()
-                score = float(det.conf[0])
-                detections.append((score, (x1, y1, x2, y2)))
-        return detections
+        data = self._predict(frame)
+        boxes = data[:, :4].astype(np.int32).tolist()  # truncates like Tensor.int()
+        scores = data[:, -2].tolist()
+        return [(score, tuple(box)) for score, box in zip(scores, boxes)]
+
+    def run_array(self, frame) -> np.ndarray:
+        """
+        Run inference on a single frame and return the detections as a
+        structured array with META_DTYPE, ready for pack_metadata().
+        :param frame: Input frame in BGR format.
+        :return: Structured array of (conf, box) records.
+        """
+        data = self._predict(frame)
+        return self._to_records(data[:, -2], data[:, :4])
 
     @staticmethod
-    def pack_metadata(detections: List[DetectType]) -> bytes:
+    def _to_records(scores, boxes) -> np.ndarray:
+        """
+        Quantize confidences and box coordinates into wire records.
+        :param scores: (N,) confidences in [0, 1].
+        :param boxes: (N, 4) xyxy pixel coordinates.
+        :return: Structured array with META_DTYPE.
+        """
+        records = np.zeros(len(scores), dtype=META_DTYPE)  # zeroed so pad bytes match struct
+        if len(records):
+            # float64 product and truncation reproduce min(int(score * 255), 255) exactly
+            records['conf'] = np.minimum((np.asarray(scores, dtype=np.float64) * 255).astype(np.int64), 255)
+            records['box'] = np.asarray(boxes).astype(np.int32)
+        return records
+
+    @staticmethod
+    def pack_metadata(detections: Union[List[DetectType], np.ndarray], version: int = 0) -> bytes:
         """
         Pack detection metadata into bytes for UDP streaming.
-        Format:
+        Format (version 0):
         - uint16 number of detections (native endian)
         - For each detection:
           - uint8 confidence (0-255, native endian)
+          - one pad byte
           - uint16 x1, y1, x2, y2 (native endian)
-        :param detections: List of detection tuples.
+        Version 1 replaces the leading count with META_HEADER
+        (magic, version, record size, count); records are unchanged.
+        :param detections: List of detection tuples or META_DTYPE records from run_array().
+        :param version: Wire format version, 0 for the legacy headerless format.
         :return: Byte string containing packed metadata.
         """
+        if not isinstance(detections, np.ndarray):
+            boxes = [box for _, box in detections]
+            detections = YoloInference._to_records([score for score, _ in detections], np.reshape(boxes, (-1, 4)))
         # Use native host byte order (little-endian on x86 and Renesas)
-        buf = struct.pack('H', len(detections))
-        for score, (x1, y1, x2, y2) in detections:
+        if version == 0:
+            header = struct.pack('H', len(detections))
+        elif version == META_VERSION:
+            header = META_HEADER.pack(META_MAGIC, META_VERSION, META_DTYPE.itemsize, len(detections))
+        else:
+            raise ValueError(f'Unsupported metadata version {version}')
+        return header + detections.astype(META_DTYPE, copy=False).tobytes()
+
+
+def benchmark_pack_metadata(n: int = 300, iterations: int = 1000) -> None:
+    """
+    Compare the per-detection struct loop with the vectorized pack_metadata
+    on a crowded scene and check that both produce identical bytes.
+    :param n: Number of detections per frame.
+    :param iterations: Number of timed packs per implementation.
+    """
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 1800, (n, 2))
+    boxes = np.concatenate([xy, xy + rng.uniform(1, 100, (n, 2))], 1).astype(np.float32)
+    scores = rng.uniform(0.25, 1.0, n).astype(np.float32)
+    detections = [(float(s), tuple(b)) for s, b in zip(scores, boxes.astype(np.int32).tolist())]
+
+    def pack_loop(dets):
+        buf = struct.pack('H', len(dets))
+        for score, (x1, y1, x2, y2) in dets:
             c = min(int(score * 255), 255)
             buf += struct.pack('B4H', c, x1, y1, x2, y2)
         return buf
+
+    records = YoloInference._to_records(scores, boxes)
+    assert pack_loop(detections) == YoloInference.pack_metadata(records) == YoloInference.pack_metadata(detections)
+    for label, fn, arg in (
+        ('struct loop', pack_loop, detections),
+        ('records', YoloInference.pack_metadata, records),
+        ('records+convert', lambda s_b: YoloInference.pack_metadata(YoloInference._to_records(*s_b)),
+         (scores, boxes)),
+    ):
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            fn(arg)
+        print(f'{label:>16}: {(time.perf_counter() - t0) / iterations * 1e6:.1f} us/frame ({n} detections)')
+
+
+if __name__ == '__main__':
+    benchmark_pack_metadata()
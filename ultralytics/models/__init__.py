@@ -1,9 +1,37 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-from .fastsam import FastSAM
-from .nas import NAS
-from .rtdetr import RTDETR
-from .sam import SAM
-from .yolo import YOLO, YOLOWorld
+import importlib
+from typing import TYPE_CHECKING
+
+# Model classes imported on first access (PEP 562), so using YOLO does not import SAM, RT-DETR or NAS
+_LAZY_ATTRS = {
+    "YOLO": ".yolo",
+    "YOLOWorld": ".yolo",
+    "RTDETR": ".rtdetr",
+    "SAM": ".sam",
+    "FastSAM": ".fastsam",
+    "NAS": ".nas",
+}
+
+if TYPE_CHECKING:
+    from .fastsam import FastSAM
+    from .nas import NAS
+    from .rtdetr import RTDETR
+    from .sam import SAM
+    from .yolo import YOLO, YOLOWorld
 
 __all__ = "YOLO", "RTDETR", "SAM", "FastSAM", "NAS", "YOLOWorld"  # allow simpler import
+
+
+def __getattr__(name):
+    """Import a model class from its subpackage on first access."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazily imported model classes in dir()."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -23,11 +23,14 @@ from ultralytics.utils.torch_utils import select_device, smart_inference_mode
 from .amg import (
     batch_iterator,
     batched_mask_to_box,
+    batched_remove_small_regions,
     build_all_layer_point_grids,
     calculate_stability_score,
     generate_crop_boxes,
     is_box_near_crop_edge,
-    remove_small_regions,
+    mask_to_rle,
+    rle_to_mask,
+    rle_to_string,
     uncrop_boxes_xyxy,
     uncrop_masks,
 )
@@ -307,12 +310,15 @@ class Predictor(BasePredictor):
         stability_score_thresh=0.95,
         stability_score_offset=0.95,
         crop_nms_thresh=0.7,
+        rle=False,
     ):
         """
         Perform image segmentation using the Segment Anything Model (SAM).
 
         This method segments an entire image into constituent parts by leveraging SAM's advanced architecture
         and real-time performance capabilities. It can optionally work on image crops for finer segmentation.
+        With rle=True masks are run-length encoded as soon as each point batch passes the quality, stability and
+        crop edge filters, and NMS runs on their boxes, so only one batch of dense masks is held at a time.
 
         Args:
             im (torch.Tensor): Input tensor representing the preprocessed image with shape (N, C, H, W).
@@ -326,9 +332,10 @@ class Predictor(BasePredictor):
             stability_score_thresh (float): Stability threshold [0,1] for mask filtering based on stability.
             stability_score_offset (float): Offset value for calculating stability score.
             crop_nms_thresh (float): IoU cutoff for NMS to remove duplicate masks between crops.
+            rle (bool): Return uncompressed COCO run-length encodings (see mask_to_rle()) instead of dense masks.
 
         Returns:
-            pred_masks (torch.Tensor): Segmented masks with shape (N, H, W).
+            pred_masks (torch.Tensor | List[dict]): Segmented masks with shape (N, H, W), or N run-length encodings.
             pred_scores (torch.Tensor): Confidence scores for each mask with shape (N,).
             pred_bboxes (torch.Tensor): Bounding boxes for each mask with shape (N, 4).
 
@@ -357,10 +364,10 @@ class Predictor(BasePredictor):
             crop_masks, crop_scores, crop_bboxes = [], [], []
             for (points,) in batch_iterator(points_batch_size, points_for_image):
                 pred_mask, pred_score = self.prompt_inference(crop_im, points=points, multimask_output=True)
-                # Interpolate predicted masks to input size
-                pred_mask = F.interpolate(pred_mask[None], (h, w), mode="bilinear", align_corners=False)[0]
-                idx = pred_score > conf_thres
+                idx = pred_score > conf_thres  # filter before upsampling, scores do not depend on mask size
                 pred_mask, pred_score = pred_mask[idx], pred_score[idx]
+                # Interpolate predicted masks to input size
+                pred_mask = F.interpolate(pred_mask[:, None], (h, w), mode="bilinear", align_corners=False)[:, 0]
 
                 stability_score = calculate_stability_score(
                     pred_mask, self.model.mask_threshold, stability_score_offset
@@ -375,17 +382,22 @@ class Predictor(BasePredictor):
                 if not torch.all(keep_mask):
                     pred_bbox, pred_mask, pred_score = pred_bbox[keep_mask], pred_mask[keep_mask], pred_score[keep_mask]
 
-                crop_masks.append(pred_mask)
+                if rle:  # encode now, dense masks of this batch are freed before the next one
+                    crop_masks.extend(mask_to_rle(uncrop_masks(pred_mask, crop_region, ih, iw)))
+                else:
+                    crop_masks.append(pred_mask)
                 crop_bboxes.append(pred_bbox)
                 crop_scores.append(pred_score)
 
             # Do nms within this crop
-            crop_masks = torch.cat(crop_masks)
             crop_bboxes = torch.cat(crop_bboxes)
             crop_scores = torch.cat(crop_scores)
             keep = torchvision.ops.nms(crop_bboxes, crop_scores, self.args.iou)  # NMS
             crop_bboxes = uncrop_boxes_xyxy(crop_bboxes[keep], crop_region)
-            crop_masks = uncrop_masks(crop_masks[keep], crop_region, ih, iw)
+            if rle:
+                crop_masks = [crop_masks[i] for i in keep.tolist()]
+            else:
+                crop_masks = uncrop_masks(torch.cat(crop_masks)[keep], crop_region, ih, iw)
             crop_scores = crop_scores[keep]
 
             pred_masks.append(crop_masks)
@@ -393,7 +405,7 @@ class Predictor(BasePredictor):
             pred_scores.append(crop_scores)
             region_areas.append(area.expand(len(crop_masks)))
 
-        pred_masks = torch.cat(pred_masks)
+        pred_masks = sum(pred_masks, []) if rle else torch.cat(pred_masks)
         pred_bboxes = torch.cat(pred_bboxes)
         pred_scores = torch.cat(pred_scores)
         region_areas = torch.cat(region_areas)
@@ -402,7 +414,8 @@ class Predictor(BasePredictor):
         if len(crop_regions) > 1:
             scores = 1 / region_areas
             keep = torchvision.ops.nms(pred_bboxes, scores, crop_nms_thresh)
-            pred_masks, pred_bboxes, pred_scores = pred_masks[keep], pred_bboxes[keep], pred_scores[keep]
+            pred_masks = [pred_masks[i] for i in keep.tolist()] if rle else pred_masks[keep]
+            pred_bboxes, pred_scores = pred_bboxes[keep], pred_scores[keep]
 
         return pred_masks, pred_scores, pred_bboxes
 
@@ -458,7 +471,8 @@ class Predictor(BasePredictor):
 
         Returns:
             results (List[Results]): List of Results objects containing detection masks, bounding boxes, and other
-                metadata for each processed image.
+                metadata for each processed image. For run-length encoded masks from generate(rle=True), masks is
+                None and Results.rles holds compressed COCO encodings at the original image size instead.
 
         Examples:
             >>> predictor = Predictor()
@@ -474,24 +488,51 @@ class Predictor(BasePredictor):
             orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)
 
         results = []
+        rle = isinstance(pred_masks, list)
         for masks, orig_img, img_path in zip([pred_masks], orig_imgs, self.batch[0]):
+            rles = [] if rle else None
             if len(masks) == 0:
-                masks, pred_bboxes = None, torch.zeros((0, 6), device=pred_masks.device)
+                masks, pred_bboxes = None, torch.zeros((0, 6), device=pred_scores.device)
             else:
-                masks = ops.scale_masks(masks[None].float(), orig_img.shape[:2], padding=False)[0]
-                masks = masks > self.model.mask_threshold  # to bool
+                if rle:
+                    masks, rles = None, self.scale_rles(masks, orig_img.shape[:2])
+                else:
+                    masks = ops.scale_masks(masks[None].float(), orig_img.shape[:2], padding=False)[0]
+                    masks = masks > self.model.mask_threshold  # to bool
                 if pred_bboxes is not None:
                     pred_bboxes = ops.scale_boxes(img.shape[2:], pred_bboxes.float(), orig_img.shape, padding=False)
                 else:
                     pred_bboxes = batched_mask_to_box(masks)
                 # NOTE: SAM models do not return cls info. This `cls` here is just a placeholder for consistency.
-                cls = torch.arange(len(pred_masks), dtype=torch.int32, device=pred_masks.device)
+                cls = torch.arange(len(pred_masks), dtype=torch.int32, device=pred_scores.device)
                 pred_bboxes = torch.cat([pred_bboxes, pred_scores[:, None], cls[:, None]], dim=-1)
             results.append(Results(orig_img, path=img_path, names=names, masks=masks, boxes=pred_bboxes))
+            if rle:
+                results[-1].rles = rles
         # Reset segment-all mode.
         self.segment_all = False
         return results
 
+    def scale_rles(self, rles, shape, batch_size=8):
+        """
+        Rescale run-length encoded masks from the input size to the original image size, as postprocess() does for
+        dense masks, decoding only batch_size masks at a time.
+
+        Args:
+            rles (List[dict]): Uncompressed COCO run-length encodings at the input size, from generate(rle=True).
+            shape (Tuple[int, int]): Height and width of the original image.
+            batch_size (int): Number of masks decoded and resized together.
+
+        Returns:
+            (List[dict]): Compressed COCO run-length encodings, {'size': [H, W], 'counts': str}, at the original size.
+        """
+        out = []
+        for (batch,) in batch_iterator(batch_size, rles):
+            masks = torch.from_numpy(np.stack([rle_to_mask(r) for r in batch])).to(self.device)
+            masks = ops.scale_masks(masks[None].float(), shape, padding=False)[0] > self.model.mask_threshold
+            out.extend(rle_to_string(r) for r in mask_to_rle(masks))
+        return out
+
     def setup_source(self, source):
         """
         Sets up the data source for inference.
@@ -574,7 +615,8 @@ class Predictor(BasePredictor):
 
         This function performs post-processing on segmentation masks generated by the Segment Anything Model (SAM).
         It removes small disconnected regions and holes from the input masks, and then performs Non-Maximum
-        Suppression (NMS) to eliminate any newly created duplicate boxes.
+        Suppression (NMS) to eliminate any newly created duplicate boxes. All masks are processed together with
+        one batched connected components pass per mode, see amg.batched_remove_small_regions().
 
         Args:
             masks (torch.Tensor): Segmentation masks to be processed, with shape (N, H, W) where N is the number of
@@ -599,23 +641,15 @@ class Predictor(BasePredictor):
             return masks
 
         # Filter small disconnected regions and holes
-        new_masks = []
-        scores = []
-        for mask in masks:
-            mask = mask.cpu().numpy().astype(np.uint8)
-            mask, changed = remove_small_regions(mask, min_area, mode="holes")
-            unchanged = not changed
-            mask, changed = remove_small_regions(mask, min_area, mode="islands")
-            unchanged = unchanged and not changed
-
-            new_masks.append(torch.as_tensor(mask).unsqueeze(0))
-            # Give score=0 to changed masks and 1 to unchanged masks so NMS prefers masks not needing postprocessing
-            scores.append(float(unchanged))
+        new_masks, holes_changed = batched_remove_small_regions(masks.cpu().numpy(), min_area, mode="holes")
+        new_masks, islands_changed = batched_remove_small_regions(new_masks, min_area, mode="islands")
+        # Give score=0 to changed masks and 1 to unchanged masks so NMS prefers masks not needing postprocessing
+        scores = torch.as_tensor(~(holes_changed | islands_changed), dtype=torch.float32)
 
         # Recalculate boxes and remove any new duplicates
-        new_masks = torch.cat(new_masks, dim=0)
+        new_masks = torch.from_numpy(new_masks)
         boxes = batched_mask_to_box(new_masks)
-        keep = torchvision.ops.nms(boxes.float(), torch.as_tensor(scores), nms_thresh)
+        keep = torchvision.ops.nms(boxes.float(), scores, nms_thresh)
 
         return new_masks[keep].to(device=masks.device, dtype=masks.dtype), keep
 
@@ -1,5 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import numpy as np
+
 from ultralytics.engine.predictor import BasePredictor
 from ultralytics.engine.results import Results
 from ultralytics.utils import ops
@@ -18,7 +20,10 @@ class DetectionPredictor(BasePredictor):
         batch (list): Batch of images and metadata for processing.
 
     Methods:
+        setup_model: Load the model, keeping NumPy outputs of exported models if numpy_postprocess is set.
         postprocess: Process raw model predictions into detection results.
+        postprocess_raw: Process raw model predictions into scaled NumPy arrays.
+        nms: Apply non-maximum suppression using the predictor arguments.
         construct_results: Build Results objects from processed predictions.
         construct_result: Create a single Result object from a prediction.
 
@@ -30,9 +35,84 @@ class DetectionPredictor(BasePredictor):
         >>> predictor.predict_cli()
     """
 
+    def setup_model(self, model, verbose=True):
+        """
+        Initialize the model, letting non-PyTorch backends return NumPy outputs when numpy_postprocess is set.
+
+        Detection outputs of ONNX, OpenVINO and other exported models are then filtered and scaled in NumPy, skipping
+        the conversion to torch tensors on every frame. Other tasks keep the torch postprocess.
+
+        Args:
+            model (str | Path | torch.nn.Module | None): Model to load or use.
+            verbose (bool): Whether to print verbose output.
+        """
+        super().setup_model(model, verbose)
+        self.model.numpy_outputs = bool(self.args.numpy_postprocess) and self.args.task == "detect"
+
     def postprocess(self, preds, img, orig_imgs, **kwargs):
         """Post-processes predictions and returns a list of Results objects."""
-        preds = ops.non_max_suppression(
+        preds = self.nms(preds)
+
+        if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
+            orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)
+
+        return self.construct_results(preds, img, orig_imgs, **kwargs)
+
+    def postprocess_raw(self, preds, img, orig_imgs):
+        """
+        Post-process predictions into NumPy arrays without constructing Results objects.
+
+        Args:
+            preds (torch.Tensor): Raw model predictions.
+            img (torch.Tensor): Preprocessed image batch.
+            orig_imgs (List[np.ndarray] | torch.Tensor): Original images.
+
+        Returns:
+            (List[np.ndarray]): Arrays of shape (N, 6) with [x1, y1, x2, y2, conf, cls] in original image pixels.
+        """
+        shapes = [x.shape for x in orig_imgs] if isinstance(orig_imgs, list) else [orig_imgs.shape[2:]] * len(img)
+        return [
+            pred if isinstance(pred, np.ndarray) else pred.cpu().numpy()
+            for pred in (self.scale_pred(pred, img, shape) for pred, shape in zip(self.nms(preds), shapes))
+        ]
+
+    def scale_pred(self, pred, img, orig_shape):
+        """
+        Rescale one image prediction from the inference shape to the original image shape.
+
+        Args:
+            pred (torch.Tensor | np.ndarray): Prediction of shape (N, 6+) after NMS.
+            img (torch.Tensor): Preprocessed image batch.
+            orig_shape (tuple): Original image shape (h, w) or (h, w, c).
+
+        Returns:
+            (torch.Tensor | np.ndarray): Scaled prediction of shape (N, 6).
+        """
+        pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_shape)
+        return pred[:, :6]
+
+    def nms(self, preds):
+        """
+        Apply non-maximum suppression to raw predictions using the predictor arguments.
+
+        Args:
+            preds (torch.Tensor | np.ndarray | tuple): Raw model predictions, NumPy outputs are filtered in NumPy.
+
+        Returns:
+            (List[torch.Tensor] | List[np.ndarray]): Filtered predictions, one (N, 6+) tensor per image.
+        """
+        if isinstance(preds[0] if isinstance(preds, (list, tuple)) else preds, np.ndarray):
+            return ops.non_max_suppression_numpy(
+                preds,
+                self.args.conf,
+                self.args.iou,
+                self.args.classes,
+                self.args.agnostic_nms,
+                max_det=self.args.max_det,
+                nc=len(self.model.names),
+                end2end=getattr(self.model, "end2end", False),
+            )
+        return ops.non_max_suppression(
             preds,
             self.args.conf,
             self.args.iou,
@@ -44,11 +124,6 @@ class DetectionPredictor(BasePredictor):
             rotated=self.args.task == "obb",
         )
 
-        if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
-            orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)
-
-        return self.construct_results(preds, img, orig_imgs, **kwargs)
-
     def construct_results(self, preds, img, orig_imgs):
         """
         Construct a list of Results objects from model predictions.
@@ -79,5 +154,5 @@ class DetectionPredictor(BasePredictor):
         Returns:
             (Results): Results object containing the original image, image path, class names, and scaled bounding boxes.
         """
-        pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
-        return Results(orig_img, path=img_path, names=self.model.names, boxes=pred[:, :6])
+        boxes = self.scale_pred(pred, img, orig_img.shape)
+        return Results(orig_img, path=img_path, names=self.model.names, boxes=boxes)
@@ -45,7 +45,20 @@ class OBBPredictor(DetectionPredictor):
         Returns:
             (Results): The result object containing the original image, image path, class names, and oriented bounding boxes.
         """
+        return Results(orig_img, path=img_path, names=self.model.names, obb=self.scale_pred(pred, img, orig_img.shape))
+
+    def scale_pred(self, pred, img, orig_shape):
+        """
+        Regularize and rescale one image prediction to the original image shape.
+
+        Args:
+            pred (torch.Tensor): Prediction of shape (N, 7) with [x, y, w, h, confidence, class_id, angle].
+            img (torch.Tensor): Preprocessed image batch.
+            orig_shape (tuple): Original image shape (h, w) or (h, w, c).
+
+        Returns:
+            (torch.Tensor): Oriented boxes of shape (N, 7) with [x, y, w, h, angle, confidence, class_id].
+        """
         rboxes = ops.regularize_rboxes(torch.cat([pred[:, :4], pred[:, -1:]], dim=-1))
-        rboxes[:, :4] = ops.scale_boxes(img.shape[2:], rboxes[:, :4], orig_img.shape, xywh=True)
-        obb = torch.cat([rboxes, pred[:, 4:6]], dim=-1)
-        return Results(orig_img, path=img_path, names=self.model.names, obb=obb)
+        rboxes[:, :4] = ops.scale_boxes(img.shape[2:], rboxes[:, :4], orig_shape, xywh=True)
+        return torch.cat([rboxes, pred[:, 4:6]], dim=-1)
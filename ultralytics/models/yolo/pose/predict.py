@@ -1,5 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import numpy as np
+
 from ultralytics.models.yolo.detect.predict import DetectionPredictor
 from ultralytics.utils import DEFAULT_CFG, LOGGER, ops
 
@@ -17,6 +19,7 @@ class PosePredictor(DetectionPredictor):
 
     Methods:
         construct_result: Constructs the result object from the prediction, including keypoints.
+        postprocess_raw: Process raw model predictions into scaled NumPy arrays, including keypoints.
 
     Examples:
         >>> from ultralytics.utils import ASSETS
@@ -60,3 +63,24 @@ class PosePredictor(DetectionPredictor):
         pred_kpts = ops.scale_coords(img.shape[2:], pred_kpts, orig_img.shape)
         result.update(keypoints=pred_kpts)
         return result
+
+    def postprocess_raw(self, preds, img, orig_imgs):
+        """
+        Post-process predictions into NumPy arrays, including keypoints, without constructing Results objects.
+
+        Args:
+            preds (torch.Tensor): Raw model predictions.
+            img (torch.Tensor): Preprocessed image batch.
+            orig_imgs (List[np.ndarray] | torch.Tensor): Original images.
+
+        Returns:
+            (List[np.ndarray]): Arrays of shape (N, 6+K*D) with [x1, y1, x2, y2, conf, cls] followed by the K keypoints
+                of D values each, coordinates in original image pixels.
+        """
+        shapes = [x.shape for x in orig_imgs] if isinstance(orig_imgs, list) else [orig_imgs.shape[2:]] * len(img)
+        out = []
+        for pred, shape in zip(self.nms(preds), shapes):
+            pred = pred if isinstance(pred, np.ndarray) else pred.cpu().numpy()
+            kpts = ops.scale_coords(img.shape[2:], pred[:, 6:].reshape(len(pred), *self.model.kpt_shape), shape)
+            out.append(np.concatenate([self.scale_pred(pred, img, shape), kpts.reshape(pred[:, 6:].shape)], axis=1))
+        return out
@@ -30,6 +30,8 @@ class SegmentationPredictor(DetectionPredictor):
         >>> predictor.predict_cli()
     """
 
+    postprocess_raw = None  # masks need their prototypes, so predict_session(raw=True) is not supported
+
     def __init__(self, cfg=DEFAULT_CFG, overrides=None, _callbacks=None):
         """Initialize the SegmentationPredictor with configuration, overrides, and callbacks."""
         super().__init__(cfg, overrides, _callbacks)
@@ -2,7 +2,9 @@
 
 import ast
 import json
+import os
 import platform
+import threading
 import zipfile
 from collections import OrderedDict, namedtuple
 from pathlib import Path
@@ -16,6 +18,8 @@ from PIL import Image
 from ultralytics.utils import ARM64, IS_JETSON, IS_RASPBERRYPI, LINUX, LOGGER, PYTHON_VERSION, ROOT, yaml_load
 from ultralytics.utils.checks import check_requirements, check_suffix, check_version, check_yaml, is_rockchip
 from ultralytics.utils.downloads import attempt_download_asset, is_url
+from ultralytics.utils.patches import torch_load, torch_save
+from ultralytics.utils.torch_utils import get_cpu_info
 
 
 def check_class_names(names):
@@ -47,6 +51,302 @@ def default_class_names(data=None):
     return {i: f"class{i}" for i in range(999)}  # return default if above errors
 
 
+# ONNX Runtime tensor element types as (numpy dtype, torch dtype)
+ORT_TYPES = {
+    "tensor(float)": (np.float32, torch.float32),
+    "tensor(float16)": (np.float16, torch.float16),
+    "tensor(double)": (np.float64, torch.float64),
+    "tensor(int64)": (np.int64, torch.int64),
+    "tensor(int32)": (np.int32, torch.int32),
+    "tensor(uint8)": (np.uint8, torch.uint8),
+    "tensor(int8)": (np.int8, torch.int8),
+    "tensor(bool)": (np.bool_, torch.bool),
+}
+
+
+def ort_session_options(options=None):
+    """
+    Build ONNX Runtime session options from a dict of SessionOptions attributes.
+
+    Args:
+        options (dict | None): Values for 'intra_op_num_threads' and 'inter_op_num_threads' (0 or None keeps the
+            ONNX Runtime default), 'execution_mode' ('sequential' or 'parallel') and 'graph_optimization_level'
+            ('disable', 'basic', 'extended' or 'all').
+
+    Returns:
+        (onnxruntime.SessionOptions): Session options with the given attributes set.
+    """
+    import onnxruntime
+
+    levels = {
+        "disable": onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        "basic": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        "extended": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        "all": onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+    modes = {"sequential": onnxruntime.ExecutionMode.ORT_SEQUENTIAL, "parallel": onnxruntime.ExecutionMode.ORT_PARALLEL}
+    session_options = onnxruntime.SessionOptions()
+    for k, v in (options or {}).items():
+        if v is None or (k.endswith("_threads") and not v):
+            continue
+        if k == "execution_mode":
+            if v not in modes:
+                raise ValueError(f"Invalid ONNX Runtime execution mode '{v}', valid modes are {tuple(modes)}")
+            v = modes[v]
+        elif k == "graph_optimization_level":
+            if v not in levels:
+                raise ValueError(f"Invalid ONNX Runtime optimization level '{v}', valid levels are {tuple(levels)}")
+            v = levels[v]
+        setattr(session_options, k, v)
+    return session_options
+
+
+class OrtIOBinding:
+    """
+    ONNX Runtime IO binding that reuses preallocated output tensors per input shape.
+
+    The input tensor is bound zero-copy from CPU or CUDA memory. Outputs are written directly into torch tensors on
+    the inference device, allocated once per input shape and kept in an LRU cache, so calls allocate no outputs and
+    convert nothing to or from numpy. Output shapes of dynamic models are taken from one run with outputs allocated by
+    ONNX Runtime the first time an input shape is seen.
+
+    Attributes:
+        session (onnxruntime.InferenceSession): Session to run.
+        device (torch.device): Device of the bound input and output tensors.
+        maxsize (int): Number of input shapes whose output tensors are kept.
+        buffers (int): Output tensor sets used in rotation per input shape. More than one is needed when earlier
+            outputs are still read while the next inference runs.
+        cache (OrderedDict): Input shape to list of (binding, output tensors), least recently used first.
+
+    Examples:
+        >>> import onnxruntime
+        >>> session = onnxruntime.InferenceSession("yolo11n.onnx", providers=["CPUExecutionProvider"])
+        >>> io_binding = OrtIOBinding(session, torch.device("cpu"))
+        >>> y = io_binding(torch.zeros(1, 3, 640, 640))
+    """
+
+    def __init__(self, session, device, maxsize=8, buffers=1):
+        """
+        Initialize the IO binding for a session.
+
+        Args:
+            session (onnxruntime.InferenceSession): Session to run.
+            device (torch.device): Device of the bound input and output tensors.
+            maxsize (int): Number of input shapes whose output tensors are kept.
+            buffers (int): Output tensor sets used in rotation per input shape.
+        """
+        self.session = session
+        self.device = device
+        self.maxsize = maxsize
+        self.buffers = buffers
+        self.input_name = session.get_inputs()[0].name
+        self.outputs = session.get_outputs()
+        self.dynamic = any(not isinstance(d, int) for x in self.outputs for d in x.shape)
+        self.cache = OrderedDict()
+
+    @property
+    def device_id(self):
+        """Device index passed to ONNX Runtime."""
+        return (self.device.index or 0) if self.device.type == "cuda" else 0
+
+    def __call__(self, im):
+        """
+        Run the session on one input tensor.
+
+        Args:
+            im (torch.Tensor): Input tensor, moved to CPU if the session runs on CPU.
+
+        Returns:
+            (List[torch.Tensor]): Output tensors on the inference device. They are overwritten by a later call with
+                the same input shape once all `buffers` output sets have been used.
+        """
+        im = (im.cpu() if self.device.type == "cpu" else im).contiguous()
+        shape = tuple(im.shape)
+        sets = self.cache.pop(shape, [])
+        self.cache[shape] = sets  # most recently used
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+
+        if len(sets) < self.buffers:
+            io = self.session.io_binding()
+            self._bind_input(io, im)
+            outputs = self._bind_outputs(io)
+        else:
+            io, outputs = sets.pop(0)  # oldest output set
+            self._bind_input(io, im)
+            self.session.run_with_iobinding(io)
+        sets.append((io, outputs))
+        return list(outputs)
+
+    def _bind_input(self, io, im):
+        """Bind the memory of the input tensor without copying it."""
+        io.bind_input(
+            name=self.input_name,
+            device_type=im.device.type,
+            device_id=self.device_id,
+            element_type=np.float16 if im.dtype == torch.float16 else np.float32,
+            shape=tuple(im.shape),
+            buffer_ptr=im.data_ptr(),
+        )
+
+    def _bind_outputs(self, io):
+        """Allocate and bind output tensors for the bound input and run the session once to fill them."""
+        if self.dynamic:  # let ONNX Runtime allocate the outputs once to learn their shapes for this input shape
+            for x in self.outputs:
+                io.bind_output(x.name, self.device.type, self.device_id)
+            self.session.run_with_iobinding(io)
+            first = [torch.from_numpy(y).to(self.device) for y in io.copy_outputs_to_cpu()]
+            io.clear_binding_outputs()
+
+        outputs = []
+        for i, x in enumerate(self.outputs):
+            np_type, torch_type = ORT_TYPES[x.type]
+            y = first[i] if self.dynamic else torch.empty(x.shape, dtype=torch_type, device=self.device)
+            io.bind_output(
+                name=x.name,
+                device_type=self.device.type,
+                device_id=self.device_id,
+                element_type=np_type,
+                shape=tuple(y.shape),
+                buffer_ptr=y.data_ptr(),
+            )
+            outputs.append(y)
+        if not self.dynamic:
+            self.session.run_with_iobinding(io)
+        return outputs
+
+
+class OVFuture:
+    """
+    Outputs of one batch submitted to an OVInferPool, complete once every request of the batch has finished.
+
+    Attributes:
+        outputs (list): Output arrays of each request, filled in completion order.
+        remaining (int): Number of requests that have not finished yet.
+        error (Exception | None): First error raised while collecting the outputs of a request.
+    """
+
+    def __init__(self, n):
+        """
+        Initialize the future for a batch split into n requests.
+
+        Args:
+            n (int): Number of requests of the batch.
+        """
+        self.outputs = [None] * n
+        self.remaining = n
+        self.error = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        if n == 0:
+            self._done.set()
+
+    def set(self, i, y):
+        """Store the outputs of request i, completing the future after the last request."""
+        self.outputs[i] = y
+        with self._lock:
+            self.remaining -= 1
+            done = self.remaining == 0
+        if done:
+            self._done.set()
+
+    def set_exception(self, e):
+        """Fail the future with the error of a request, waking up the caller of result()."""
+        self.error = self.error or e
+        self._done.set()
+
+    def result(self, timeout=60.0):
+        """
+        Wait for all requests of the batch.
+
+        Requests failing inside OpenVINO never call back, so the wait is bounded by a timeout instead of blocking.
+
+        Args:
+            timeout (float | None): Seconds to wait for the batch, None to wait indefinitely.
+
+        Returns:
+            (List[np.ndarray]): Model outputs with the request outputs concatenated in batch order.
+
+        Raises:
+            TimeoutError: If the requests did not finish within the timeout.
+            Exception: The error raised while collecting the outputs of a request.
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"OpenVINO inference not finished after {timeout}s, {self.remaining} requests pending")
+        if self.error is not None:
+            raise self.error
+        if len(self.outputs) == 1:
+            return self.outputs[0]
+        return [np.concatenate(y) for y in zip(*self.outputs)]
+
+
+class OVInferPool:
+    """
+    Pool of OpenVINO infer requests shared by all inference calls of a compiled model.
+
+    Batches are split into single images, unless the model has a static batch size above 1, and started on an
+    AsyncInferQueue sized by OPTIMAL_NUMBER_OF_INFER_REQUESTS. Requests finish out of order; each one copies its
+    outputs into the slot of its image, so the future of a batch returns them in batch order. Submitting does not
+    wait for earlier batches, so several batches can be in flight at once.
+
+    Attributes:
+        queue (openvino.AsyncInferQueue): Infer requests of the compiled model.
+        input_name (str): Name of the model input.
+        split (bool): Whether batches are split into one request per image.
+
+    Examples:
+        >>> pool = OVInferPool(ov, compiled_model, compiled_model.input().get_any_name())
+        >>> futures = [pool.submit(im) for im in batches]  # all batches in flight
+        >>> outputs = [f.result() for f in futures]  # in submission order
+    """
+
+    def __init__(self, ov, compiled_model, input_name):
+        """
+        Initialize the pool for a compiled model.
+
+        Args:
+            ov (module): The openvino module.
+            compiled_model (openvino.CompiledModel): Model compiled with a THROUGHPUT or CUMULATIVE_THROUGHPUT hint.
+            input_name (str): Name of the model input.
+        """
+        self.queue = ov.AsyncInferQueue(compiled_model, 0)  # 0 jobs uses OPTIMAL_NUMBER_OF_INFER_REQUESTS
+        self.queue.set_callback(self._done)
+        self.input_name = input_name
+        batch = compiled_model.input().get_partial_shape()[0]
+        self.split = batch.is_dynamic or batch.get_length() == 1
+
+    def __len__(self):
+        """Number of infer requests in the pool."""
+        return len(self.queue)
+
+    def submit(self, im):
+        """
+        Start inference on a batch without waiting for it to finish.
+
+        Args:
+            im (np.ndarray): Input batch in BCHW layout.
+
+        Returns:
+            (OVFuture): Future returning the outputs of the batch.
+        """
+        chunks = [im[i : i + 1] for i in range(len(im))] if self.split else [im]
+        future = OVFuture(len(chunks))
+        for i, x in enumerate(chunks):
+            self.queue.start_async(inputs={self.input_name: x}, userdata=(future, i))  # waits for an idle request
+        return future
+
+    @staticmethod
+    def _done(request, userdata):
+        """Copy the outputs of a finished request before the request is reused, failing the future on errors."""
+        future, i = userdata
+        try:
+            y = [t.data.copy() for t in request.output_tensors]
+        except Exception as e:  # exceptions raised in OpenVINO callback threads would be lost
+            future.set_exception(e)
+            return
+        future.set(i, y)
+
+
 class AutoBackend(nn.Module):
     """
     Handles dynamic backend selection for running inference using Ultralytics YOLO models.
@@ -81,6 +381,7 @@ class AutoBackend(nn.Module):
         names (dict): A dictionary of class names that the model can detect.
         stride (int): The model stride, typically 32 for YOLO models.
         fp16 (bool): Whether the model uses half-precision (FP16) inference.
+        numpy_outputs (bool): Return NumPy outputs of non-PyTorch backends as they are instead of as torch tensors.
 
     Methods:
         forward: Run inference on an input image.
@@ -104,6 +405,9 @@ class AutoBackend(nn.Module):
         batch=1,
         fuse=True,
         verbose=True,
+        session_options=None,
+        performance_hint=None,
+        compile_cache=False,
     ):
         """
         Initialize the AutoBackend for inference.
@@ -117,6 +421,12 @@ class AutoBackend(nn.Module):
             batch (int): Batch-size to assume for inference.
             fuse (bool): Fuse Conv2D + BatchNorm layers for optimization. Defaults to True.
             verbose (bool): Enable verbose logging. Defaults to True.
+            session_options (dict | None): ONNX Runtime session options, see ort_session_options().
+            performance_hint (str | None): OpenVINO performance hint, 'LATENCY', 'THROUGHPUT' or
+                'CUMULATIVE_THROUGHPUT'. Defaults to CUMULATIVE_THROUGHPUT for batch > 1 and LATENCY otherwise.
+            compile_cache (bool | str | Path): Keep fused PyTorch models, ONNX Runtime optimized graphs and OpenVINO
+                compiled blobs in a CompileCache, True for the default directory or a cache directory.
+                Defaults to False.
         """
         super().__init__()
         w = str(weights[0] if isinstance(weights, list) else weights)
@@ -156,11 +466,28 @@ class AutoBackend(nn.Module):
         if not (pt or triton or nn_module):
             w = attempt_download_asset(w)
 
+        # Compiled artefact cache, keyed by weights contents and load settings
+        cache = None
+        local = nn_module or (Path(w).exists() and not isinstance(weights, list))  # ensembles are not cached
+        if compile_cache and local and (nn_module or pt or onnx or xml):
+            from ultralytics.utils.compile_cache import CompileCache
+
+            cache = CompileCache(None if compile_cache is True else compile_cache)
+            fields = {"device": str(device), "batch": batch, "half": fp16}
+
         # In-memory PyTorch model
         if nn_module:
             model = weights.to(device)
             if fuse:
-                model = model.fuse(verbose=verbose)
+                key = cache and cache.key(model, backend="pt", **fields)
+                f = cache and cache.entry(key, backend="pt", weights=getattr(model, "pt_path", "nn.Module"), **fields)
+                if f and (f / "model.pt").is_file():
+                    model = torch_load(f / "model.pt", map_location=device)
+                else:
+                    model = model.fuse(verbose=verbose)
+                    if f:
+                        torch_save(model, f / "model.pt.tmp")
+                        os.replace(f / "model.pt.tmp", f / "model.pt")  # atomic for concurrent readers
             if hasattr(model, "kpt_shape"):
                 kpt_shape = model.kpt_shape  # pose-only
             stride = max(int(model.stride.max()), 32)  # model stride
@@ -173,9 +500,18 @@ class AutoBackend(nn.Module):
         elif pt:
             from ultralytics.nn.tasks import attempt_load_weights
 
-            model = attempt_load_weights(
-                weights if isinstance(weights, list) else w, device=device, inplace=True, fuse=fuse
-            )
+            key = cache and cache.key(w, backend="pt", fuse=fuse, **fields)
+            f = cache and cache.entry(key, backend="pt", weights=w, **fields)
+            if f and (f / "model.pt").is_file():
+                LOGGER.info(f"Loading cached {'fused ' if fuse else ''}model for {w} from {f}")
+                model = torch_load(f / "model.pt", map_location=device)
+            else:
+                model = attempt_load_weights(
+                    weights if isinstance(weights, list) else w, device=device, inplace=True, fuse=fuse
+                )
+                if f:
+                    torch_save(model, f / "model.pt.tmp")
+                    os.replace(f / "model.pt.tmp", f / "model.pt")  # atomic for concurrent readers
             if hasattr(model, "kpt_shape"):
                 kpt_shape = model.kpt_shape  # pose-only
             stride = max(int(model.stride.max()), 32)  # model stride
@@ -219,7 +555,27 @@ class AutoBackend(nn.Module):
                     cuda = False
             LOGGER.info(f"Using ONNX Runtime {providers[0]}")
             if onnx:
-                session = onnxruntime.InferenceSession(w, providers=providers)
+                sess_options = ort_session_options(session_options)
+                key = cache and cache.key(
+                    w,
+                    backend="onnx",
+                    providers=providers,
+                    optimization=str(sess_options.graph_optimization_level),
+                    cpu=get_cpu_info(),  # optimized graphs may hold hardware specific kernels
+                    onnxruntime=onnxruntime.__version__,
+                    **fields,
+                )
+                f = cache and cache.entry(key, backend="onnx", weights=w, **fields)
+                if f and (f / "model.onnx").is_file():
+                    LOGGER.info(f"Loading cached optimized graph for {w} from {f}")
+                    w = str(f / "model.onnx")
+                    sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+                elif f:
+                    sess_options.optimized_model_filepath = str(f / "model.tmp.onnx")
+                    sess_options.log_severity_level = 3  # hardware specific optimization warning, cpu is in the key
+                session = onnxruntime.InferenceSession(w, sess_options=sess_options, providers=providers)
+                if f and (f / "model.tmp.onnx").is_file():
+                    os.replace(f / "model.tmp.onnx", f / "model.onnx")
             else:
                 check_requirements(
                     ["model-compression-toolkit==2.1.1", "sony-custom-layers[torch]==0.2.0", "onnxruntime-extensions"]
@@ -238,21 +594,7 @@ class AutoBackend(nn.Module):
             metadata = session.get_modelmeta().custom_metadata_map
             dynamic = isinstance(session.get_outputs()[0].shape[0], str)
             fp16 = "float16" in session.get_inputs()[0].type
-            if not dynamic:
-                io = session.io_binding()
-                bindings = []
-                for output in session.get_outputs():
-                    out_fp16 = "float16" in output.type
-                    y_tensor = torch.empty(output.shape, dtype=torch.float16 if out_fp16 else torch.float32).to(device)
-                    io.bind_output(
-                        name=output.name,
-                        device_type=device.type,
-                        device_id=device.index if cuda else 0,
-                        element_type=np.float16 if out_fp16 else np.float32,
-                        shape=tuple(y_tensor.shape),
-                        buffer_ptr=y_tensor.data_ptr(),
-                    )
-                    bindings.append(y_tensor)
+            io_binding = OrtIOBinding(session, device if onnx else torch.device("cpu"))
 
         # OpenVINO
         elif xml:
@@ -264,19 +606,27 @@ class AutoBackend(nn.Module):
             w = Path(w)
             if not w.is_file():  # if not *.xml
                 w = next(w.glob("*.xml"))  # get *.xml file from *_openvino_model dir
+            if cache:  # OpenVINO writes and validates its own compiled blobs inside the entry
+                key = cache.key(w.parent, backend="openvino", hint=performance_hint, openvino=ov.__version__, **fields)
+                core.set_property({"CACHE_DIR": str(cache.entry(key, backend="openvino", weights=w.parent, **fields))})
             ov_model = core.read_model(model=str(w), weights=w.with_suffix(".bin"))
             if ov_model.get_parameters()[0].get_layout().empty:
                 ov_model.get_parameters()[0].set_layout(ov.Layout("NCHW"))
 
-            # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT' (not recommended), or 'CUMULATIVE_THROUGHPUT'
-            inference_mode = "CUMULATIVE_THROUGHPUT" if batch > 1 else "LATENCY"
-            LOGGER.info(f"Using OpenVINO {inference_mode} mode for batch={batch} inference...")
+            # OpenVINO inference modes are 'LATENCY', 'THROUGHPUT', or 'CUMULATIVE_THROUGHPUT'
+            inference_mode = (performance_hint or ("CUMULATIVE_THROUGHPUT" if batch > 1 else "LATENCY")).upper()
+            modes = {"LATENCY", "THROUGHPUT", "CUMULATIVE_THROUGHPUT"}
+            if inference_mode not in modes:
+                raise ValueError(f"Invalid OpenVINO performance hint '{performance_hint}', valid hints are {modes}")
             ov_compiled_model = core.compile_model(
                 ov_model,
                 device_name="AUTO",  # AUTO selects best available device, do not modify
                 config={"PERFORMANCE_HINT": inference_mode},
             )
             input_name = ov_compiled_model.input().get_any_name()
+            ov_pool = None if inference_mode == "LATENCY" else OVInferPool(ov, ov_compiled_model, input_name)
+            requests = f" with {len(ov_pool)} infer requests" if ov_pool else ""
+            LOGGER.info(f"Using OpenVINO {inference_mode} mode for batch={batch} inference{requests}...")
             metadata = w.parent / "metadata.yaml"
 
         # TensorRT
@@ -453,8 +803,6 @@ class AutoBackend(nn.Module):
         elif mnn:
             LOGGER.info(f"Loading {w} for MNN inference...")
             check_requirements("MNN")  # requires MNN
-            import os
-
             import MNN
 
             config = {"precision": "low", "backend": "CPU", "numThread": (os.cpu_count() + 1) // 2}
@@ -545,6 +893,7 @@ class AutoBackend(nn.Module):
                 p.requires_grad = False
 
         self.__dict__.update(locals())  # assign all variables to self
+        self.numpy_outputs = False
 
     def forward(self, im, augment=False, visualize=False, embed=None):
         """
@@ -581,22 +930,9 @@ class AutoBackend(nn.Module):
 
         # ONNX Runtime
         elif self.onnx or self.imx:
-            if self.dynamic:
-                im = im.cpu().numpy()  # torch to numpy
-                y = self.session.run(self.output_names, {self.session.get_inputs()[0].name: im})
-            else:
-                if not self.cuda:
-                    im = im.cpu()
-                self.io.bind_input(
-                    name="images",
-                    device_type=im.device.type,
-                    device_id=im.device.index if im.device.type == "cuda" else 0,
-                    element_type=np.float16 if self.fp16 else np.float32,
-                    shape=tuple(im.shape),
-                    buffer_ptr=im.data_ptr(),
-                )
-                self.session.run_with_iobinding(self.io)
-                y = self.bindings
+            y = self.io_binding(im)
+            if self.numpy_outputs and self.io_binding.device.type == "cpu":
+                y = [x.numpy() for x in y]  # zero-copy views for NumPy postprocessing
             if self.imx:
                 # boxes, conf, cls
                 y = np.concatenate([y[0], y[1][:, :, None], y[2][:, :, None]], axis=-1)
@@ -605,22 +941,8 @@ class AutoBackend(nn.Module):
         elif self.xml:
             im = im.cpu().numpy()  # FP32
 
-            if self.inference_mode in {"THROUGHPUT", "CUMULATIVE_THROUGHPUT"}:  # optimized for larger batch-sizes
-                n = im.shape[0]  # number of images in batch
-                results = [None] * n  # preallocate list with None to match the number of images
-
-                def callback(request, userdata):
-                    """Places result in preallocated list using userdata index."""
-                    results[userdata] = request.results
-
-                # Create AsyncInferQueue, set the callback and start asynchronous inference for each input image
-                async_queue = self.ov.AsyncInferQueue(self.ov_compiled_model)
-                async_queue.set_callback(callback)
-                for i in range(n):
-                    # Start async inference with userdata=i to specify the position in results list
-                    async_queue.start_async(inputs={self.input_name: im[i : i + 1]}, userdata=i)  # keep image as BCHW
-                async_queue.wait_all()  # wait for all inference requests to complete
-                y = np.concatenate([list(r.values())[0] for r in results])
+            if self.ov_pool is not None:  # THROUGHPUT modes, optimized for larger batch-sizes and many streams
+                y = self.ov_pool.submit(im).result()
 
             else:  # inference_mode = "LATENCY", optimized for fastest first result at batch-size 1
                 y = list(self.ov_compiled_model(im).values())
@@ -748,6 +1070,39 @@ class AutoBackend(nn.Module):
                     y[1] = np.transpose(y[1], (0, 3, 1, 2))  # should be y = (1, 116, 8400), (1, 32, 160, 160)
             y = [x if isinstance(x, np.ndarray) else x.numpy() for x in y]
 
+        return self._outputs(y)
+
+    def forward_async(self, im):
+        """
+        Start inference without waiting for it to finish.
+
+        Backends with a pool of infer requests (OpenVINO with a THROUGHPUT hint) return as soon as the batch is
+        submitted, so the next batch can be submitted while this one runs. Other backends run forward() directly.
+
+        Args:
+            im (torch.Tensor): The image tensor to perform inference on.
+
+        Returns:
+            (Callable): Function that waits for the inference and returns the same outputs as forward(im).
+        """
+        if getattr(self, "ov_pool", None) is None:
+            y = self.forward(im)
+            return lambda: y
+        if self.fp16 and im.dtype != torch.float16:
+            im = im.half()
+        future = self.ov_pool.submit(im.cpu().numpy())
+        return lambda: self._outputs(future.result())
+
+    def _outputs(self, y):
+        """
+        Convert raw backend outputs to the tensors returned by forward().
+
+        Args:
+            y (torch.Tensor | np.ndarray | List): Raw outputs of the backend.
+
+        Returns:
+            (torch.Tensor | np.ndarray | List): A single output or a list of outputs.
+        """
         # for x in y:
         #     print(type(x), len(x)) if isinstance(x, (list, tuple)) else print(type(x), x.shape)  # debug shapes
         if isinstance(y, (list, tuple)):
@@ -766,9 +1121,9 @@ class AutoBackend(nn.Module):
             x (np.ndarray): The array to be converted.
 
         Returns:
-            (torch.Tensor): The converted tensor
+            (torch.Tensor | np.ndarray): The converted tensor, or the array itself if numpy_outputs is set.
         """
-        return torch.tensor(x).to(self.device) if isinstance(x, np.ndarray) else x
+        return torch.tensor(x).to(self.device) if isinstance(x, np.ndarray) and not self.numpy_outputs else x
 
     def warmup(self, imgsz=(1, 3, 640, 640)):
         """
@@ -126,9 +126,10 @@ class BaseSolution:
         )
 
         if self.track_data and self.track_data.id is not None:
-            self.boxes = self.track_data.xyxy.cpu()
-            self.clss = self.track_data.cls.cpu().tolist()
-            self.track_ids = self.track_data.id.int().cpu().tolist()
+            track_data = self.track_data.cpu()  # one device to host copy for boxes, classes and IDs
+            self.boxes = track_data.xyxy
+            self.clss = track_data.cls.tolist()
+            self.track_ids = track_data.id.int().tolist()
         else:
             self.LOGGER.warning("WARNING ⚠️ no tracks found!")
             self.boxes, self.clss, self.track_ids = [], [], []
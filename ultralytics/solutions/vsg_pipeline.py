@@ -0,0 +1,285 @@
+#vsg_pipeline.py
+"""
+vsg_pipeline.py - Provides a staged pipeline that runs the capture,
+inference and streaming steps of the VSG sender either serially, in
+threads or in processes, connected by bounded drop-oldest queues.
+"""
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PIPELINE_MODES = ('serial', 'threads', 'processes')
+
+StageType = Tuple[str, Callable[[], Callable[[Any], Any]]]
+
+
+class StageStats:
+    """
+    Latency and backpressure counters for a single pipeline stage.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.dropped = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, dt: float) -> None:
+        """
+        Record the processing latency of one item.
+        :param dt: Processing time in seconds.
+        """
+        self.count += 1
+        self.total += dt
+        self.last = dt
+        self.max = max(self.max, dt)
+
+    @property
+    def mean(self) -> float:
+        """Mean processing latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the counters as a plain dict that can cross process boundaries.
+        """
+        return {
+            'name': self.name,
+            'count': self.count,
+            'dropped': self.dropped,
+            'mean_ms': self.mean * 1e3,
+            'max_ms': self.max * 1e3,
+            'last_ms': self.last * 1e3,
+        }
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """
+    Format a stats snapshot as a single log line.
+    """
+    return (
+        f"[{stats['name']}] frames={stats['count']} dropped={stats['dropped']} "
+        f"mean={stats['mean_ms']:.1f}ms max={stats['max_ms']:.1f}ms last={stats['last_ms']:.1f}ms"
+    )
+
+
+class DropOldestQueue:
+    """
+    Bounded queue that discards its oldest item instead of blocking the producer when full.
+    """
+
+    def __init__(self, maxsize: int, ctx=None):
+        """
+        :param maxsize: Maximum number of queued items (at least 1).
+        :param ctx: Multiprocessing context for a process-safe queue, None for a thread queue.
+        """
+        maxsize = max(int(maxsize), 1)
+        if ctx is None:
+            self._q = queue.Queue(maxsize)
+        else:
+            self._q = ctx.Queue(maxsize)
+            self._q.cancel_join_thread()  # never block process exit on unflushed frames
+
+    def put(self, item: Any) -> int:
+        """
+        Put an item, evicting the oldest entries while the queue is full.
+        :return: Number of evicted items.
+        """
+        dropped = 0
+        while True:
+            try:
+                self._q.put_nowait(item)
+                return dropped
+            except queue.Full:
+                try:
+                    self._q.get_nowait()
+                    dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float) -> Any:
+        """
+        Get the oldest item, raising queue.Empty after timeout seconds.
+        """
+        return self._q.get(timeout=timeout)
+
+
+def _close(handler: Any) -> None:
+    """
+    Call handler.close() if the stage defines it.
+    """
+    close = getattr(handler, 'close', None)
+    if close is not None:
+        close()
+
+
+def _stage_worker(name: str, factory: Callable, in_q: Optional[DropOldestQueue], out_q: Optional[DropOldestQueue],
+                  stats_q: DropOldestQueue, stop_event, stats_interval: float) -> None:
+    """
+    Run one stage until stop_event is set. A stage without input queue is a
+    source and is called with None; a stage without output queue is a sink.
+    Handlers are built inside the worker so that unpicklable resources
+    (camera, model, GStreamer pipelines) never cross process boundaries.
+    """
+    handler = factory()
+    stats = StageStats(name)
+    last_report = time.monotonic()
+    try:
+        while not stop_event.is_set():
+            if in_q is None:
+                item = None
+            else:
+                try:
+                    item = in_q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+            t0 = time.perf_counter()
+            out = handler(item)
+            if out is None and out_q is not None:
+                continue  # source produced nothing (e.g. failed camera read)
+            stats.record(time.perf_counter() - t0)
+            if out_q is not None:
+                stats.dropped += out_q.put(out)
+
+            now = time.monotonic()
+            if now - last_report >= stats_interval:
+                stats_q.put(stats.snapshot())
+                last_report = now
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()  # a failing stage stops the whole pipeline
+        stats_q.put(stats.snapshot())
+        _close(handler)
+
+
+class StagedPipeline:
+    """
+    Chain of stages (source -> ... -> sink) connected by bounded drop-oldest queues.
+    Each stage is a (name, factory) pair where factory() returns a callable
+    that maps one item to the next; the callable may define close().
+    """
+
+    def __init__(self, stages: List[StageType], mode: str = 'threads', queue_size: int = 2,
+                 stats_interval: float = 5.0):
+        """
+        :param stages: Ordered list of (name, factory) pairs, first one is the source.
+        :param mode: One of 'serial', 'threads' or 'processes'.
+        :param queue_size: Capacity of each inter-stage queue.
+        :param stats_interval: Seconds between per-stage latency reports (0 disables them).
+        """
+        if mode not in PIPELINE_MODES:
+            raise ValueError(f"Invalid pipeline mode '{mode}', valid modes are {PIPELINE_MODES}")
+        self.stages = stages
+        self.mode = mode
+        self.queue_size = queue_size
+        self.stats_interval = stats_interval
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def _report(self) -> None:
+        """
+        Print the latest counters of every stage.
+        """
+        for name, _ in self.stages:
+            if name in self.stats:
+                print(format_stats(self.stats[name]))
+
+    def run(self) -> None:
+        """
+        Run the pipeline until interrupted or until one of the stages fails.
+        """
+        if self.mode == 'serial':
+            self._run_serial()
+        else:
+            self._run_parallel()
+
+    def _run_serial(self) -> None:
+        """
+        Run all stages one after another in the calling thread.
+        """
+        handlers = [factory() for _, factory in self.stages]
+        stats = [StageStats(name) for name, _ in self.stages]
+        last_report = time.monotonic()
+        try:
+            while True:
+                item = None
+                for i, handler in enumerate(handlers):
+                    t0 = time.perf_counter()
+                    item = handler(item)
+                    if item is None and i < len(handlers) - 1:
+                        break
+                    stats[i].record(time.perf_counter() - t0)
+
+                now = time.monotonic()
+                if self.stats_interval and now - last_report >= self.stats_interval:
+                    self.stats = {s.name: s.snapshot() for s in stats}
+                    self._report()
+                    last_report = now
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stats = {s.name: s.snapshot() for s in stats}
+            for handler in handlers:
+                _close(handler)
+
+    def _run_parallel(self) -> None:
+        """
+        Run every stage in its own thread or process and collect their counters.
+        """
+        if self.mode == 'processes':
+            ctx = multiprocessing.get_context('spawn')  # fresh interpreter, no forked GStreamer/CUDA state
+            stop_event, worker_cls = ctx.Event(), ctx.Process
+        else:
+            ctx = None
+            stop_event, worker_cls = threading.Event(), threading.Thread
+
+        queues = [DropOldestQueue(self.queue_size, ctx) for _ in range(len(self.stages) - 1)]
+        stats_q = DropOldestQueue(4 * len(self.stages), ctx)
+        interval = self.stats_interval or float('inf')
+        workers = []
+        for i, (name, factory) in enumerate(self.stages):
+            in_q = queues[i - 1] if i > 0 else None
+            out_q = queues[i] if i < len(queues) else None
+            workers.append(worker_cls(
+                target=_stage_worker,
+                args=(name, factory, in_q, out_q, stats_q, stop_event, interval),
+                name=f'vsg-{name}',
+                daemon=True,
+            ))
+
+        for w in workers:
+            w.start()
+        last_report = time.monotonic()
+        try:
+            while not stop_event.is_set():
+                self._drain_stats(stats_q, timeout=0.1)
+                now = time.monotonic()
+                if self.stats_interval and now - last_report >= self.stats_interval:
+                    self._report()
+                    last_report = now
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop_event.set()
+            for w in workers:
+                w.join(timeout=2.0)
+                if self.mode == 'processes' and w.is_alive():
+                    w.terminate()
+            self._drain_stats(stats_q, timeout=0.0)
+
+    def _drain_stats(self, stats_q: DropOldestQueue, timeout: float) -> None:
+        """
+        Move all pending stats snapshots from the workers into self.stats.
+        """
+        while True:
+            try:
+                snapshot = stats_q.get(timeout=timeout)
+            except queue.Empty:
+                return
+            self.stats[snapshot['name']] = snapshot
+            timeout = 0.0
@@ -12,12 +12,14 @@ import gi
 # Load constants from vsg_config.ini
 from models.ultralytics_model.ultralytics.ultralytics.utils.vsg_config import (
     MODEL_PATH, IMG_SZ, CONF_THRESHOLD,
-    UDP_IP, UDP_PORT_RAW, UDP_PORT_META,
+    UDP_IP, UDP_PORT_RAW, UDP_PORT_META, METADATA_VERSION,
     FRAME_WIDTH, FRAME_HEIGHT, FRAMERATE,
-    DEBUG, DEBUG_DIR
+    DEBUG, DEBUG_DIR,
+    PIPELINE_MODE, QUEUE_SIZE, STATS_INTERVAL
 )
 from models.ultralytics_model.ultralytics.ultralytics.engine.vsg_capture_yolo_inference import YoloInference
 from models.ultralytics_model.ultralytics.ultralytics.solutions.vsg_gstreamer import GstStreamer
+from models.ultralytics_model.ultralytics.ultralytics.solutions.vsg_pipeline import StagedPipeline
 
 # Initialize GStreamer
 gi.require_version('Gst', '1.0')
@@ -58,80 +60,117 @@ class MetaStreamer:
 
 
 
-def main():
+class CaptureStage:
     """
-    Initialize the YOLO inference engine and GStreamer streamers,
-    then continuously capture frames, perform inference, and send data.
+    Pipeline source stage: grab frames from the webcam.
     """
-    # Create YOLO inference instance
-    infer = YoloInference(MODEL_PATH, IMG_SZ, CONF_THRESHOLD)
+    def __init__(self):
+        self.cap = cv2.VideoCapture(0)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
+        time.sleep(0.5)  # Allow camera sensor to stabilize
 
-    # Define GStreamer caps and sink for raw video frames
-    raw_caps = (
-        f'video/x-raw,format=BGR,width={FRAME_WIDTH},'
-        f'height={FRAME_HEIGHT}'
-    )
-    raw_sink = (
-        '! videoconvert '
-        '! x264enc tune=zerolatency speed-preset=superfast bitrate=500 '
-        '! rtph264pay config-interval=1 pt=96 '
-        f'! udpsink host={UDP_IP} port={UDP_PORT_RAW} sync=false'
-    )
+    def __call__(self, _):
+        """
+        Return the next frame, or None if the camera did not deliver one.
+        """
+        ret, frame = self.cap.read()
+        if not ret:
+            time.sleep(0.01)
+            return None
+        return frame
+
+    def close(self) -> None:
+        self.cap.release()
+
+
+class InferenceStage:
+    """
+    Pipeline stage: run YOLO inference on a frame.
+    """
+    def __init__(self):
+        self.infer = YoloInference(MODEL_PATH, IMG_SZ, CONF_THRESHOLD)
+
+    def __call__(self, frame):
+        """
+        Return the frame together with its detection records.
+        """
+        return frame, self.infer.run_array(frame)
 
-    # Define caps and sink for metadata
-    meta_caps = 'application/x-meta,media=(string)meta'
-    meta_sink = f'! udpsink host={UDP_IP} port={UDP_PORT_META} sync=false'
-
-    # Instantiate streamers
-    raw_streamer = GstStreamer('raw_src', raw_caps, raw_sink, FRAMERATE)
-    meta_streamer = MetaStreamer('meta_src', meta_caps, meta_sink)
-
-    # Open webcam
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
-    time.sleep(0.5)  # Allow camera sensor to stabilize
-
-    # Setup debug output path
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-    debug_path = os.path.join(project_root, DEBUG_DIR)
-
-    try:
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                time.sleep(0.01)
-                continue
-
-            # Perform YOLO inference
-            detections = infer.run(frame)
-
-            # DEBUG: draw bounding boxes and save an image
-            if DEBUG and detections:
-                debug_img = frame.copy()
-                for score, (x1, y1, x2, y2) in detections:
-                    cv2.rectangle(debug_img, (x1, y1), (x2, y2), (0, 255, 0), 2)
-                    cv2.putText(
-                        debug_img,
-                        f"{score:.2f}",
-                        (x1, max(y1 - 5, 0)),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1
-                    )
-                os.makedirs(debug_path, exist_ok=True)
-                debug_file = os.path.join(debug_path, 'debug.jpg')
-                cv2.imwrite(debug_file, debug_img)
-
-            # Stream raw frame and metadata
-            raw_streamer.push(frame.tobytes())
-            meta_streamer.push(infer.pack_metadata(detections))
-
-    except KeyboardInterrupt:
-        # Exit cleanly on Ctrl+C
-        pass
-    finally:
-        cap.release()
-        raw_streamer.stop()
-        meta_streamer.stop()
+
+class StreamStage:
+    """
+    Pipeline sink stage: optionally save a debug image, then stream
+    the raw frame and its packed metadata over UDP.
+    """
+    def __init__(self):
+        # Define GStreamer caps and sink for raw video frames
+        raw_caps = (
+            f'video/x-raw,format=BGR,width={FRAME_WIDTH},'
+            f'height={FRAME_HEIGHT}'
+        )
+        raw_sink = (
+            '! videoconvert '
+            '! x264enc tune=zerolatency speed-preset=superfast bitrate=500 '
+            '! rtph264pay config-interval=1 pt=96 '
+            f'! udpsink host={UDP_IP} port={UDP_PORT_RAW} sync=false'
+        )
+
+        # Define caps and sink for metadata
+        meta_caps = 'application/x-meta,media=(string)meta'
+        meta_sink = f'! udpsink host={UDP_IP} port={UDP_PORT_META} sync=false'
+
+        # Instantiate streamers
+        self.raw_streamer = GstStreamer('raw_src', raw_caps, raw_sink, FRAMERATE)
+        self.meta_streamer = MetaStreamer('meta_src', meta_caps, meta_sink)
+
+        # Setup debug output path
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+        self.debug_path = os.path.join(project_root, DEBUG_DIR)
+
+    def __call__(self, item):
+        frame, detections = item
+
+        # DEBUG: draw bounding boxes and save an image
+        if DEBUG and len(detections):
+            debug_img = frame.copy()
+            # Field-wise tolist() yields Python ints, record tolist() keeps uint16 which wraps in y1 - 5
+            for conf, (x1, y1, x2, y2) in zip(detections['conf'].tolist(), detections['box'].tolist()):
+                score = conf / 255
+                cv2.rectangle(debug_img, (x1, y1), (x2, y2), (0, 255, 0), 2)
+                cv2.putText(
+                    debug_img,
+                    f"{score:.2f}",
+                    (x1, max(y1 - 5, 0)),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1
+                )
+            os.makedirs(self.debug_path, exist_ok=True)
+            debug_file = os.path.join(self.debug_path, 'debug.jpg')
+            cv2.imwrite(debug_file, debug_img)
+
+        # Stream raw frame and metadata
+        self.raw_streamer.push(frame)
+        self.meta_streamer.push(YoloInference.pack_metadata(detections, METADATA_VERSION))
+
+    def close(self) -> None:
+        self.raw_streamer.stop()
+        self.meta_streamer.stop()
+
+
+def main():
+    """
+    Build the capture -> inference -> streaming pipeline and run it until
+    interrupted. With PIPELINE_MODE 'threads' or 'processes' the stages
+    overlap, connected by bounded queues that drop the oldest frame when a
+    downstream stage falls behind; 'serial' runs them one after another.
+    """
+    pipeline = StagedPipeline(
+        [('capture', CaptureStage), ('inference', InferenceStage), ('stream', StreamStage)],
+        mode=PIPELINE_MODE,
+        queue_size=QUEUE_SIZE,
+        stats_interval=STATS_INTERVAL,
+    )
+    pipeline.run()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,408 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import numpy as np
+
+from ..utils.ops import xywh2ltwh
+from .basetrack import BaseTrack, TrackState
+from .byte_tracker import STrack
+from .utils import matching
+from .utils.kalman_filter import KalmanFilterXYAH
+
+
+class TrackStore:
+    """
+    Struct-of-arrays container holding the state of many tracks in contiguous NumPy arrays.
+
+    Row i of every array describes track i, so predictions, updates and state changes of all tracks run as single
+    masked or indexed array operations instead of per-object method calls. Rows in state New are unactivated
+    detections, whose box is taken from `_tlwh` rather than the Kalman state, like STrack before activation.
+
+    Attributes:
+        mean (np.ndarray): Kalman state means (x, y, a, h, vx, vy, va, vh) with shape (N, 8).
+        covariance (np.ndarray): Kalman state covariances with shape (N, 8, 8).
+        track_id (np.ndarray): Track IDs with shape (N,), 0 for unactivated detections.
+        state (np.ndarray): TrackState of each row with shape (N,).
+        is_activated (np.ndarray): Boolean activation flags with shape (N,).
+        frame_id (np.ndarray): Frame of the last update with shape (N,).
+        start_frame (np.ndarray): Frame of activation with shape (N,).
+        tracklet_len (np.ndarray): Number of consecutive updates with shape (N,).
+        score (np.ndarray): Confidence scores of the last matched detections with shape (N,).
+        cls (np.ndarray): Class labels with shape (N,).
+        idx (np.ndarray): Indices of the last matched detections in their frame with shape (N,).
+        angle (np.ndarray): Oriented box angles with shape (N,), NaN for axis-aligned boxes.
+        _tlwh (np.ndarray): Detection boxes (top left x, top left y, width, height) with shape (N, 4).
+
+    Methods:
+        from_detections: Create unactivated rows from detections.
+        concat: Concatenate stores.
+        strack: Return an STrack snapshot of one row.
+
+    Examples:
+        >>> dets = TrackStore.from_detections(np.array([[100, 200, 50, 80, 0]]), np.array([0.9]), np.array([0]))
+        >>> dets.xyxy
+        array([[ 75., 160., 125., 240.]], dtype=float32)
+    """
+
+    fields = (
+        "mean",
+        "covariance",
+        "track_id",
+        "state",
+        "is_activated",
+        "frame_id",
+        "start_frame",
+        "tracklet_len",
+        "score",
+        "cls",
+        "idx",
+        "angle",
+        "_tlwh",
+    )
+
+    def __init__(self, n=0):
+        """Initialize a store of n unactivated rows with empty Kalman states."""
+        self.mean = np.zeros((n, 8))
+        self.covariance = np.zeros((n, 8, 8))
+        self.track_id = np.zeros(n, dtype=int)
+        self.state = np.full(n, TrackState.New, dtype=int)
+        self.is_activated = np.zeros(n, dtype=bool)
+        self.frame_id = np.zeros(n, dtype=int)
+        self.start_frame = np.zeros(n, dtype=int)
+        self.tracklet_len = np.zeros(n, dtype=int)
+        self.score = np.zeros(n, dtype=np.float32)
+        self.cls = np.zeros(n)
+        self.idx = np.zeros(n)
+        self.angle = np.full(n, np.nan)
+        self._tlwh = np.zeros((n, 4), dtype=np.float32)
+
+    @classmethod
+    def from_detections(cls, dets, scores, classes):
+        """
+        Create unactivated rows from detections.
+
+        Args:
+            dets (np.ndarray): Boxes (x, y, w, h, [a], idx) with shape (N, 5) or (N, 6), where (x, y) is the center,
+                [a] is the optional angle and idx is the index of the detection in its frame.
+            scores (np.ndarray): Detection confidence scores with shape (N,).
+            classes (np.ndarray): Detection class labels with shape (N,).
+
+        Returns:
+            (TrackStore): Store with one row in state New per detection.
+        """
+        assert dets.shape[1] in {5, 6}, f"expected 5 or 6 values but got {dets.shape[1]}"
+        store = cls(len(dets))
+        store._tlwh[:] = xywh2ltwh(dets[:, :4])
+        store.score[:] = scores
+        store.cls[:] = classes
+        store.idx[:] = dets[:, -1]
+        if dets.shape[1] == 6:
+            store.angle[:] = dets[:, 4]
+        return store
+
+    @classmethod
+    def concat(cls, stores):
+        """Concatenate stores row-wise into a new store."""
+        out = cls()
+        for f in cls.fields:
+            setattr(out, f, np.concatenate([getattr(s, f) for s in stores]))
+        return out
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self.state)
+
+    def __getitem__(self, index):
+        """Return a new store with the rows selected by an index array or boolean mask."""
+        out = TrackStore.__new__(TrackStore)
+        for f in self.fields:
+            setattr(out, f, getattr(self, f)[index])
+        return out
+
+    @property
+    def tlwh(self):
+        """Return boxes in (top left x, top left y, width, height) format from the Kalman states."""
+        ret = self.mean[:, :4].copy()
+        ret[:, 2] *= ret[:, 3]
+        ret[:, :2] -= ret[:, 2:] / 2
+        new = self.state == TrackState.New
+        ret[new] = self._tlwh[new]
+        return ret
+
+    @property
+    def xyxy(self):
+        """Return boxes in (min x, min y, max x, max y) format."""
+        ret = self.tlwh
+        ret[:, 2:] += ret[:, :2]
+        return ret
+
+    @property
+    def xywh(self):
+        """Return boxes in (center x, center y, width, height) format."""
+        ret = self.tlwh
+        ret[:, :2] += ret[:, 2:] / 2
+        return ret
+
+    @property
+    def boxes(self):
+        """Return boxes for IoU matching, (x, y, w, h, angle) for oriented boxes and (x1, y1, x2, y2) otherwise."""
+        if len(self) and not np.isnan(self.angle).any():
+            return np.concatenate([self.xywh, self.angle[:, None]], axis=1)
+        return self.xyxy
+
+    @property
+    def result(self):
+        """Return tracking results, one row of box coordinates, track ID, score, class and detection index per track."""
+        return np.concatenate(
+            [self.boxes, np.stack([self.track_id, self.score, self.cls, self.idx], axis=1)], axis=1
+        ).astype(np.float32)
+
+    def strack(self, i):
+        """Return an STrack snapshot of row i, sharing its mean and covariance with the store."""
+        xywh = self.xywh[i] if np.isnan(self.angle[i]) else np.r_[self.xywh[i], self.angle[i]]
+        track = STrack(np.r_[xywh, self.idx[i]], self.score[i], self.cls[i])
+        if self.state[i] != TrackState.New:
+            track.mean, track.covariance = self.mean[i], self.covariance[i]
+        track.kalman_filter = STrack.shared_kalman
+        for f in "track_id", "state", "is_activated", "frame_id", "start_frame", "tracklet_len":
+            setattr(track, f, getattr(self, f)[i].item())
+        return track
+
+
+class BatchedBYTETracker:
+    """
+    BYTETracker variant that keeps all tracks in a TrackStore and updates them with batched array operations.
+
+    The association steps, thresholds and resulting tracks are those of BYTETracker, but the Kalman prediction and
+    correction, activation, mark-lost and removal of all tracks run as indexed NumPy operations, with no per-track
+    Python objects. This removes the per-object overhead that dominates BYTETracker in crowded scenes with hundreds of
+    tracks. Enable it with `batched: True` in a ByteTrack tracker config.
+
+    Attributes:
+        tracks (TrackStore): Tracked tracks followed by lost tracks, each group in BYTETracker list order.
+        n_tracked (int): Number of tracked (not lost) rows at the start of `tracks`.
+        removed_ids (np.ndarray): IDs of the last removed tracks, mirroring BYTETracker.removed_stracks.
+        frame_id (int): The current frame ID.
+        args (Namespace): Tracker configuration.
+        max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
+        gated (bool): Whether to associate spatially gated candidate pairs with sparse cost matrices.
+        kalman_filter (KalmanFilterXYAH): Kalman Filter object.
+
+    Methods:
+        update: Update the tracker with new detections.
+        init_track: Create unactivated rows from detections.
+        get_dists: Calculate the distance between tracks and detections.
+        multi_predict: Predict the location of tracks in place.
+        multi_update: Correct tracks in place with matched detections.
+        reset: Reset the tracker.
+
+    Examples:
+        >>> tracker = BatchedBYTETracker(args, frame_rate=30)
+        >>> tracks = tracker.update(results.boxes.cpu().numpy())
+    """
+
+    def __init__(self, args, frame_rate=30):
+        """
+        Initialize a BatchedBYTETracker instance for object tracking.
+
+        Args:
+            args (Namespace): Tracker configuration containing tracking parameters.
+            frame_rate (int): Frame rate of the video sequence.
+        """
+        self.tracks = TrackStore()
+        self.n_tracked = 0
+        self.removed_ids = np.zeros(0, dtype=int)
+
+        self.frame_id = 0
+        self.args = args
+        self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
+        self.gated = args.get("gated", False)
+        self.kalman_filter = self.get_kalmanfilter()
+        self.reset_id()
+
+    @property
+    def tracked_stracks(self):
+        """Return STrack snapshots of the tracked tracks, for code written against BYTETracker."""
+        return [self.tracks.strack(i) for i in range(self.n_tracked)]
+
+    @property
+    def lost_stracks(self):
+        """Return STrack snapshots of the lost tracks, for code written against BYTETracker."""
+        return [self.tracks.strack(i) for i in range(self.n_tracked, len(self.tracks))]
+
+    def update(self, results, img=None, feats=None):
+        """Updates the tracker with new detections and returns the current tracked objects like BYTETracker."""
+        self.frame_id += 1
+
+        scores = results.conf
+        bboxes = results.xywhr if hasattr(results, "xywhr") else results.xywh
+        # Add index
+        bboxes = np.concatenate([bboxes, np.arange(len(bboxes)).reshape(-1, 1)], axis=-1)
+        cls = results.cls
+
+        remain_inds = scores >= self.args.track_high_thresh
+        inds_second = (scores > self.args.track_low_thresh) & (scores < self.args.track_high_thresh)
+        detections = self.init_track(bboxes[remain_inds], scores[remain_inds], cls[remain_inds], img)
+        detections_second = self.init_track(bboxes[inds_second], scores[inds_second], cls[inds_second], img)
+
+        tracks, n = self.tracks, len(self.tracks)
+        is_tracked = np.arange(n) < self.n_tracked
+        unconfirmed = np.flatnonzero(is_tracked & ~tracks.is_activated)
+        pool = np.flatnonzero(~is_tracked | tracks.is_activated)  # activated tracked, then lost
+        self.multi_predict(pool)
+
+        # Step 2: First association, with high score detection boxes
+        dists = self.get_dists(tracks[pool], detections)
+        matches, u_track, u_detection = self._assign(dists, self.args.match_thresh)
+        rows, dets = [pool[matches[:, 0]]], [detections[matches[:, 1]]]
+        refind = rows[0][tracks.state[rows[0]] != TrackState.Tracked]
+
+        # Step 3: Second association, with low score detection boxes
+        r_tracked = pool[u_track]
+        r_tracked = r_tracked[tracks.state[r_tracked] == TrackState.Tracked]
+        dists = matching.iou_distance(tracks[r_tracked].boxes, detections_second.boxes, sparse=self.gated)
+        matches, u_track, _ = self._assign(dists, 0.5)
+        rows.append(r_tracked[matches[:, 0]])
+        dets.append(detections_second[matches[:, 1]])
+        lost = r_tracked[u_track]
+
+        # Deal with unconfirmed tracks, usually tracks with only one beginning frame
+        detections = detections[u_detection]
+        dists = self.get_dists(tracks[unconfirmed], detections)
+        matches, u_unconfirmed, u_detection = self._assign(dists, 0.7)
+        rows.append(unconfirmed[matches[:, 0]])
+        dets.append(detections[matches[:, 1]])
+        self.multi_update(np.concatenate(rows), TrackStore.concat(dets))
+        tracks.state[lost] = TrackState.Lost
+        removed = unconfirmed[u_unconfirmed]
+        tracks.state[removed] = TrackState.Removed
+
+        # Step 4: Init new stracks
+        new = detections[u_detection]
+        new = self.activate(new[new.score >= self.args.new_track_thresh])
+
+        # Step 5: Update state
+        old_lost = np.arange(self.n_tracked, n)
+        old_lost = old_lost[tracks.state[old_lost] != TrackState.Tracked]  # not refound
+        timeout = old_lost[self.frame_id - tracks.frame_id[old_lost] > self.max_time_lost]
+        tracks.state[timeout] = TrackState.Removed
+        removed = np.concatenate([removed, timeout])
+
+        # Tracked: surviving tracked in order, then new and refound tracks. Lost: surviving lost, then newly lost
+        tracked = np.concatenate(
+            [np.flatnonzero(is_tracked & (tracks.state == TrackState.Tracked)), n + np.arange(len(new)), refind]
+        )
+        lost = np.concatenate([old_lost, lost])
+        # As in BYTETracker, lost tracks are filtered by the IDs removed up to the previous frame, so tracks timed out
+        # in this frame stay in the pool for one more frame and may still be refound
+        lost = lost[~np.isin(tracks.track_id[lost], self.removed_ids)]
+        self.removed_ids = np.concatenate([self.removed_ids, tracks.track_id[removed]])
+        if len(self.removed_ids) > 1000:
+            self.removed_ids = self.removed_ids[-999:]  # clip removed IDs to 1000 maximum
+        tracks = TrackStore.concat([tracks, new])
+        tracked, lost = self.remove_duplicate_stracks(tracks, tracked, lost, self.gated)
+        self.tracks, self.n_tracked = tracks[np.concatenate([tracked, lost])], len(tracked)
+
+        return self.tracks[: self.n_tracked][self.tracks.is_activated[: self.n_tracked]].result
+
+    def get_kalmanfilter(self):
+        """Returns a Kalman filter object for tracking bounding boxes using KalmanFilterXYAH."""
+        return KalmanFilterXYAH()
+
+    def init_track(self, dets, scores, cls, img=None):
+        """Create unactivated TrackStore rows from detections, scores and class labels."""
+        return TrackStore.from_detections(dets, scores, cls)
+
+    def get_dists(self, tracks, detections):
+        """Calculates the distance between tracks and detections using IoU and optionally fuses scores."""
+        dists = matching.iou_distance(tracks.boxes, detections.boxes, sparse=self.gated)
+        if self.args.fuse_score and dists.size:
+            if self.gated:
+                dists.data = 1 - (1 - dists.data) * detections.score[dists.col]
+            else:
+                dists = 1 - (1 - dists) * detections.score[None]
+        return dists
+
+    def multi_predict(self, rows):
+        """Predict the next states of the given rows of `tracks` in place, without velocity for untracked rows."""
+        if len(rows) == 0:
+            return
+        mean = self.tracks.mean[rows]
+        mean[self.tracks.state[rows] != TrackState.Tracked, 7] = 0
+        self.tracks.mean[rows], self.tracks.covariance[rows] = self.kalman_filter.multi_predict(
+            mean, self.tracks.covariance[rows]
+        )
+
+    def multi_update(self, rows, dets):
+        """
+        Correct the given rows of `tracks` in place with their matched detections and mark them tracked.
+
+        Matched tracked rows extend their tracklet while matched lost rows are re-activated with a new tracklet, as
+        STrack.update() and STrack.re_activate() do.
+
+        Args:
+            rows (np.ndarray): Indices of the matched rows in `tracks`.
+            dets (TrackStore): Matched detections, one per row.
+        """
+        if len(rows) == 0:
+            return
+        t = self.tracks
+        t.mean[rows], t.covariance[rows] = self.kalman_filter.multi_update(
+            t.mean[rows], t.covariance[rows], self.convert_coords(dets._tlwh)
+        )
+        t.tracklet_len[rows] = np.where(t.state[rows] == TrackState.Tracked, t.tracklet_len[rows] + 1, 0)
+        t.state[rows] = TrackState.Tracked
+        t.is_activated[rows] = True
+        t.frame_id[rows] = self.frame_id
+        for f in "score", "cls", "angle", "idx":
+            getattr(t, f)[rows] = getattr(dets, f)
+
+    def activate(self, new):
+        """Activate unactivated rows as new tracks with fresh IDs and Kalman states, returning them."""
+        n = len(new)
+        new.track_id = BaseTrack._count + 1 + np.arange(n)
+        BaseTrack._count += n
+        new.mean, new.covariance = self.kalman_filter.multi_initiate(self.convert_coords(new._tlwh))
+        new.tracklet_len[:] = 0
+        new.state[:] = TrackState.Tracked
+        new.is_activated[:] = self.frame_id == 1
+        new.frame_id[:] = self.frame_id
+        new.start_frame[:] = self.frame_id
+        return new
+
+    @staticmethod
+    def convert_coords(tlwh):
+        """Convert boxes from (top left x, top left y, width, height) to (center x, center y, aspect, height)."""
+        return STrack.tlwh_to_xyah(tlwh)
+
+    @staticmethod
+    def remove_duplicate_stracks(tracks, tracked, lost, sparse=False):
+        """Removes tracked and lost rows that overlap with IoU > 0.85, keeping the one tracked for longer."""
+        pdist = matching.iou_distance(tracks[tracked].boxes, tracks[lost].boxes, sparse=sparse)
+        if sparse:  # only intersecting pairs are stored
+            p, q = pdist.row[pdist.data < 0.15], pdist.col[pdist.data < 0.15]
+        else:
+            p, q = np.nonzero(pdist < 0.15)
+        age = tracks.frame_id - tracks.start_frame
+        longer = age[tracked[p]] > age[lost[q]]
+        return np.delete(tracked, p[~longer]), np.delete(lost, q[longer])
+
+    @staticmethod
+    def _assign(dists, thresh):
+        """Run matching.linear_assignment() and return matches and unmatched indices as integer arrays."""
+        matches, u_a, u_b = matching.linear_assignment(dists, thresh=thresh)
+        return np.asarray(matches, dtype=int).reshape(-1, 2), np.asarray(u_a, dtype=int), np.asarray(u_b, dtype=int)
+
+    @staticmethod
+    def reset_id():
+        """Resets the ID counter shared with STrack."""
+        STrack.reset_id()
+
+    def reset(self):
+        """Resets the tracker by clearing all tracks and reinitializing the Kalman filter."""
+        self.tracks = TrackStore()
+        self.n_tracked = 0
+        self.removed_ids = np.zeros(0, dtype=int)
+        self.frame_id = 0
+        self.kalman_filter = self.get_kalmanfilter()
+        self.reset_id()
+
@@ -2,7 +2,11 @@
 
 from collections import deque
 
+import cv2
 import numpy as np
+import torch
+
+from ultralytics.utils.torch_utils import select_device
 
 from .basetrack import TrackState
 from .byte_tracker import BYTETracker, STrack
@@ -10,6 +14,8 @@ from .utils import matching
 from .utils.gmc import GMC
 from .utils.kalman_filter import KalmanFilterXYWH
 
+DEFAULT_REID_MODEL = "yolo11n-cls.pt"  # crop encoder used when native detector features are unavailable
+
 
 class BOTrack(STrack):
     """
@@ -32,6 +38,8 @@ class BOTrack(STrack):
         predict: Predict the mean and covariance using Kalman filter.
         re_activate: Reactivate a track with updated features and optionally new ID.
         update: Update the track with new detection and frame ID.
+        multi_update_features: Update the features of multiple tracks with one vectorized moving average.
+        multi_update: Update multiple matched tracks with their detections and features.
         tlwh: Property that gets the current position in tlwh format `(top left x, top left y, width, height)`.
         multi_predict: Predict the mean and covariance of multiple object tracks using shared Kalman filter.
         convert_coords: Convert tlwh bounding box coordinates to xywh format.
@@ -70,10 +78,10 @@ class BOTrack(STrack):
 
         self.smooth_feat = None
         self.curr_feat = None
-        if feat is not None:
-            self.update_features(feat)
         self.features = deque([], maxlen=feat_history)
         self.alpha = 0.9
+        if feat is not None:
+            self.update_features(feat)
 
     def update_features(self, feat):
         """Update the feature vector and apply exponential moving average smoothing."""
@@ -107,6 +115,28 @@ class BOTrack(STrack):
             self.update_features(new_track.curr_feat)
         super().update(new_track, frame_id)
 
+    @staticmethod
+    def multi_update_features(stracks, feats):
+        """Update the feature vectors of multiple tracks with one vectorized exponential moving average."""
+        feats = feats / np.linalg.norm(feats, axis=1, keepdims=True)
+        smooth = np.asarray([f if st.smooth_feat is None else st.smooth_feat for st, f in zip(stracks, feats)])
+        alpha = np.asarray([st.alpha for st in stracks], dtype=feats.dtype)[:, None]
+        smooth = alpha * smooth + (1 - alpha) * feats
+        smooth /= np.linalg.norm(smooth, axis=1, keepdims=True)
+        for st, feat, smooth_feat in zip(stracks, feats, smooth):
+            st.curr_feat = feat
+            st.smooth_feat = smooth_feat
+            st.features.append(feat)
+
+    @staticmethod
+    def multi_update(stracks, detections, frame_id):
+        """Update the features of matched tracks, then their states with one batched Kalman correction."""
+        with_feat = [i for i, det in enumerate(detections) if det.curr_feat is not None]
+        if with_feat:
+            feats = np.asarray([detections[i].curr_feat for i in with_feat])
+            BOTrack.multi_update_features([stracks[i] for i in with_feat], feats)
+        STrack.multi_update(stracks, detections, frame_id)
+
     @property
     def tlwh(self):
         """Return the current bounding box position in `(top left x, top left y, width, height)` format."""
@@ -140,7 +170,7 @@ class BOTrack(STrack):
     def tlwh_to_xywh(tlwh):
         """Convert bounding box from tlwh (top-left-width-height) to xywh (center-x-center-y-width-height) format."""
         ret = np.asarray(tlwh).copy()
-        ret[:2] += ret[2:] / 2
+        ret[..., :2] += ret[..., 2:] / 2
         return ret
 
 
@@ -151,15 +181,17 @@ class BOTSORT(BYTETracker):
     Attributes:
         proximity_thresh (float): Threshold for spatial proximity (IoU) between tracks and detections.
         appearance_thresh (float): Threshold for appearance similarity (ReID embeddings) between tracks and detections.
-        encoder (Any): Object to handle ReID embeddings, set to None if ReID is not enabled.
+        encoder (ReID | None): Appearance encoder for detection crops, None if ReID is disabled or uses native features.
         gmc (GMC): An instance of the GMC algorithm for data association.
         args (Any): Parsed command-line arguments containing tracking parameters.
 
     Methods:
+        update: Update the tracker with new detections and their ReID features.
         get_kalmanfilter: Return an instance of KalmanFilterXYWH for object tracking.
         init_track: Initialize track with detections, scores, and classes.
         get_dists: Get distances between tracks and detections using IoU and (optionally) ReID.
         multi_predict: Predict and track multiple objects with YOLOv8 model.
+        multi_update: Update matched tracks with their detections and ReID features.
         reset: Reset the BOTSORT tracker to its initial state.
 
     Examples:
@@ -170,6 +202,8 @@ class BOTSORT(BYTETracker):
 
     Note:
         The class is designed to work with the YOLOv8 object detection model and supports ReID only if enabled via args.
+        With `model: auto` the ReID features are pooled from the detector's own neck and passed to `update`, with any
+        other model the detection crops are embedded by a `ReID` encoder.
     """
 
     def __init__(self, args, frame_rate=30):
@@ -190,45 +224,155 @@ class BOTSORT(BYTETracker):
         self.proximity_thresh = args.proximity_thresh
         self.appearance_thresh = args.appearance_thresh
 
-        if args.with_reid:
-            # Haven't supported BoT-SORT(reid) yet
-            self.encoder = None
-        self.gmc = GMC(method=args.gmc_method)
+        # Native features of the detector are passed to update(), other models embed the detection crops
+        model = args.get("model", "auto")
+        self.encoder = ReID(model) if args.with_reid and model != "auto" else None
+        self.gmc = GMC(
+            method=args.gmc_method,
+            downscale=args.get("gmc_downscale", 2),
+            max_features=args.get("gmc_max_features", 1000),
+            static_thresh=args.get("gmc_static_thresh", 0.0),
+        )
+
+    def update(self, results, img=None, feats=None):
+        """Update the tracker with new detections, embedding all detection crops in one pass if no features given."""
+        if self.args.with_reid and feats is None and len(results):
+            if self.encoder is None:  # no native features, e.g. a non-PyTorch detector
+                self.encoder = ReID(DEFAULT_REID_MODEL)
+            feats = self.encoder(img, results.xyxy)
+        return super().update(results, img, feats)
 
     def get_kalmanfilter(self):
         """Return an instance of KalmanFilterXYWH for predicting and updating object states in the tracking process."""
         return KalmanFilterXYWH()
 
-    def init_track(self, dets, scores, cls, img=None):
+    def init_track(self, dets, scores, cls, img=None, feats=None):
         """Initialize object tracks using detection bounding boxes, scores, class labels, and optional ReID features."""
         if len(dets) == 0:
             return []
-        if self.args.with_reid and self.encoder is not None:
-            features_keep = self.encoder.inference(img, dets)
-            return [BOTrack(xyxy, s, c, f) for (xyxy, s, c, f) in zip(dets, scores, cls, features_keep)]  # detections
+        if self.args.with_reid and feats is not None:
+            return [BOTrack(xyxy, s, c, f) for (xyxy, s, c, f) in zip(dets, scores, cls, feats)]  # detections
         else:
             return [BOTrack(xyxy, s, c) for (xyxy, s, c) in zip(dets, scores, cls)]  # detections
 
     def get_dists(self, tracks, detections):
         """Calculate distances between tracks and detections using IoU and optionally ReID embeddings."""
-        dists = matching.iou_distance(tracks, detections)
-        dists_mask = dists > self.proximity_thresh
+        dists = matching.iou_distance(tracks, detections, sparse=self.gated)
+        dists_mask = (dists.data if self.gated else dists) > self.proximity_thresh
 
         if self.args.fuse_score:
             dists = matching.fuse_score(dists, detections)
 
-        if self.args.with_reid and self.encoder is not None:
-            emb_dists = matching.embedding_distance(tracks, detections) / 2.0
+        if self.args.with_reid:
+            pairs = (dists.row, dists.col) if self.gated else None  # gated pairs without overlap keep a cost of 1
+            emb_dists = matching.embedding_distance(tracks, detections, pairs=pairs) / 2.0
             emb_dists[emb_dists > self.appearance_thresh] = 1.0
             emb_dists[dists_mask] = 1.0
-            dists = np.minimum(dists, emb_dists)
+            if self.gated:
+                dists.data = np.minimum(dists.data, emb_dists)
+            else:
+                dists = np.minimum(dists, emb_dists)
         return dists
 
     def multi_predict(self, tracks):
         """Predict the mean and covariance of multiple object tracks using a shared Kalman filter."""
         BOTrack.multi_predict(tracks)
 
+    def multi_update(self, tracks, detections):
+        """Update matched tracks with their detections and ReID features using one batched Kalman correction."""
+        BOTrack.multi_update(tracks, detections, self.frame_id)
+
     def reset(self):
         """Reset the BOTSORT tracker to its initial state, clearing all tracked objects and internal states."""
         super().reset()
         self.gmc.reset_params()
+
+
+class ReID:
+    """
+    Appearance encoder that embeds all detection crops of a frame in one batched forward pass.
+
+    Any model loadable by AutoBackend can be plugged in. PyTorch models are embedded at the layer before their head,
+    e.g. the pooled backbone features of a YOLO classification model, while other formats must output one embedding
+    per crop, e.g. an exported person ReID network.
+
+    Attributes:
+        model (AutoBackend): The backend running the encoder model.
+        imgsz (Tuple[int, int]): Height and width the crops are resized to.
+        embed (List[int] | None): Index of the embedded layer for PyTorch models, None for other formats.
+
+    Methods:
+        __call__: Embed the detection crops of an image.
+
+    Examples:
+        >>> encoder = ReID("yolo11n-cls.pt")
+        >>> feats = encoder(img, np.array([[10, 20, 110, 220], [300, 40, 360, 200]]))  # (2, 256) unit vectors
+    """
+
+    def __init__(self, model):
+        """Load the encoder model and its input size, e.g. 'yolo11n-cls.pt' or an exported ReID model."""
+        from ultralytics.nn.autobackend import AutoBackend
+
+        self.model = AutoBackend(model, device=select_device(verbose=False), verbose=False)
+        args = (self.model.model.args if self.model.pt else None) or {}
+        imgsz = getattr(self.model, "imgsz", args.get("imgsz", 224))
+        self.imgsz = (imgsz, imgsz) if isinstance(imgsz, int) else tuple(imgsz)
+        self.embed = [len(self.model.model.model) - 2] if self.model.pt else None
+
+    def __call__(self, img, xyxy):
+        """Return L2-normalized embeddings of shape (N, D) for the `xyxy` boxes of a BGR image."""
+        h, w = img.shape[:2]
+        boxes = np.asarray(xyxy)[:, :4].round().astype(int)
+        boxes[:, [0, 1]] = boxes[:, [0, 1]].clip(0, [w - 1, h - 1])
+        boxes[:, [2, 3]] = np.maximum(boxes[:, [2, 3]], boxes[:, [0, 1]] + 1)  # at least one pixel
+        crops = [cv2.resize(img[y1:y2, x1:x2], self.imgsz[::-1]) for x1, y1, x2, y2 in boxes]
+        im = np.ascontiguousarray(np.stack(crops)[..., ::-1].transpose(0, 3, 1, 2))  # BGR to RGB, BHWC to BCHW
+        im = torch.from_numpy(im).to(self.model.device)
+        im = (im.half() if self.model.fp16 else im.float()) / 255
+        bs = len(im) if self.model.pt or self.model.dynamic else self.model.batch  # fixed-batch exports
+        feats = torch.cat([self._forward(im[i : i + bs]) for i in range(0, len(im), bs)]).float()
+        return torch.nn.functional.normalize(feats, dim=1).cpu().numpy()
+
+    def _forward(self, im):
+        """Run one batch through the model and return its embeddings flattened to (B, D)."""
+        n = len(im)
+        if not (self.model.pt or self.model.dynamic) and n < self.model.batch:  # pad the last fixed-size batch
+            im = torch.cat([im, im.new_zeros((self.model.batch - n, *im.shape[1:]))])
+        y = self.model(im, embed=self.embed)
+        if isinstance(y, (list, tuple)):
+            y = torch.stack(y) if self.embed else y[0]
+        return torch.as_tensor(y).flatten(1)[:n]
+
+
+def roi_features(feats, strides, xyxy, orig_shape):
+    """
+    Pool the detector's own neck features inside each detection box, giving ReID embeddings without a second model.
+
+    Boxes are mapped from the original image into the letterboxed network input, then every feature level is average
+    pooled inside them with RoIAlign and the levels are concatenated, all detections at once.
+
+    Args:
+        feats (List[torch.Tensor]): Feature maps of one image with shapes (1, C_i, H_i, W_i), i.e. the detection head
+            inputs.
+        strides (torch.Tensor): Strides of the feature levels.
+        xyxy (np.ndarray): Detection boxes of shape (N, 4) in original image pixels.
+        orig_shape (Tuple[int, int]): Height and width of the original image.
+
+    Returns:
+        (np.ndarray): L2-normalized embeddings of shape (N, sum(C_i)).
+
+    Examples:
+        >>> feats = [torch.rand(1, 64, 80, 80), torch.rand(1, 128, 40, 40), torch.rand(1, 256, 20, 20)]
+        >>> emb = roi_features(feats, torch.tensor([8, 16, 32]), np.array([[10, 20, 110, 220]]), (480, 640))
+    """
+    from torchvision.ops import roi_align
+
+    h, w = (s * int(strides[0]) for s in feats[0].shape[2:])  # letterboxed input shape
+    h0, w0 = orig_shape[:2]
+    gain = min(h / h0, w / w0)
+    pad = round((w - w0 * gain) / 2 - 0.1), round((h - h0 * gain) / 2 - 0.1)  # as in ops.scale_boxes()
+    boxes = torch.as_tensor(np.asarray(xyxy)[:, :4], dtype=torch.float32, device=feats[0].device) * gain
+    boxes += torch.tensor(pad * 2, device=boxes.device)
+    rois = torch.cat([boxes.new_zeros((len(boxes), 1)), boxes], 1)  # batch index 0
+    pooled = [roi_align(f.float(), rois, 1, 1 / float(s), aligned=True).flatten(1) for f, s in zip(feats, strides)]
+    return torch.nn.functional.normalize(torch.cat(pooled, 1), dim=1).cpu().numpy()
@@ -35,8 +35,10 @@ class STrack(BaseTrack):
         multi_predict(stracks): Predict the next states for multiple tracks.
         multi_gmc(stracks, H): Update multiple track states using a homography matrix.
         activate(kalman_filter, frame_id): Activate a new tracklet.
+        multi_activate(stracks, kalman_filter, frame_id): Activate multiple new tracklets.
         re_activate(new_track, frame_id, new_id): Reactivate a previously lost tracklet.
         update(new_track, frame_id): Update the state of a matched track.
+        multi_update(stracks, detections, frame_id): Update or reactivate multiple matched tracks.
         convert_coords(tlwh): Convert bounding box to x-y-aspect-height format.
         tlwh_to_xyah(tlwh): Convert tlwh bounding box to xyah format.
 
@@ -132,6 +134,24 @@ class STrack(BaseTrack):
         self.frame_id = frame_id
         self.start_frame = frame_id
 
+    @staticmethod
+    def multi_activate(stracks, kalman_filter, frame_id):
+        """Activate multiple new tracklets like activate(), initiating their Kalman states in one batched call."""
+        if len(stracks) <= 0:
+            return
+        tlwh = np.asarray([st._tlwh for st in stracks])
+        multi_mean, multi_covariance = kalman_filter.multi_initiate(stracks[0].convert_coords(tlwh))
+        for st, mean, cov in zip(stracks, multi_mean, multi_covariance):
+            st.kalman_filter = kalman_filter
+            st.track_id = st.next_id()
+            st.mean, st.covariance = mean, cov
+            st.tracklet_len = 0
+            st.state = TrackState.Tracked
+            if frame_id == 1:
+                st.is_activated = True
+            st.frame_id = frame_id
+            st.start_frame = frame_id
+
     def re_activate(self, new_track, frame_id, new_id=False):
         """Reactivates a previously lost track using new detection data and updates its state and attributes."""
         self.mean, self.covariance = self.kalman_filter.update(
@@ -177,6 +197,36 @@ class STrack(BaseTrack):
         self.angle = new_track.angle
         self.idx = new_track.idx
 
+    @staticmethod
+    def multi_update(stracks, detections, frame_id):
+        """
+        Update matched tracks with their detections, correcting all Kalman states in one batched call.
+
+        Tracked tracks are updated like update() and other tracks are reactivated like re_activate() with their
+        existing IDs.
+
+        Args:
+            stracks (List[STrack]): Matched tracks.
+            detections (List[STrack]): The detection matched to each track.
+            frame_id (int): The ID of the current frame.
+        """
+        if len(stracks) <= 0:
+            return
+        multi_mean = np.asarray([st.mean for st in stracks])
+        multi_covariance = np.asarray([st.covariance for st in stracks])
+        measurement = stracks[0].convert_coords(np.asarray([det.tlwh for det in detections]))
+        multi_mean, multi_covariance = stracks[0].kalman_filter.multi_update(multi_mean, multi_covariance, measurement)
+        for st, det, mean, cov in zip(stracks, detections, multi_mean, multi_covariance):
+            st.mean, st.covariance = mean, cov
+            st.tracklet_len = st.tracklet_len + 1 if st.state == TrackState.Tracked else 0
+            st.state = TrackState.Tracked
+            st.is_activated = True
+            st.frame_id = frame_id
+            st.score = det.score
+            st.cls = det.cls
+            st.angle = det.angle
+            st.idx = det.idx
+
     def convert_coords(self, tlwh):
         """Convert a bounding box's top-left-width-height format to its x-y-aspect-height equivalent."""
         return self.tlwh_to_xyah(tlwh)
@@ -202,8 +252,8 @@ class STrack(BaseTrack):
     def tlwh_to_xyah(tlwh):
         """Convert bounding box from tlwh format to center-x-center-y-aspect-height (xyah) format."""
         ret = np.asarray(tlwh).copy()
-        ret[:2] += ret[2:] / 2
-        ret[2] /= ret[3]
+        ret[..., :2] += ret[..., 2:] / 2
+        ret[..., 2] /= ret[..., 3]
         return ret
 
     @property
@@ -247,18 +297,20 @@ class BYTETracker:
         frame_id (int): The current frame ID.
         args (Namespace): Command-line arguments.
         max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
+        gated (bool): Whether to associate spatially gated candidate pairs with sparse cost matrices.
         kalman_filter (KalmanFilterXYAH): Kalman Filter object.
 
     Methods:
-        update(results, img=None): Updates object tracker with new detections.
+        update(results, img=None, feats=None): Updates object tracker with new detections.
         get_kalmanfilter(): Returns a Kalman filter object for tracking bounding boxes.
-        init_track(dets, scores, cls, img=None): Initialize object tracking with detections.
+        init_track(dets, scores, cls, img=None, feats=None): Initialize object tracking with detections.
         get_dists(tracks, detections): Calculates the distance between tracks and detections.
         multi_predict(tracks): Predicts the location of tracks.
+        multi_update(tracks, detections): Updates matched tracks with their detections.
         reset_id(): Resets the ID counter of STrack.
         joint_stracks(tlista, tlistb): Combines two lists of stracks.
         sub_stracks(tlista, tlistb): Filters out the stracks present in the second list from the first list.
-        remove_duplicate_stracks(stracksa, stracksb): Removes duplicate stracks based on IoU.
+        remove_duplicate_stracks(stracksa, stracksb, sparse=False): Removes duplicate stracks based on IoU.
 
     Examples:
         Initialize BYTETracker and update with detection results
@@ -287,11 +339,12 @@ class BYTETracker:
         self.frame_id = 0
         self.args = args
         self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
+        self.gated = args.get("gated", False)
         self.kalman_filter = self.get_kalmanfilter()
         self.reset_id()
 
-    def update(self, results, img=None):
-        """Updates the tracker with new detections and returns the current list of tracked objects."""
+    def update(self, results, img=None, feats=None):
+        """Updates the tracker with new detections and optional ReID features, returning the tracked objects."""
         self.frame_id += 1
         activated_stracks = []
         refind_stracks = []
@@ -315,8 +368,11 @@ class BYTETracker:
         scores_second = scores[inds_second]
         cls_keep = cls[remain_inds]
         cls_second = cls[inds_second]
+        feats_keep = feats_second = None
+        if feats is not None:
+            feats_keep, feats_second = feats[remain_inds], feats[inds_second]
 
-        detections = self.init_track(dets, scores_keep, cls_keep, img)
+        detections = self.init_track(dets, scores_keep, cls_keep, img, feats_keep)
         # Add newly detected tracklets to tracked_stracks
         unconfirmed = []
         tracked_stracks = []  # type: list[STrack]
@@ -337,29 +393,29 @@ class BYTETracker:
         dists = self.get_dists(strack_pool, detections)
         matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
 
+        # Matched tracks and detections of all associations, updated together in one batched Kalman correction
+        matched_tracks, matched_dets = [], []
         for itracked, idet in matches:
             track = strack_pool[itracked]
-            det = detections[idet]
+            matched_tracks.append(track)
+            matched_dets.append(detections[idet])
             if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
                 activated_stracks.append(track)
             else:
-                track.re_activate(det, self.frame_id, new_id=False)
                 refind_stracks.append(track)
         # Step 3: Second association, with low score detection boxes association the untrack to the low score detections
-        detections_second = self.init_track(dets_second, scores_second, cls_second, img)
+        detections_second = self.init_track(dets_second, scores_second, cls_second, img, feats_second)
         r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
         # TODO
-        dists = matching.iou_distance(r_tracked_stracks, detections_second)
+        dists = matching.iou_distance(r_tracked_stracks, detections_second, sparse=self.gated)
         matches, u_track, u_detection_second = matching.linear_assignment(dists, thresh=0.5)
         for itracked, idet in matches:
             track = r_tracked_stracks[itracked]
-            det = detections_second[idet]
+            matched_tracks.append(track)
+            matched_dets.append(detections_second[idet])
             if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
                 activated_stracks.append(track)
             else:
-                track.re_activate(det, self.frame_id, new_id=False)
                 refind_stracks.append(track)
 
         for it in u_track:
@@ -372,19 +428,18 @@ class BYTETracker:
         dists = self.get_dists(unconfirmed, detections)
         matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
         for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
+            matched_tracks.append(unconfirmed[itracked])
+            matched_dets.append(detections[idet])
             activated_stracks.append(unconfirmed[itracked])
+        self.multi_update(matched_tracks, matched_dets)
         for it in u_unconfirmed:
             track = unconfirmed[it]
             track.mark_removed()
             removed_stracks.append(track)
         # Step 4: Init new stracks
-        for inew in u_detection:
-            track = detections[inew]
-            if track.score < self.args.new_track_thresh:
-                continue
-            track.activate(self.kalman_filter, self.frame_id)
-            activated_stracks.append(track)
+        new_stracks = [detections[i] for i in u_detection if detections[i].score >= self.args.new_track_thresh]
+        STrack.multi_activate(new_stracks, self.kalman_filter, self.frame_id)
+        activated_stracks.extend(new_stracks)
         # Step 5: Update state
         for track in self.lost_stracks:
             if self.frame_id - track.end_frame > self.max_time_lost:
@@ -397,7 +452,9 @@ class BYTETracker:
         self.lost_stracks = self.sub_stracks(self.lost_stracks, self.tracked_stracks)
         self.lost_stracks.extend(lost_stracks)
         self.lost_stracks = self.sub_stracks(self.lost_stracks, self.removed_stracks)
-        self.tracked_stracks, self.lost_stracks = self.remove_duplicate_stracks(self.tracked_stracks, self.lost_stracks)
+        self.tracked_stracks, self.lost_stracks = self.remove_duplicate_stracks(
+            self.tracked_stracks, self.lost_stracks, self.gated
+        )
         self.removed_stracks.extend(removed_stracks)
         if len(self.removed_stracks) > 1000:
             self.removed_stracks = self.removed_stracks[-999:]  # clip remove stracks to 1000 maximum
@@ -408,13 +465,13 @@ class BYTETracker:
         """Returns a Kalman filter object for tracking bounding boxes using KalmanFilterXYAH."""
         return KalmanFilterXYAH()
 
-    def init_track(self, dets, scores, cls, img=None):
+    def init_track(self, dets, scores, cls, img=None, feats=None):
         """Initializes object tracking with given detections, scores, and class labels using the STrack algorithm."""
         return [STrack(xyxy, s, c) for (xyxy, s, c) in zip(dets, scores, cls)] if len(dets) else []  # detections
 
     def get_dists(self, tracks, detections):
         """Calculates the distance between tracks and detections using IoU and optionally fuses scores."""
-        dists = matching.iou_distance(tracks, detections)
+        dists = matching.iou_distance(tracks, detections, sparse=self.gated)
         if self.args.fuse_score:
             dists = matching.fuse_score(dists, detections)
         return dists
@@ -423,6 +480,10 @@ class BYTETracker:
         """Predict the next states for multiple tracks using Kalman filter."""
         STrack.multi_predict(tracks)
 
+    def multi_update(self, tracks, detections):
+        """Update matched tracks with their detections using one batched Kalman correction."""
+        STrack.multi_update(tracks, detections, self.frame_id)
+
     @staticmethod
     def reset_id():
         """Resets the ID counter for STrack instances to ensure unique track IDs across tracking sessions."""
@@ -459,10 +520,13 @@ class BYTETracker:
         return [t for t in tlista if t.track_id not in track_ids_b]
 
     @staticmethod
-    def remove_duplicate_stracks(stracksa, stracksb):
+    def remove_duplicate_stracks(stracksa, stracksb, sparse=False):
         """Removes duplicate stracks from two lists based on Intersection over Union (IoU) distance."""
-        pdist = matching.iou_distance(stracksa, stracksb)
-        pairs = np.where(pdist < 0.15)
+        pdist = matching.iou_distance(stracksa, stracksb, sparse=sparse)
+        if sparse:  # only intersecting pairs are stored
+            pairs = pdist.row[pdist.data < 0.15], pdist.col[pdist.data < 0.15]
+        else:
+            pairs = np.where(pdist < 0.15)
         dupa, dupb = [], []
         for p, q in zip(*pairs):
             timep = stracksa[p].frame_id - stracksa[p].start_frame
@@ -8,7 +8,8 @@ import torch
 from ultralytics.utils import IterableSimpleNamespace, yaml_load
 from ultralytics.utils.checks import check_yaml
 
-from .bot_sort import BOTSORT
+from .batched_tracker import BatchedBYTETracker
+from .bot_sort import BOTSORT, roi_features
 from .byte_tracker import BYTETracker
 
 # A mapping of tracker types to corresponding tracker classes
@@ -44,9 +45,16 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
     if cfg.tracker_type not in {"bytetrack", "botsort"}:
         raise AssertionError(f"Only 'bytetrack' and 'botsort' are supported for now, but got '{cfg.tracker_type}'")
 
+    # BoT-SORT ReID with 'model: auto' reuses the detector's neck features where the model exposes them
+    reid = cfg.tracker_type == "botsort" and cfg.with_reid and cfg.get("model", "auto") == "auto"
+    predictor.native_feats = reid and register_feature_hook(predictor)
+
+    tracker_class = TRACKER_MAP[cfg.tracker_type]
+    if cfg.tracker_type == "bytetrack" and cfg.get("batched", False):
+        tracker_class = BatchedBYTETracker
     trackers = []
     for _ in range(predictor.dataset.bs):
-        tracker = TRACKER_MAP[cfg.tracker_type](args=cfg, frame_rate=30)
+        tracker = tracker_class(args=cfg, frame_rate=30)
         trackers.append(tracker)
         if predictor.dataset.mode != "stream":  # only need one tracker for other modes
             break
@@ -69,17 +77,25 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
     """
     is_obb = predictor.args.task == "obb"
     is_stream = predictor.dataset.mode == "stream"
+    for result in predictor.results:  # queue the box copies of the whole batch, synced once by the first cpu()
+        (result.obb if is_obb else result.boxes).prefetch()
     for i, result in enumerate(predictor.results):
-        tracker = predictor.trackers[i if is_stream else 0]
+        # Deadline batches may hold any subset of the streams, so route each result by its source
+        k = predictor.dataset.sources.index(result.path) if is_stream else 0
+        tracker = predictor.trackers[k]
         vid_path = predictor.save_dir / Path(result.path).name
-        if not persist and predictor.vid_path[i if is_stream else 0] != vid_path:
+        if not persist and predictor.vid_path[k] != vid_path:
             tracker.reset()
-            predictor.vid_path[i if is_stream else 0] = vid_path
+            predictor.vid_path[k] = vid_path
 
         det = (result.obb if is_obb else result.boxes).cpu().numpy()
         if len(det) == 0:
             continue
-        tracks = tracker.update(det, result.orig_img)
+        feats = None
+        if predictor.native_feats:  # ReID features pooled from the detector's neck
+            maps = [f[i : i + 1] for f in predictor.forward_state.feats]
+            feats = roi_features(maps, predictor._strides, det.xyxy, result.orig_shape)
+        tracks = tracker.update(det, result.orig_img, feats)
         if len(tracks) == 0:
             continue
         idx = tracks[:, -1].astype(int)
@@ -89,6 +105,41 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
         predictor.results[i].update(**update_args)
 
 
+def register_feature_hook(predictor: object) -> bool:
+    """
+    Keep the inputs of the detection head on the predictor, so BoT-SORT ReID can reuse the detector's neck features.
+
+    Only in-memory PyTorch detectors expose their feature maps; with other backends nothing is registered and the
+    tracker falls back to embedding detection crops with a separate ReID model.
+
+    Args:
+        predictor (object): The predictor whose model's detection head is hooked.
+
+    Returns:
+        (bool): Whether the feature maps are available on `predictor.forward_state.feats` after each forward pass.
+
+    Examples:
+        >>> register_feature_hook(predictor)
+        >>> predictor.model(im)  # predictor.forward_state.feats now holds the P3-P5 feature maps of the batch
+    """
+    from ultralytics.nn.modules.head import Detect
+
+    model = predictor.model
+    head = model.model.model[-1] if getattr(model, "pt", False) or getattr(model, "nn_module", False) else None
+    if not isinstance(head, Detect):
+        return False
+    if hasattr(predictor, "_strides"):  # already registered
+        return True
+
+    def pre_hook(module, inputs):
+        """Store a copy of the feature map list, which the head modifies in place, for the thread running inference."""
+        predictor.forward_state.feats = list(inputs[0])
+
+    predictor._strides = head.stride
+    head.register_forward_pre_hook(pre_hook)
+    return True
+
+
 def register_tracker(model: object, persist: bool) -> None:
     """
     Register tracking callbacks to the model for object tracking during prediction.
@@ -1,7 +1,5 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
-import copy
-
 import cv2
 import numpy as np
 
@@ -13,14 +11,23 @@ class GMC:
     Generalized Motion Compensation (GMC) class for tracking and object detection in video frames.
 
     This class provides methods for tracking and detecting objects based on several tracking algorithms including ORB,
-    SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency.
+    SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency, masking
+    detections out of the keypoint search, and skipping frames of a static camera.
+
+    Sparse Optical Flow tracks its corners from frame to frame and keeps the RANSAC inliers outside detections, only
+    detecting new corners when fewer than `redetect_ratio` of the last detected ones remain.
 
     Attributes:
         method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
         downscale (int): Factor by which to downscale the frames for processing.
+        redetect_ratio (float): Fraction of the last detected corners below which Sparse Optical Flow re-detects them.
+        static_thresh (float): Change of a frame thumbnail below which the camera is taken as static and the frame
+            is skipped, 0 to disable.
         prevFrame (np.ndarray): Previous frame for tracking.
         prevKeyPoints (list): Keypoints from the previous frame.
         prevDescriptors (np.ndarray): Descriptors from the previous frame.
+        prevThumb (np.ndarray): Thumbnail of the last processed frame for the static camera check.
+        numDetected (int): Number of corners at the last Sparse Optical Flow detection.
         initializedFirstFrame (bool): Flag indicating if the first frame has been processed.
 
     Methods:
@@ -28,6 +35,10 @@ class GMC:
         apply_ecc: Apply the ECC algorithm to a raw frame.
         apply_features: Apply feature-based methods like ORB or SIFT to a raw frame.
         apply_sparseoptflow: Apply the Sparse Optical Flow method to a raw frame.
+        preprocess: Downscale a frame and convert it to grayscale.
+        get_mask: Return the keypoint search mask without the frame border and detections.
+        detect_corners: Detect new corners for Sparse Optical Flow.
+        is_static: Check whether the camera moved since the last processed frame.
         reset_params: Reset the internal parameters of the GMC object.
 
     Examples:
@@ -40,13 +51,25 @@ class GMC:
                [4, 5, 6]])
     """
 
-    def __init__(self, method: str = "sparseOptFlow", downscale: int = 2) -> None:
+    def __init__(
+        self,
+        method: str = "sparseOptFlow",
+        downscale: int = 2,
+        max_features: int = 1000,
+        redetect_ratio: float = 0.5,
+        static_thresh: float = 0.0,
+    ) -> None:
         """
         Initialize a Generalized Motion Compensation (GMC) object with tracking method and downscale factor.
 
         Args:
             method (str): The tracking method to use. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
             downscale (int): Downscale factor for processing frames.
+            max_features (int): Maximum number of corners tracked by Sparse Optical Flow.
+            redetect_ratio (float): Fraction of the last detected corners below which Sparse Optical Flow re-detects
+                them, 1 to detect corners on every frame.
+            static_thresh (float): Change of a frame thumbnail against the last processed frame below which the frame
+                is skipped with an identity transform, see `is_static()`. 0 disables the check.
 
         Examples:
             Initialize a GMC object with the 'sparseOptFlow' method and a downscale factor of 2
@@ -56,6 +79,8 @@ class GMC:
 
         self.method = method
         self.downscale = max(1, downscale)
+        self.redetect_ratio = redetect_ratio
+        self.static_thresh = static_thresh
 
         if self.method == "orb":
             self.detector = cv2.FastFeatureDetector_create(20)
@@ -75,7 +100,7 @@ class GMC:
 
         elif self.method == "sparseOptFlow":
             self.feature_params = dict(
-                maxCorners=1000, qualityLevel=0.01, minDistance=1, blockSize=3, useHarrisDetector=False, k=0.04
+                maxCorners=max_features, qualityLevel=0.01, minDistance=1, blockSize=3, useHarrisDetector=False, k=0.04
             )
 
         elif self.method in {"none", "None", None}:
@@ -86,6 +111,8 @@ class GMC:
         self.prevFrame = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
+        self.prevThumb = None
+        self.numDetected = 0
         self.initializedFirstFrame = False
 
     def apply(self, raw_frame: np.ndarray, detections: list = None) -> np.ndarray:
@@ -94,7 +121,8 @@ class GMC:
 
         Args:
             raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
-            detections (List | None): List of detections to be used in the processing.
+            detections (np.ndarray | None): Detections in xywh format with shape (N, >=4), as passed by the trackers,
+                whose boxes are excluded from the keypoints.
 
         Returns:
             (np.ndarray): Transformation matrix with shape (2, 3).
@@ -111,10 +139,56 @@ class GMC:
         elif self.method == "ecc":
             return self.apply_ecc(raw_frame)
         elif self.method == "sparseOptFlow":
-            return self.apply_sparseoptflow(raw_frame)
+            return self.apply_sparseoptflow(raw_frame, detections)
         else:
             return np.eye(2, 3)
 
+    def preprocess(self, raw_frame: np.ndarray) -> np.ndarray:
+        """Downscale a BGR frame, then convert it to grayscale, which is cheaper than converting the full frame."""
+        height, width = raw_frame.shape[:2]
+        if self.downscale > 1:
+            raw_frame = cv2.resize(raw_frame, (width // self.downscale, height // self.downscale))
+        return cv2.cvtColor(raw_frame, cv2.COLOR_BGR2GRAY) if raw_frame.ndim == 3 else raw_frame
+
+    def get_mask(self, frame: np.ndarray, detections: np.ndarray = None) -> np.ndarray:
+        """Return the keypoint search mask of a processed frame without its border and the detection boxes."""
+        height, width = frame.shape[:2]
+        mask = np.zeros_like(frame)
+        mask[int(0.02 * height) : int(0.98 * height), int(0.02 * width) : int(0.98 * width)] = 255
+        if detections is not None and len(detections):
+            xywh = np.asarray(detections, dtype=np.float32)[:, :4] / self.downscale
+            xyxy = np.concatenate([xywh[:, :2] - xywh[:, 2:] / 2, xywh[:, :2] + xywh[:, 2:] / 2], 1)
+            for x1, y1, x2, y2 in xyxy.clip(0, [width, height, width, height]).astype(np.int_):
+                mask[y1:y2, x1:x2] = 0
+        return mask
+
+    def is_static(self, frame: np.ndarray) -> bool:
+        """
+        Check with a small thumbnail whether the camera is static since the last processed frame.
+
+        The change is the mean absolute gray level difference of the 75% least changed thumbnail pixels, which ignores
+        moving objects and is about 0.05 for sensor noise and 0.35 for a half pixel shift of a 1080p frame. Skipped
+        frames are not stored, so slow camera motion accumulates until it is detected and compensated at once.
+
+        Args:
+            frame (np.ndarray): The processed grayscale frame.
+
+        Returns:
+            (bool): True if the frame can be skipped with an identity transform.
+        """
+        if self.static_thresh <= 0:
+            return False
+        height, width = frame.shape[:2]
+        thumb = cv2.resize(frame, (160, max(1, 160 * height // width)), interpolation=cv2.INTER_AREA)
+        thumb = thumb.astype(np.float32)
+        if self.prevThumb is not None:
+            diff = np.abs(thumb - self.prevThumb).ravel()
+            k = int(0.75 * diff.size)
+            if np.partition(diff, k)[:k].mean() < self.static_thresh:
+                return True
+        self.prevThumb = thumb
+        return False
+
     def apply_ecc(self, raw_frame: np.ndarray) -> np.ndarray:
         """
         Apply the ECC (Enhanced Correlation Coefficient) algorithm to a raw frame for motion compensation.
@@ -140,11 +214,13 @@ class GMC:
         if self.downscale > 1.0:
             frame = cv2.GaussianBlur(frame, (3, 3), 1.5)
             frame = cv2.resize(frame, (width // self.downscale, height // self.downscale))
+        if self.is_static(frame):
+            return H
 
         # Handle first frame
         if not self.initializedFirstFrame:
             # Initialize data
-            self.prevFrame = frame.copy()
+            self.prevFrame = frame
 
             # Initialization done
             self.initializedFirstFrame = True
@@ -166,7 +242,7 @@ class GMC:
 
         Args:
             raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
-            detections (List | None): List of detections to be used in the processing.
+            detections (np.ndarray | None): Detections in xywh format with shape (N, >=4), excluded from the keypoints.
 
         Returns:
             (np.ndarray): Transformation matrix with shape (2, 3).
@@ -178,25 +254,14 @@ class GMC:
             >>> print(transformation_matrix.shape)
             (2, 3)
         """
-        height, width, _ = raw_frame.shape
-        frame = cv2.cvtColor(raw_frame, cv2.COLOR_BGR2GRAY)
+        frame = self.preprocess(raw_frame)
+        height, width = frame.shape
         H = np.eye(2, 3)
-
-        # Downscale image
-        if self.downscale > 1.0:
-            frame = cv2.resize(frame, (width // self.downscale, height // self.downscale))
-            width = width // self.downscale
-            height = height // self.downscale
+        if self.is_static(frame):
+            return H
 
         # Find the keypoints
-        mask = np.zeros_like(frame)
-        mask[int(0.02 * height) : int(0.98 * height), int(0.02 * width) : int(0.98 * width)] = 255
-        if detections is not None:
-            for det in detections:
-                tlbr = (det[:4] / self.downscale).astype(np.int_)
-                mask[tlbr[1] : tlbr[3], tlbr[0] : tlbr[2]] = 0
-
-        keypoints = self.detector.detect(frame, mask)
+        keypoints = self.detector.detect(frame, self.get_mask(frame, detections))
 
         # Compute the descriptors
         keypoints, descriptors = self.extractor.compute(frame, keypoints)
@@ -204,9 +269,9 @@ class GMC:
         # Handle first frame
         if not self.initializedFirstFrame:
             # Initialize data
-            self.prevFrame = frame.copy()
-            self.prevKeyPoints = copy.copy(keypoints)
-            self.prevDescriptors = copy.copy(descriptors)
+            self.prevFrame = frame
+            self.prevKeyPoints = keypoints
+            self.prevDescriptors = descriptors
 
             # Initialization done
             self.initializedFirstFrame = True
@@ -225,9 +290,9 @@ class GMC:
         # Handle empty matches case
         if len(knnMatches) == 0:
             # Store to next iteration
-            self.prevFrame = frame.copy()
-            self.prevKeyPoints = copy.copy(keypoints)
-            self.prevDescriptors = copy.copy(descriptors)
+            self.prevFrame = frame
+            self.prevKeyPoints = keypoints
+            self.prevDescriptors = descriptors
 
             return H
 
@@ -297,18 +362,22 @@ class GMC:
             LOGGER.warning("WARNING: not enough matching points")
 
         # Store to next iteration
-        self.prevFrame = frame.copy()
-        self.prevKeyPoints = copy.copy(keypoints)
-        self.prevDescriptors = copy.copy(descriptors)
+        self.prevFrame = frame
+        self.prevKeyPoints = keypoints
+        self.prevDescriptors = descriptors
 
         return H
 
-    def apply_sparseoptflow(self, raw_frame: np.ndarray) -> np.ndarray:
+    def apply_sparseoptflow(self, raw_frame: np.ndarray, detections: np.ndarray = None) -> np.ndarray:
         """
         Apply Sparse Optical Flow method to a raw frame.
 
+        Corners are tracked with pyramidal Lucas-Kanade from the previous frame and the RANSAC inliers outside the
+        detections are tracked further, new corners are only detected when too few of them remain.
+
         Args:
             raw_frame (np.ndarray): The raw frame to be processed, with shape (H, W, C).
+            detections (np.ndarray | None): Detections in xywh format with shape (N, >=4), excluded from the corners.
 
         Returns:
             (np.ndarray): Transformation matrix with shape (2, 3).
@@ -320,21 +389,16 @@ class GMC:
             [[1. 0. 0.]
              [0. 1. 0.]]
         """
-        height, width, _ = raw_frame.shape
-        frame = cv2.cvtColor(raw_frame, cv2.COLOR_BGR2GRAY)
+        frame = self.preprocess(raw_frame)
         H = np.eye(2, 3)
-
-        # Downscale image
-        if self.downscale > 1.0:
-            frame = cv2.resize(frame, (width // self.downscale, height // self.downscale))
-
-        # Find the keypoints
-        keypoints = cv2.goodFeaturesToTrack(frame, mask=None, **self.feature_params)
+        if self.is_static(frame):
+            return H
+        mask = self.get_mask(frame, detections)
 
         # Handle first frame
-        if not self.initializedFirstFrame or self.prevKeyPoints is None:
-            self.prevFrame = frame.copy()
-            self.prevKeyPoints = copy.copy(keypoints)
+        if not self.initializedFirstFrame or self.prevKeyPoints is None or len(self.prevKeyPoints) == 0:
+            self.prevFrame = frame
+            self.prevKeyPoints = self.detect_corners(frame, mask)
             self.initializedFirstFrame = True
             return H
 
@@ -342,35 +406,45 @@ class GMC:
         matchedKeypoints, status, _ = cv2.calcOpticalFlowPyrLK(self.prevFrame, frame, self.prevKeyPoints, None)
 
         # Leave good correspondences only
-        prevPoints = []
-        currPoints = []
-
-        for i in range(len(status)):
-            if status[i]:
-                prevPoints.append(self.prevKeyPoints[i])
-                currPoints.append(matchedKeypoints[i])
-
-        prevPoints = np.array(prevPoints)
-        currPoints = np.array(currPoints)
+        good = status.ravel() == 1
+        prevPoints, currPoints = self.prevKeyPoints[good], matchedKeypoints[good]
 
         # Find rigid matrix
-        if (prevPoints.shape[0] > 4) and (prevPoints.shape[0] == currPoints.shape[0]):
-            H, _ = cv2.estimateAffinePartial2D(prevPoints, currPoints, cv2.RANSAC)
-
-            if self.downscale > 1.0:
-                H[0, 2] *= self.downscale
-                H[1, 2] *= self.downscale
+        if len(prevPoints) > 4:
+            A, inliers = cv2.estimateAffinePartial2D(prevPoints, currPoints, cv2.RANSAC)
+            if A is not None:
+                H = A
+                currPoints = currPoints[inliers.ravel() == 1]  # outliers are likely on moving objects
+                if self.downscale > 1.0:
+                    H[0, 2] *= self.downscale
+                    H[1, 2] *= self.downscale
         else:
             LOGGER.warning("WARNING: not enough matching points")
 
-        self.prevFrame = frame.copy()
-        self.prevKeyPoints = copy.copy(keypoints)
+        # Keep tracking the background corners, re-detect when too few are left
+        xy = currPoints.reshape(-1, 2).round().astype(np.int_)
+        inside = (xy >= 0).all(1) & (xy[:, 0] < frame.shape[1]) & (xy[:, 1] < frame.shape[0])
+        currPoints = currPoints[inside][mask[xy[inside, 1], xy[inside, 0]] > 0]
+        if len(currPoints) < self.redetect_ratio * self.numDetected or len(currPoints) <= 4:
+            currPoints = self.detect_corners(frame, mask)
+
+        self.prevFrame = frame
+        self.prevKeyPoints = currPoints
 
         return H
 
+    def detect_corners(self, frame: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Detect corners to track within `mask` and remember their number for the re-detection check."""
+        corners = cv2.goodFeaturesToTrack(frame, mask=mask, **self.feature_params)
+        corners = np.zeros((0, 1, 2), dtype=np.float32) if corners is None else corners
+        self.numDetected = len(corners)
+        return corners
+
     def reset_params(self) -> None:
         """Reset the internal parameters including previous frame, keypoints, and descriptors."""
         self.prevFrame = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
+        self.prevThumb = None
+        self.numDetected = 0
         self.initializedFirstFrame = False
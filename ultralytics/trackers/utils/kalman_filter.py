@@ -25,6 +25,9 @@ class KalmanFilterXYAH:
         project: Projects the state distribution to measurement space.
         multi_predict: Runs the Kalman filter prediction step (vectorized version).
         update: Runs the Kalman filter correction step.
+        multi_initiate: Creates tracks from unassociated measurements (vectorized version).
+        multi_project: Projects state distributions to measurement space (vectorized version).
+        multi_update: Runs the Kalman filter correction step (vectorized version).
         gating_distance: Computes the gating distance between state distribution and measurements.
 
     Examples:
@@ -235,6 +238,100 @@ class KalmanFilterXYAH:
         new_covariance = covariance - np.linalg.multi_dot((kalman_gain, projected_cov, kalman_gain.T))
         return new_mean, new_covariance
 
+    def multi_initiate(self, measurement: np.ndarray):
+        """
+        Create tracks from unassociated measurements (Vectorized version).
+
+        Args:
+            measurement (np.ndarray): Bounding boxes (x, y, a, h) with shape (N, 4), with center position (x, y),
+                aspect ratio a, and height h.
+
+        Returns:
+            (np.ndarray): Mean matrix of the new tracks with shape (N, 8). Unobserved velocities are initialized to 0.
+            (np.ndarray): Covariance matrix of the new tracks with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> measurement = np.array([[100, 50, 1.5, 200], [300, 80, 0.5, 100]])
+            >>> mean, covariance = kf.multi_initiate(measurement)
+        """
+        h = measurement[:, 3]
+        std = np.stack(
+            [
+                2 * self._std_weight_position * h,
+                2 * self._std_weight_position * h,
+                np.full_like(h, 1e-2),
+                2 * self._std_weight_position * h,
+                10 * self._std_weight_velocity * h,
+                10 * self._std_weight_velocity * h,
+                np.full_like(h, 1e-5),
+                10 * self._std_weight_velocity * h,
+            ],
+            axis=1,
+        )
+        mean = np.concatenate([measurement, np.zeros_like(measurement)], axis=1)
+        covariance = np.square(std)[:, None] * np.eye(8)  # batch of diagonal matrices
+        return mean, covariance
+
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray):
+        """
+        Project state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (np.ndarray): Projected means with shape (N, 4).
+            (np.ndarray): Projected covariance matrices with shape (N, 4, 4).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = np.random.rand(10, 8)
+            >>> covariance = np.tile(np.eye(8), (10, 1, 1))
+            >>> projected_mean, projected_covariance = kf.multi_project(mean, covariance)
+        """
+        std_pos = self._std_weight_position * mean[:, 3]
+        std = np.stack([std_pos, std_pos, np.full_like(std_pos, 1e-1), std_pos], axis=1)
+        innovation_cov = np.square(std)[:, None] * np.eye(4)
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
+    def multi_update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
+        """
+        Run Kalman filter correction step (Vectorized version).
+
+        The projected covariances of all tracks are solved for their Kalman gains in one batched np.linalg.solve()
+        call instead of one Cholesky factorization per track.
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the predicted states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the predicted states.
+            measurement (np.ndarray): The Nx4 matrix of measurements (x, y, a, h), one per state, where (x, y) is the
+                center position, a the aspect ratio, and h the height of the bounding box.
+
+        Returns:
+            (np.ndarray): Measurement-corrected state means with shape (N, 8).
+            (np.ndarray): Measurement-corrected state covariances with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean, covariance = kf.multi_initiate(np.array([[100, 50, 1.5, 200], [300, 80, 0.5, 100]]))
+            >>> measurement = np.array([[102, 51, 1.5, 198], [299, 82, 0.5, 101]])
+            >>> new_mean, new_covariance = kf.multi_update(mean, covariance, measurement)
+        """
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+
+        # Solve S @ K.T = (P @ H.T).T for the gains K of all tracks at once, S is symmetric so K = (S^-1 @ H @ P).T
+        kalman_gain = np.linalg.solve(projected_cov, self._update_mat @ covariance).transpose(0, 2, 1)
+        innovation = measurement - projected_mean
+
+        new_mean = mean + np.einsum("nij,nj->ni", kalman_gain, innovation)
+        new_covariance = covariance - kalman_gain @ projected_cov @ kalman_gain.transpose(0, 2, 1)
+        return new_mean, new_covariance
+
     def gating_distance(
         self,
         mean: np.ndarray,
@@ -307,6 +404,8 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
         project: Projects the state distribution to measurement space.
         multi_predict: Runs the Kalman filter prediction step in a vectorized manner.
         update: Runs the Kalman filter correction step.
+        multi_initiate: Creates tracks from unassociated measurements in a vectorized manner.
+        multi_project: Projects state distributions to measurement space in a vectorized manner.
 
     Examples:
         Create a Kalman filter and initialize a track
@@ -469,6 +568,75 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
 
         return mean, covariance
 
+    def multi_initiate(self, measurement):
+        """
+        Create tracks from unassociated measurements (Vectorized version).
+
+        Args:
+            measurement (np.ndarray): Bounding boxes (x, y, w, h) with shape (N, 4), with center position (x, y),
+                width, and height.
+
+        Returns:
+            (np.ndarray): Mean matrix of the new tracks with shape (N, 8). Unobserved velocities are initialized to 0.
+            (np.ndarray): Covariance matrix of the new tracks with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYWH()
+            >>> measurement = np.array([[100, 50, 20, 40], [300, 80, 10, 30]])
+            >>> mean, covariance = kf.multi_initiate(measurement)
+        """
+        w, h = measurement[:, 2], measurement[:, 3]
+        std = np.stack(
+            [
+                2 * self._std_weight_position * w,
+                2 * self._std_weight_position * h,
+                2 * self._std_weight_position * w,
+                2 * self._std_weight_position * h,
+                10 * self._std_weight_velocity * w,
+                10 * self._std_weight_velocity * h,
+                10 * self._std_weight_velocity * w,
+                10 * self._std_weight_velocity * h,
+            ],
+            axis=1,
+        )
+        mean = np.concatenate([measurement, np.zeros_like(measurement)], axis=1)
+        covariance = np.square(std)[:, None] * np.eye(8)  # batch of diagonal matrices
+        return mean, covariance
+
+    def multi_project(self, mean, covariance):
+        """
+        Project state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (np.ndarray): Projected means with shape (N, 4).
+            (np.ndarray): Projected covariance matrices with shape (N, 4, 4).
+
+        Examples:
+            >>> kf = KalmanFilterXYWH()
+            >>> mean = np.random.rand(10, 8)
+            >>> covariance = np.tile(np.eye(8), (10, 1, 1))
+            >>> projected_mean, projected_covariance = kf.multi_project(mean, covariance)
+        """
+        w, h = mean[:, 2], mean[:, 3]
+        std = np.stack(
+            [
+                self._std_weight_position * w,
+                self._std_weight_position * h,
+                self._std_weight_position * w,
+                self._std_weight_position * h,
+            ],
+            axis=1,
+        )
+        innovation_cov = np.square(std)[:, None] * np.eye(4)
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
     def update(self, mean, covariance, measurement):
         """
         Run Kalman filter correction step.
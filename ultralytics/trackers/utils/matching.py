@@ -2,9 +2,12 @@
 
 import numpy as np
 import scipy
+import torch
+from scipy.sparse import coo_matrix, issparse
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial.distance import cdist
 
-from ultralytics.utils.metrics import batch_probiou, bbox_ioa
+from ultralytics.utils.metrics import batch_probiou, bbox_ioa, probiou
 
 try:
     import lap  # for linear_assignment
@@ -21,8 +24,13 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     """
     Perform linear assignment using either the scipy or lap.lapjv method.
 
+    A sparse cost matrix, e.g. from `iou_distance(..., sparse=True)`, holds only the candidate pairs and all other pairs
+    can not be assigned. It is split into connected components of the pairs within `thresh`, components of a single
+    pair are matched directly and only the others are solved, each on its own small dense matrix.
+
     Args:
-        cost_matrix (np.ndarray): The matrix containing cost values for assignments, with shape (N, M).
+        cost_matrix (np.ndarray | scipy.sparse.coo_matrix): The matrix containing cost values for assignments, with
+            shape (N, M).
         thresh (float): Threshold for considering an assignment valid.
         use_lap (bool): Use lap.lapjv for the assignment. If False, scipy.optimize.linear_sum_assignment is used.
 
@@ -36,6 +44,8 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
         >>> thresh = 5.0
         >>> matched_indices, unmatched_a, unmatched_b = linear_assignment(cost_matrix, thresh, use_lap=True)
     """
+    if issparse(cost_matrix):
+        return _sparse_linear_assignment(cost_matrix.tocoo(), thresh, use_lap)
     if cost_matrix.size == 0:
         return np.empty((0, 2), dtype=int), tuple(range(cost_matrix.shape[0])), tuple(range(cost_matrix.shape[1]))
 
@@ -61,16 +71,111 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     return matches, unmatched_a, unmatched_b
 
 
-def iou_distance(atracks: list, btracks: list) -> np.ndarray:
+def _sparse_linear_assignment(cost_matrix: coo_matrix, thresh: float, use_lap: bool = True) -> tuple:
+    """Solve a sparse linear assignment per connected component of its pairs within `thresh`."""
+    n, m = cost_matrix.shape
+    keep = cost_matrix.data <= thresh
+    rows, cols, costs = cost_matrix.row[keep], cost_matrix.col[keep], cost_matrix.data[keep]
+    graph = coo_matrix((np.ones(len(rows)), (rows, n + cols)), shape=(n + m, n + m))
+    _, labels = connected_components(graph, directed=False)
+    labels = labels[rows]
+    order = np.argsort(labels, kind="stable")
+    rows, cols, costs, labels = rows[order], cols[order], costs[order], labels[order]
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]]) if len(labels) else np.zeros(0, dtype=int)
+    sizes = np.diff(np.r_[starts, len(labels)])
+
+    single = starts[sizes == 1]  # a single candidate pair is always matched
+    matches = [np.stack([rows[single], cols[single]], 1)]
+    for i, j in zip(starts[sizes > 1], (starts + sizes)[sizes > 1]):
+        r, c = np.unique(rows[i:j]), np.unique(cols[i:j])
+        sub = np.full((len(r), len(c)), thresh + 1.0)  # pairs missing from the component can not be matched
+        sub[np.searchsorted(r, rows[i:j]), np.searchsorted(c, cols[i:j])] = costs[i:j]
+        sub_matches, _, _ = linear_assignment(sub, thresh, use_lap)
+        if len(sub_matches):
+            sub_matches = np.asarray(sub_matches)
+            matches.append(np.stack([r[sub_matches[:, 0]], c[sub_matches[:, 1]]], 1))
+    matches = np.concatenate(matches).astype(int)
+    matches = matches[np.argsort(matches[:, 0], kind="stable")]  # in row order, as from the dense solvers
+    unmatched_a = np.setdiff1d(np.arange(n), matches[:, 0])
+    unmatched_b = np.setdiff1d(np.arange(m), matches[:, 1])
+    return matches, unmatched_a, unmatched_b
+
+
+def candidate_pairs(atlbrs: np.ndarray, btlbrs: np.ndarray, max_cells: int = 64) -> tuple:
+    """
+    Find the pairs of intersecting boxes with a uniform grid, without comparing every box of `a` to every box of `b`.
+
+    Boxes are hashed into the grid cells they cover, with a cell size of the median box side, and pairs sharing a cell
+    are candidates. Boxes covering more than `max_cells` cells are paired with every box of the other set instead.
+
+    Args:
+        atlbrs (np.ndarray): Boxes 'a' in xyxy format with shape (N, 4).
+        btlbrs (np.ndarray): Boxes 'b' in xyxy format with shape (M, 4).
+        max_cells (int): Maximum number of grid cells of a box to hash, larger boxes are compared with all others.
+
+    Returns:
+        ia (np.ndarray): Indices into `atlbrs` of the intersecting pairs, with shape (K,).
+        ib (np.ndarray): Indices into `btlbrs` of the intersecting pairs, with shape (K,).
+
+    Examples:
+        >>> a = np.array([[0, 0, 10, 10], [100, 100, 110, 110]])
+        >>> b = np.array([[5, 5, 15, 15], [50, 50, 60, 60]])
+        >>> ia, ib = candidate_pairs(a, b)  # (array([0]), array([0]))
+    """
+    boxes = np.concatenate([atlbrs, btlbrs]).astype(np.float64)
+    valid = np.isfinite(boxes).all(1) & (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
+    if not valid.any():
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    cell = max(float(np.median(boxes[valid, 2:] - boxes[valid, :2])), 1e-3)
+    lo = np.floor(np.where(valid[:, None], boxes[:, :2], 0) / cell).astype(np.int64)
+    hi = np.floor(np.where(valid[:, None], boxes[:, 2:], 0) / cell).astype(np.int64)
+    origin = lo[valid].min(0)
+    lo, hi = lo - origin, hi - origin
+    span = hi - lo + 1
+    count = span.prod(1)
+    large = valid & (count > max_cells)
+    count[~valid | large] = 0
+
+    # Expand every box into one entry per covered cell, keyed by the cell index
+    box = np.repeat(np.arange(len(boxes)), count)
+    dy, dx = np.divmod(np.arange(len(box)) - np.repeat(np.cumsum(count) - count, count), span[box, 0])
+    key = (lo[box, 0] + dx) * (int(hi[valid, 1].max()) + 1) + lo[box, 1] + dy
+    n = len(atlbrs)
+    is_a = box < n
+    ka, ia, kb, ib = key[is_a], box[is_a], key[~is_a], box[~is_a] - n
+    order = np.argsort(kb, kind="stable")
+    kb, ib = kb[order], ib[order]
+    first, last = np.searchsorted(kb, ka, "left"), np.searchsorted(kb, ka, "right")
+    hits = last - first
+    pos = np.arange(hits.sum()) - np.repeat(np.cumsum(hits) - hits, hits) + np.repeat(first, hits)
+    pa, pb = [np.repeat(ia, hits)], [ib[pos]]
+
+    # Large boxes are compared with every valid box of the other set
+    large_a, large_b = np.flatnonzero(large[:n]), np.flatnonzero(large[n:])
+    valid_a, valid_b = np.flatnonzero(valid[:n]), np.flatnonzero(valid[n:])
+    pa += [np.repeat(large_a, len(valid_b)), np.tile(valid_a, len(large_b))]
+    pb += [np.tile(valid_b, len(large_a)), np.repeat(large_b, len(valid_a))]
+    pairs = np.unique(np.concatenate(pa) * len(btlbrs) + np.concatenate(pb))
+    ia, ib = np.divmod(pairs, len(btlbrs))
+    a, b = boxes[ia], boxes[n + ib]
+    overlap = (np.minimum(a[:, 2:], b[:, 2:]) > np.maximum(a[:, :2], b[:, :2])).all(1)
+    return ia[overlap], ib[overlap]
+
+
+def iou_distance(atracks: list, btracks: list, sparse: bool = False) -> np.ndarray:
     """
     Compute cost based on Intersection over Union (IoU) between tracks.
 
     Args:
-        atracks (List[STrack] | List[np.ndarray]): List of tracks 'a' or bounding boxes.
-        btracks (List[STrack] | List[np.ndarray]): List of tracks 'b' or bounding boxes.
+        atracks (List[STrack] | List[np.ndarray] | np.ndarray): List of tracks 'a' or bounding boxes.
+        btracks (List[STrack] | List[np.ndarray] | np.ndarray): List of tracks 'b' or bounding boxes.
+        sparse (bool): Return only the costs of spatially gated candidate pairs from `candidate_pairs()`, all other
+            pairs have a cost of 1. Oriented boxes are gated by their enclosing boxes, enlarged to keep the pairs with a
+            small probabilistic IoU.
 
     Returns:
-        (np.ndarray): Cost matrix computed based on IoU with shape (len(atracks), len(btracks)).
+        (np.ndarray | scipy.sparse.coo_matrix): Cost matrix computed based on IoU with shape
+            (len(atracks), len(btracks)).
 
     Examples:
         Compute IoU distance between two sets of tracks
@@ -78,13 +183,15 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
         >>> btracks = [np.array([5, 5, 15, 15]), np.array([25, 25, 35, 35])]
         >>> cost_matrix = iou_distance(atracks, btracks)
     """
-    if atracks and isinstance(atracks[0], np.ndarray) or btracks and isinstance(btracks[0], np.ndarray):
+    if len(atracks) and isinstance(atracks[0], np.ndarray) or len(btracks) and isinstance(btracks[0], np.ndarray):
         atlbrs = atracks
         btlbrs = btracks
     else:
         atlbrs = [track.xywha if track.angle is not None else track.xyxy for track in atracks]
         btlbrs = [track.xywha if track.angle is not None else track.xyxy for track in btracks]
 
+    if sparse:
+        return _sparse_iou_distance(atlbrs, btlbrs)
     ious = np.zeros((len(atlbrs), len(btlbrs)), dtype=np.float32)
     if len(atlbrs) and len(btlbrs):
         if len(atlbrs[0]) == 5 and len(btlbrs[0]) == 5:
@@ -101,7 +208,33 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     return 1 - ious  # cost matrix
 
 
-def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -> np.ndarray:
+def _sparse_iou_distance(atlbrs: list, btlbrs: list) -> coo_matrix:
+    """Compute IoU costs of the intersecting pairs of boxes only, returned as a sparse (N, M) matrix."""
+    shape = (len(atlbrs), len(btlbrs))
+    if not (len(atlbrs) and len(btlbrs)):
+        return coo_matrix(shape, dtype=np.float32)
+    a = np.ascontiguousarray(atlbrs, dtype=np.float32)
+    b = np.ascontiguousarray(btlbrs, dtype=np.float32)
+    if a.shape[1] == 5 and b.shape[1] == 5:  # oriented boxes, gated by enclosing boxes of twice their size
+        ia, ib = candidate_pairs(_enclosing_xyxy(a, 2.0), _enclosing_xyxy(b, 2.0))
+        ious = probiou(torch.from_numpy(a[ia]), torch.from_numpy(b[ib])).numpy().reshape(-1)
+    else:
+        ia, ib = candidate_pairs(a, b)
+        inter = np.prod(np.minimum(a[ia, 2:], b[ib, 2:]) - np.maximum(a[ia, :2], b[ib, :2]), axis=1)
+        area_a, area_b = np.prod(a[ia, 2:] - a[ia, :2], axis=1), np.prod(b[ib, 2:] - b[ib, :2], axis=1)
+        ious = inter / (area_a + area_b - inter + 1e-7)  # as bbox_ioa(iou=True)
+    return coo_matrix((1 - ious, (ia, ib)), shape=shape)
+
+
+def _enclosing_xyxy(xywhr: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """Return the axis-aligned xyxy boxes enclosing oriented xywhr boxes scaled by `scale` about their centers."""
+    cos, sin = np.abs(np.cos(xywhr[:, 4])), np.abs(np.sin(xywhr[:, 4]))
+    half_w = (xywhr[:, 2] * cos + xywhr[:, 3] * sin) * scale / 2
+    half_h = (xywhr[:, 2] * sin + xywhr[:, 3] * cos) * scale / 2
+    return np.stack([xywhr[:, 0] - half_w, xywhr[:, 1] - half_h, xywhr[:, 0] + half_w, xywhr[:, 1] + half_h], 1)
+
+
+def embedding_distance(tracks: list, detections: list, metric: str = "cosine", pairs: tuple = None) -> np.ndarray:
     """
     Compute distance between tracks and detections based on embeddings.
 
@@ -109,10 +242,12 @@ def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -
         tracks (List[STrack]): List of tracks, where each track contains embedding features.
         detections (List[BaseTrack]): List of detections, where each detection contains embedding features.
         metric (str): Metric for distance computation. Supported metrics include 'cosine', 'euclidean', etc.
+        pairs (Tuple[np.ndarray, np.ndarray] | None): Track and detection indices to compute the cosine distances of
+            only, e.g. the `row` and `col` of a sparse IoU cost matrix.
 
     Returns:
         (np.ndarray): Cost matrix computed based on embeddings with shape (N, M), where N is the number of tracks
-            and M is the number of detections.
+            and M is the number of detections, or the costs of `pairs` with shape (K,).
 
     Examples:
         Compute the embedding distance between tracks and detections using cosine metric
@@ -122,11 +257,15 @@ def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -
     """
     cost_matrix = np.zeros((len(tracks), len(detections)), dtype=np.float32)
     if cost_matrix.size == 0:
-        return cost_matrix
+        return cost_matrix if pairs is None else np.zeros(len(pairs[0]), dtype=np.float32)
     det_features = np.asarray([track.curr_feat for track in detections], dtype=np.float32)
-    # for i, track in enumerate(tracks):
-    # cost_matrix[i, :] = np.maximum(0.0, cdist(track.smooth_feat.reshape(1,-1), det_features, metric))
     track_features = np.asarray([track.smooth_feat for track in tracks], dtype=np.float32)
+    if metric == "cosine":  # one matmul of the L2-normalized features
+        det_features /= np.linalg.norm(det_features, axis=1, keepdims=True)
+        track_features /= np.linalg.norm(track_features, axis=1, keepdims=True)
+        if pairs is not None:
+            return np.maximum(0.0, 1.0 - np.einsum("ij,ij->i", track_features[pairs[0]], det_features[pairs[1]]))
+        return np.maximum(0.0, 1.0 - track_features @ det_features.T)
     cost_matrix = np.maximum(0.0, cdist(track_features, det_features, metric))  # Normalized features
     return cost_matrix
 
@@ -136,11 +275,12 @@ def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
     Fuse cost matrix with detection scores to produce a single similarity matrix.
 
     Args:
-        cost_matrix (np.ndarray): The matrix containing cost values for assignments, with shape (N, M).
+        cost_matrix (np.ndarray | scipy.sparse.coo_matrix): The matrix containing cost values for assignments, with
+            shape (N, M).
         detections (List[BaseTrack]): List of detections, each containing a score attribute.
 
     Returns:
-        (np.ndarray): Fused similarity matrix with shape (N, M).
+        (np.ndarray | scipy.sparse.coo_matrix): Fused similarity matrix with shape (N, M).
 
     Examples:
         Fuse a cost matrix with detection scores
@@ -150,6 +290,10 @@ def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
     """
     if cost_matrix.size == 0:
         return cost_matrix
+    if issparse(cost_matrix):  # fuse the stored pairs, the others keep a cost of 1
+        cost_matrix = cost_matrix.tocoo(copy=True)
+        cost_matrix.data = 1 - (1 - cost_matrix.data) * np.array([det.score for det in detections])[cost_matrix.col]
+        return cost_matrix
     iou_sim = 1 - cost_matrix
     det_scores = np.array([det.score for det in detections])
     det_scores = np.expand_dims(det_scores, axis=0).repeat(cost_matrix.shape[0], axis=0)
@@ -6,6 +6,7 @@ Usage:
     from ultralytics.utils.benchmarks import ProfileModels, benchmark
     ProfileModels(['yolo11n.yaml', 'yolov8s.yaml']).profile()
     benchmark(model='yolo11n.pt', imgsz=160)
+    benchmark_nms(batch_sizes=(1, 16, 64), candidates=(100, 1000))
 
 Format                  | `format=argument`         | Model
 ---                     | ---                       | ---
@@ -200,6 +201,60 @@ def benchmark(
     return df
 
 
+def benchmark_nms(batch_sizes=(1, 4, 16, 64), candidates=(10, 100, 1000, 8400), nc=80, device="cpu", n=10):
+    """
+    Benchmark batched non_max_suppression() against running it image by image.
+
+    Random predictions with the given number of candidate boxes above the confidence threshold are generated for each
+    image, and both paths are checked to return the same detections.
+
+    Args:
+        batch_sizes (Tuple[int]): Batch sizes to benchmark.
+        candidates (Tuple[int]): Number of candidate boxes per image.
+        nc (int): Number of classes.
+        device (str): Device to run the benchmark on, either 'cpu' or 'cuda'.
+        n (int): Number of timed runs per configuration.
+
+    Returns:
+        (pandas.DataFrame): Per-batch NMS time in milliseconds for both paths and the speedup for each configuration.
+
+    Examples:
+        >>> from ultralytics.utils.benchmarks import benchmark_nms
+        >>> benchmark_nms(batch_sizes=(1, 16), candidates=(100, 1000))
+    """
+    import pandas as pd  # scope for faster 'import ultralytics'
+
+    from ultralytics.utils.ops import non_max_suppression
+    from ultralytics.utils.torch_utils import time_sync
+
+    device = select_device(device, verbose=False)
+    rows = []
+    for bs in batch_sizes:
+        for k in candidates:
+            pred = torch.rand(bs, 4 + nc, 8400, device=device)
+            pred[:, :2] *= 640  # xy
+            pred[:, 2:4] *= 64  # wh
+            pred[:, 4:] *= 0.2  # below conf_thres=0.25
+            for p in pred:  # k candidates per image, unique scores so both paths break no ties differently
+                p[4, :k] = 0.25 + 0.75 * torch.randperm(k, device=device) / k
+            loop = lambda: [non_max_suppression(p[None], in_place=False)[0] for p in pred]  # noqa: E731
+            batched = lambda: non_max_suppression(pred, in_place=False)  # noqa: E731
+            assert all(torch.allclose(a, b) for a, b in zip(loop(), batched())), "batched NMS mismatch"
+
+            t = []
+            for f in loop, batched:
+                f()  # warmup
+                t0 = time_sync()
+                for _ in range(n):
+                    f()
+                t.append((time_sync() - t0) / n * 1e3)
+            rows.append([bs, k, round(t[0], 3), round(t[1], 3), round(t[0] / t[1], 2)])
+
+    df = pd.DataFrame(rows, columns=["Batch", "Candidates", "Loop (ms)", "Batched (ms)", "Speedup"])
+    LOGGER.info(f"\nNMS benchmark complete on {device}\n{df}\n")
+    return df
+
+
 class RF100Benchmark:
     """
     Benchmark YOLO model performance across various formats for speed and accuracy.
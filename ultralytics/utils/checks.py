@@ -8,6 +8,7 @@ import platform
 import re
 import shutil
 import subprocess
+import sys
 import time
 from importlib import metadata
 from pathlib import Path
@@ -701,6 +702,49 @@ def collect_system_info():
     return info_dict
 
 
+def check_import_time(statement="import ultralytics", top=15, verbose=True):
+    """
+    Profile the cold-start import time of a statement in a fresh interpreter with 'python -X importtime'.
+
+    Self times are summed per top-level package, and per subpackage for ultralytics, to show where startup time goes.
+
+    Args:
+        statement (str): Python statement to profile, e.g. 'from ultralytics import YOLO'.
+        top (int): Number of packages to report.
+        verbose (bool): Whether to log the report.
+
+    Returns:
+        (dict): Total wall time in seconds under 'total' and the import time in seconds of every package under
+            'packages', sorted by decreasing time.
+
+    Examples:
+        >>> from ultralytics.utils.checks import check_import_time
+        >>> profile = check_import_time("from ultralytics import YOLO")
+        >>> print(f"{profile['total']:.2f}s")
+    """
+    t0 = time.perf_counter()
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    ).stderr
+    total = time.perf_counter() - t0
+
+    packages = {}
+    for line in stderr.splitlines():  # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        parts = name.strip().split(".")
+        key = ".".join(parts[:2]) if parts[0] == "ultralytics" else parts[0]
+        packages[key] = packages.get(key, 0.0) + int(self_us) / 1e6
+    packages = dict(sorted(packages.items(), key=lambda x: -x[1]))
+
+    if verbose:
+        LOGGER.info(f"'{statement}' took {total:.2f}s in a new process, slowest packages:")
+        for k, v in list(packages.items())[:top]:
+            LOGGER.info(f"{k:<30}{v:>8.3f}s {v / total:>6.1%}")
+    return {"total": total, "packages": packages}
+
+
 def check_amp(model):
     """
     Checks the PyTorch Automatic Mixed Precision (AMP) functionality of a YOLO11 model.
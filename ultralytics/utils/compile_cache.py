@@ -0,0 +1,187 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from ultralytics import __version__
+from ultralytics.utils import LOGGER, USER_CONFIG_DIR
+
+_DIGESTS = {}  # (path, size, mtime_ns) -> sha256 of file contents, memoized for the life of the process
+
+
+def weights_digest(weights):
+    """
+    Return the sha256 hex digest of model weights.
+
+    Args:
+        weights (str | Path | torch.nn.Module): Weights file, directory of weights files (i.e. *_openvino_model) or an
+            in-memory model, hashed by its state_dict.
+
+    Returns:
+        (str): Hex digest of the contents, memoized for files per (path, size, modification time).
+    """
+    import torch  # scope for faster 'import ultralytics'
+
+    if isinstance(weights, torch.nn.Module):
+        h = hashlib.sha256(type(weights).__name__.encode())
+        for k, v in weights.state_dict().items():
+            h.update(f"{k}{v.dtype}{tuple(v.shape)}".encode())
+            h.update(v.detach().cpu().contiguous().view(-1).view(torch.uint8).numpy())
+        return h.hexdigest()
+    path = Path(weights)
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    h = hashlib.sha256()
+    for f in files:
+        stat = f.stat()
+        k = (str(f.resolve()), stat.st_size, stat.st_mtime_ns)
+        if k not in _DIGESTS:
+            fh = hashlib.sha256()
+            with open(f, "rb") as fp:
+                for chunk in iter(lambda: fp.read(1 << 20), b""):
+                    fh.update(chunk)
+            _DIGESTS[k] = fh.hexdigest()
+        h.update(_DIGESTS[k].encode())
+    return h.hexdigest()
+
+
+class CompileCache:
+    """
+    On-disk cache of compiled model artefacts shared across processes, with size-bounded LRU eviction.
+
+    Each entry is a directory named by a key derived from the weights contents and the load settings (backend, device,
+    batch, half and runtime versions). AutoBackend stores fused PyTorch models, ONNX Runtime optimized graphs and
+    OpenVINO compiled blobs in entries so later loads of the same weights skip fusing, graph optimization and
+    compilation. Entries are touched on every use and the least recently used ones are removed once the cache
+    exceeds max_size.
+
+    Attributes:
+        root (Path): Cache directory, one sub-directory per entry.
+        max_size (float): Size limit in GB, enforced whenever an entry is created.
+
+    Methods:
+        key: Build the entry key for a weights file and load settings.
+        entry: Return the directory of an entry, creating it on first use.
+        entries: List entries, most recently used first.
+        prune: Remove least recently used entries until the cache fits a size limit.
+        clear: Remove all entries.
+        info: Log a table of entries.
+
+    Examples:
+        >>> cache = CompileCache()
+        >>> key = cache.key("yolo11n.pt", backend="pt", device="cpu")
+        >>> f = cache.entry(key, weights="yolo11n.pt") / "model.pt"
+        >>> cache.prune(max_size=1.0)
+    """
+
+    def __init__(self, root=None, max_size=2.0):
+        """
+        Initialize the cache.
+
+        Args:
+            root (str | Path, optional): Cache directory. Defaults to $YOLO_COMPILE_CACHE_DIR or the 'compile_cache'
+                directory in the Ultralytics config directory.
+            max_size (float): Size limit in GB.
+        """
+        self.root = Path(root or os.getenv("YOLO_COMPILE_CACHE_DIR") or USER_CONFIG_DIR / "compile_cache")
+        self.max_size = max_size
+
+    @staticmethod
+    def key(weights, **fields):
+        """
+        Build the key of an entry.
+
+        Args:
+            weights (str | Path | torch.nn.Module): Weights file, directory or model, hashed by contents so renamed
+                or copied weights hit.
+            **fields (Any): Load settings the artefact depends on, i.e. backend, device, batch and half.
+
+        Returns:
+            (str): 16 character hex key.
+        """
+        fields = {"weights": weights_digest(weights), "ultralytics": __version__, **fields}
+        return hashlib.sha256(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+    def entry(self, key, **meta):
+        """
+        Return the directory of an entry and mark it as most recently used.
+
+        Args:
+            key (str): Entry key from key().
+            **meta (Any): Description stored in meta.json when the entry is created, shown by info().
+
+        Returns:
+            (Path): Entry directory.
+        """
+        path = self.root / key
+        if path.is_dir():
+            os.utime(path)
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+            (path / "meta.json").write_text(json.dumps({"created": time.time(), **meta}, default=str))
+            self.prune(keep=key)
+        return path
+
+    def entries(self):
+        """
+        List cache entries.
+
+        Returns:
+            (List[dict]): Entries with 'key', 'path', 'size' (bytes), 'used' (timestamp) and 'meta', most recently
+                used first.
+        """
+        out = []
+        for path in self.root.iterdir() if self.root.is_dir() else ():
+            if path.is_dir():
+                meta = path / "meta.json"
+                out.append(
+                    {
+                        "key": path.name,
+                        "path": path,
+                        "size": sum(f.stat().st_size for f in path.rglob("*") if f.is_file()),
+                        "used": path.stat().st_mtime,
+                        "meta": json.loads(meta.read_text()) if meta.is_file() else {},
+                    }
+                )
+        return sorted(out, key=lambda x: x["used"], reverse=True)
+
+    def prune(self, max_size=None, keep=None):
+        """
+        Remove least recently used entries until the cache is no larger than max_size.
+
+        Args:
+            max_size (float, optional): Size limit in GB, defaults to self.max_size. 0 removes every entry but keep.
+            keep (str, optional): Key of an entry that is never removed, i.e. the one being written.
+
+        Returns:
+            (int): Number of bytes removed.
+        """
+        limit = (self.max_size if max_size is None else max_size) * (1 << 30)
+        entries = self.entries()
+        total, removed = sum(e["size"] for e in entries), 0
+        for e in reversed(entries):  # least recently used first
+            if total - removed <= limit:
+                break
+            if e["key"] != keep:
+                shutil.rmtree(e["path"], ignore_errors=True)
+                removed += e["size"]
+        return removed
+
+    def clear(self):
+        """Remove all entries."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def info(self):
+        """Log a table of entries, most recently used first, and the total size."""
+        entries = self.entries()
+        s = f"{'key':<18}{'backend':<10}{'device':<14}{'size (MB)':>10}  {'last used':<20}weights\n"
+        for e in entries:
+            m = e["meta"]
+            used = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(e["used"]))
+            s += f"{e['key']:<18}{m.get('backend', ''):<10}{m.get('device', ''):<14}{e['size'] / 1e6:>10.1f}  "
+            s += f"{used:<20}{m.get('weights', '')}\n"
+        total = sum(e["size"] for e in entries)
+        LOGGER.info(f"{s}{len(entries)} entries, {total / 1e6:.1f} MB of {self.max_size:g} GB in {self.root}")
@@ -254,6 +254,23 @@ def non_max_suppression(
     time_limit = 2.0 + max_time_img * bs  # seconds to quit after
     multi_label &= nc > 1  # multiple labels per box (adds 0.5ms/img)
 
+    if bs > 1 and not rotated and not labels:
+        return _batched_nms(
+            prediction,
+            xc,
+            conf_thres,
+            iou_thres,
+            classes,
+            agnostic,
+            multi_label,
+            max_det,
+            nc,
+            max_nms,
+            max_wh,
+            in_place,
+            time_limit,
+        )
+
     prediction = prediction.transpose(-1, -2)  # shape(1,84,6300) to shape(1,6300,84)
     if not rotated:
         if in_place:
@@ -332,6 +349,202 @@ def non_max_suppression(
     return output
 
 
+def _batched_nms(
+    prediction,
+    xc,
+    conf_thres,
+    iou_thres,
+    classes,
+    agnostic,
+    multi_label,
+    max_det,
+    nc,
+    max_nms,
+    max_wh,
+    in_place,
+    time_limit,
+):
+    """
+    Run NMS for all images of a batch at once, returning the same per-image outputs as the loop in
+    non_max_suppression().
+
+    Candidates of every image are gathered, filtered and grouped by image in anchor order as one (n, 6 + nm) matrix,
+    so without in_place only candidate boxes are ever converted or copied. Like the loop, only images with more than
+    max_nms candidates are sorted and capped, which keeps the order that decides between boxes of equal confidence. On
+    CUDA the candidates are then suppressed by a single NMS call with boxes offset by image index as well as class, so
+    boxes of different images never overlap, and scores replaced by their stable rank so that ties are still resolved
+    by anchor order. Offsets are applied in float64, which keeps the coordinates exact where float32 offsets would lose
+    precision for large batches. Other devices run NMS image by image on the grouped candidates, since the CPU kernel
+    is quadratic in the number of boxes.
+
+    Args:
+        prediction (torch.Tensor): Predictions of shape (batch_size, 4 + nc + nm, num_boxes) with xywh boxes.
+        xc (torch.Tensor): Boolean candidate mask of shape (batch_size, num_boxes).
+        conf_thres (float): Confidence threshold.
+        iou_thres (float): IoU threshold.
+        classes (torch.Tensor | None): Class indices to keep.
+        agnostic (bool): Class-agnostic NMS.
+        multi_label (bool): Allow multiple labels per box.
+        max_det (int): Maximum number of detections per image.
+        nc (int): Number of classes.
+        max_nms (int): Maximum number of boxes per image into NMS.
+        max_wh (int): Maximum box width and height in pixels.
+        in_place (bool): Convert the boxes of the prediction tensor to xyxy in place.
+        time_limit (float): Seconds after which the remaining images are skipped with a warning.
+
+    Returns:
+        (List[torch.Tensor]): Per-image detections of shape (num_boxes, 6 + nm).
+    """
+    import torchvision  # scope for faster 'import ultralytics'
+
+    t = time.time()
+    bs, nm = prediction.shape[0], prediction.shape[1] - nc - 4
+    prediction = prediction.transpose(-1, -2)  # shape(bs,84,6300) to shape(bs,6300,84)
+    if in_place:
+        prediction[..., :4] = xywh2xyxy(prediction[..., :4])  # xywh to xyxy
+    b, k = xc.nonzero(as_tuple=True)  # image and anchor index of each candidate, grouped by image
+    box, cls, mask = prediction[b, k].split((4, nc, nm), 1)
+    if not in_place:
+        box = xywh2xyxy(box)
+    if multi_label:
+        i, j = torch.where(cls > conf_thres)
+        x = torch.cat((box[i], cls[i, j, None], j[:, None].float(), mask[i]), 1)
+    else:  # best class only
+        conf, j = cls.max(1, keepdim=True)
+        i = conf.view(-1) > conf_thres
+        x = torch.cat((box, conf, j.float(), mask), 1)[i]
+    b = b[i]
+    if classes is not None:
+        i = (x[:, 5:6] == classes).any(1)
+        x, b = x[i], b[i]
+
+    counts = torch.bincount(b, minlength=bs)
+    if counts.max() > max_nms:  # excess boxes, sort by confidence and remove them as in the loop
+        x = torch.cat([xi[xi[:, 4].argsort(descending=True)[:max_nms]] for xi in x.split(counts.tolist())])
+        counts = counts.clamp(max=max_nms)
+        b = torch.repeat_interleave(torch.arange(bs, device=x.device), counts)
+
+    if x.device.type != "cuda":
+        output = [torch.zeros((0, 6 + nm), device=x.device)] * bs
+        for xi, xk in enumerate(x.split(counts.tolist())):
+            if len(xk):
+                i = torchvision.ops.nms(xk[:, :4] + xk[:, 5:6] * (0 if agnostic else max_wh), xk[:, 4], iou_thres)
+                output[xi] = xk[i[:max_det]]
+            if (time.time() - t) > time_limit:
+                LOGGER.warning(f"WARNING ⚠️ NMS time limit {time_limit:.3f}s exceeded")
+                break  # time limit exceeded
+        return output
+
+    # Single NMS with boxes offset by image and class, ties ranked by anchor order
+    c = b * (1 if agnostic else nc) + (0 if agnostic else x[:, 5].long())
+    boxes = x[:, :4].double() + (c * max_wh).double()[:, None]
+    rank = torch.empty(len(x), dtype=torch.float64, device=x.device)
+    rank[x[:, 4].sort(descending=True, stable=True)[1]] = torch.arange(len(x), 0, -1, device=x.device).double()
+    i = torchvision.ops.nms(boxes, rank, iou_thres)  # kept boxes by descending confidence
+    i = i[b[i].sort(stable=True)[1]]  # grouped by image
+    counts = torch.bincount(b[i], minlength=bs)
+    ar = torch.arange(len(i), device=i.device)
+    i = i[ar - (counts.cumsum(0) - counts)[b[i]] < max_det]  # limit detections
+    if (time.time() - t) > time_limit:
+        LOGGER.warning(f"WARNING ⚠️ NMS time limit {time_limit:.3f}s exceeded")
+    return list(x[i].split(counts.clamp(max=max_det).tolist()))
+
+
+def nms_numpy(boxes, scores, iou_thres=0.45, max_det=0):
+    """
+    Greedy non-maximum suppression on NumPy arrays, matching torchvision.ops.nms().
+
+    Args:
+        boxes (np.ndarray): Boxes of shape (N, 4) in (x1, y1, x2, y2) format.
+        scores (np.ndarray): Scores of shape (N,).
+        iou_thres (float): Boxes overlapping a kept box with an IoU above this threshold are suppressed.
+        max_det (int): Stop once this many boxes are kept, 0 for no limit.
+
+    Returns:
+        (np.ndarray): Indices of the kept boxes, sorted by decreasing score.
+    """
+    x1, y1, x2, y2 = boxes.T
+    areas = (x2 - x1) * (y2 - y1)
+    order = np.argsort(-scores, kind="stable")
+    keep = []
+    while len(order) and len(keep) != max_det:
+        i, order = order[0], order[1:]
+        keep.append(i)
+        w = (np.minimum(x2[i], x2[order]) - np.maximum(x1[i], x1[order])).clip(0)
+        h = (np.minimum(y2[i], y2[order]) - np.maximum(y1[i], y1[order])).clip(0)
+        inter = w * h
+        with np.errstate(divide="ignore", invalid="ignore"):  # degenerate boxes are never suppressed, like torchvision
+            order = order[~(inter / (areas[i] + areas[order] - inter) > iou_thres)]
+    return np.array(keep, dtype=np.int64)
+
+
+def non_max_suppression_numpy(
+    prediction,
+    conf_thres=0.25,
+    iou_thres=0.45,
+    classes=None,
+    agnostic=False,
+    max_det=300,
+    nc=0,
+    max_nms=30000,
+    max_wh=7680,
+    end2end=False,
+):
+    """
+    Perform non-maximum suppression on NumPy model outputs without converting them to torch tensors.
+
+    Produces the same detections as non_max_suppression() with multi_label=False for axis-aligned boxes, so exported
+    models running on CPU backends (ONNX Runtime, OpenVINO, ...) can be post-processed entirely in NumPy.
+
+    Args:
+        prediction (np.ndarray): Array of shape (batch_size, 4 + num_classes + num_masks, num_boxes), or
+            (batch_size, num_boxes, 6) for end-to-end models.
+        conf_thres (float): The confidence threshold below which boxes will be filtered out.
+        iou_thres (float): The IoU threshold above which overlapping boxes are suppressed.
+        classes (List[int]): A list of class indices to consider. If None, all classes will be considered.
+        agnostic (bool): If True, all classes are considered as one during NMS.
+        max_det (int): The maximum number of boxes to keep per image.
+        nc (int): The number of classes output by the model. Any indices after this will be considered masks.
+        max_nms (int): The maximum number of boxes into NMS.
+        max_wh (int): The maximum box width and height in pixels.
+        end2end (bool): If the model doesn't require NMS.
+
+    Returns:
+        (List[np.ndarray]): A list of length batch_size, where each element is an array of shape
+            (num_boxes, 6 + num_masks) with columns (x1, y1, x2, y2, confidence, class, mask1, mask2, ...).
+
+    Examples:
+        >>> preds = np.random.rand(1, 84, 8400).astype(np.float32)
+        >>> dets = non_max_suppression_numpy(preds, conf_thres=0.5)
+    """
+    assert 0 <= conf_thres <= 1, f"Invalid Confidence threshold {conf_thres}, valid values are between 0.0 and 1.0"
+    assert 0 <= iou_thres <= 1, f"Invalid IoU {iou_thres}, valid values are between 0.0 and 1.0"
+    if isinstance(prediction, (list, tuple)):  # select only inference output
+        prediction = prediction[0]
+
+    if prediction.shape[-1] == 6 or end2end:  # end-to-end model (BNC, i.e. 1,300,6)
+        output = [pred[pred[:, 4] > conf_thres][:max_det] for pred in prediction]
+        if classes is not None:
+            output = [pred[np.isin(pred[:, 5], classes)] for pred in output]
+        return output
+
+    nc = nc or (prediction.shape[1] - 4)  # number of classes
+    output = []
+    for x in prediction:  # image inference, (4 + nc + nm, num_boxes)
+        j = x[4 : 4 + nc].argmax(0)  # best class only
+        conf = np.take_along_axis(x[4 : 4 + nc], j[None], 0)[0]
+        i = np.flatnonzero(conf > conf_thres)
+        x = x[:, i].T  # candidates only, (n, 4 + nc + nm)
+        x = np.concatenate((xywh2xyxy(x[:, :4]), conf[i, None], j[i, None].astype(x.dtype), x[:, 4 + nc :]), 1)
+        if classes is not None:
+            x = x[np.isin(x[:, 5], classes)]
+        if len(x) > max_nms:  # excess boxes
+            x = x[np.argsort(-x[:, 4], kind="stable")[:max_nms]]
+        boxes = x[:, :4] + x[:, 5:6] * (0 if agnostic else max_wh)  # boxes (offset by class)
+        output.append(x[nms_numpy(boxes, x[:, 4], iou_thres, max_det)])
+    return output
+
+
 def clip_boxes(boxes, shape):
     """
     Takes a list of bounding boxes and a shape (height, width) and clips the bounding boxes to the shape.
@@ -20,12 +20,18 @@ CONF_THRESHOLD = parser.getfloat('MODEL', 'conf_threshold')
 UDP_IP        = parser.get('NETWORK', 'udp_ip')
 UDP_PORT_RAW  = parser.getint('NETWORK', 'udp_port_raw')
 UDP_PORT_META = parser.getint('NETWORK', 'udp_port_meta')
+METADATA_VERSION = parser.getint('NETWORK', 'meta_version', fallback=0)
 
 # VIDEO
 FRAME_WIDTH   = parser.getint('VIDEO', 'frame_width')
 FRAME_HEIGHT  = parser.getint('VIDEO', 'frame_height')
 FRAMERATE     = parser.getint('VIDEO', 'framerate')
 
+# PIPELINE
+PIPELINE_MODE  = parser.get('PIPELINE', 'mode', fallback='serial')
+QUEUE_SIZE     = parser.getint('PIPELINE', 'queue_size', fallback=2)
+STATS_INTERVAL = parser.getfloat('PIPELINE', 'stats_interval', fallback=5.0)
+
 # DEBUG
 DEBUG       = parser.getboolean('DEBUG', 'debug', fallback=False)
 DEBUG_DIR   = parser.get('DEBUG', 'debug_dir', fallback='debug_frames')